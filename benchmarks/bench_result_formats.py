@@ -0,0 +1,113 @@
+"""Compare result serialization cost per format on a synthetic numeric result set (no database needed).
+
+Run from the repo root:  python benchmarks/bench_result_formats.py [--rows N] [--columns N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mcp_server._dataclasses.pooled_connection import PooledConnection  # noqa: E402
+from mcp_server._dataclasses.query_result import ColumnMeta, QueryResult  # noqa: E402
+from mcp_server.connections.row_stream import RowStream                 # noqa: E402
+from mcp_server.tools.tool_execute_query import read_page               # noqa: E402
+
+
+class _Cursor:
+    """Just enough DB-API cursor to drive a RowStream from in-memory tuples."""
+
+    def __init__(self, rows: list[tuple], columns: int):
+        self.description = [(f"metric_{i}", float, None, None, None, None, True) for i in range(columns)]
+        self.rowcount    = -1
+        self._rows       = rows
+        self._position   = 0
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        chunk           = self._rows[self._position:self._position + size]
+        self._position += len(chunk)
+
+        return chunk
+
+    def close(self) -> None:
+        pass
+
+
+class _Pool:
+    def release(self, pooled, discard: bool = False) -> None:
+        pass
+
+
+class _Conn:
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+def _run(rows: list[tuple], columns: int, result_format: str, arrow_types: list) -> tuple[float, int]:
+    """Read the whole result through RowStream and serialize it. Returns (ms, payload bytes)."""
+
+    start  = time.perf_counter()
+    cursor = _Cursor(rows, columns)
+    stream = RowStream(
+        pool        = _Pool(),
+        pooled      = PooledConnection(conn=_Conn()),
+        cursor      = cursor,
+        columns     = [ColumnMeta(name=d[0], type="float") for d in cursor.description],
+        batch_size  = 5000,
+        converters  = [None] * columns,
+        abandon     = lambda c: True,
+        arrow_types = lambda: arrow_types,
+    )
+
+    with stream:
+        page_rows, table = read_page(stream, None, result_format)
+
+    result = QueryResult(
+        success    = True,
+        connection = "bench",
+        database   = "bench",
+        columns    = stream.columns,
+        rows       = page_rows,
+        row_count  = len(rows),
+        arrow      = table,
+    )
+    payload = result.to_json(result_format)
+
+    return (time.perf_counter() - start) * 1000, len(payload)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--columns", type=int, default=10)
+    args   = parser.parse_args()
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        print("pyarrow is not installed; the arrow format cannot be measured.")
+
+        return 1
+
+    rng  = random.Random(42)
+    rows = [tuple(rng.random() for _ in range(args.columns)) for _ in range(args.rows)]
+
+    print(f"{args.rows} rows x {args.columns} float columns\n")
+    print(f"{'format':>9}  {'ms':>9}  {'payload MB':>11}")
+
+    for result_format in QueryResult.RESULT_FORMATS:
+        elapsed, size = _run(rows, args.columns, result_format, [pa.float64()] * args.columns)
+
+        print(f"{result_format:>9}  {elapsed:>9.1f}  {size / 1e6:>11.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
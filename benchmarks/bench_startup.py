@@ -0,0 +1,88 @@
+"""Measure server cold start with python -X importtime and flag heavy imports that should be lazy.
+
+Run from the repo root:  python benchmarks/bench_startup.py [--repeat N] [--top N]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Loaded on first use of a driver or of the sqlparse fallback, never at start-up.
+DEFERRED = ["pyodbc", "mysql.connector", "sqlparse"]
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def _run(module: str) -> tuple[float, list[tuple[int, int, int, str]]]:
+    """Import `module` in a fresh interpreter. Returns (wall ms, [(self us, cumulative us, depth, name)])."""
+
+    env   = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+    start = time.perf_counter()
+    proc  = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env            = env,
+        capture_output = True,
+        text           = True,
+    )
+    wall  = (time.perf_counter() - start) * 1000
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = []
+
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+
+        if match:
+            entries.append((int(match.group(1)), int(match.group(2)), (len(match.group(3)) - 1) // 2, match.group(4)))
+
+    return wall, entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="mcp_server.server")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args   = parser.parse_args()
+
+    runs    = [_run(args.module) for _ in range(max(1, args.repeat))]
+    walls   = [wall for wall, _ in runs]
+    entries = runs[-1][1]
+    loaded  = {name for _, _, _, name in entries}
+    total   = sum(self_us for self_us, _, _, _ in entries)
+
+    print(f"process start + import {args.module}: median {statistics.median(walls):.1f} ms, "
+          f"min {min(walls):.1f} ms over {len(walls)} run(s)")
+    print(f"import time (last run): {total / 1000:.1f} ms across {len(entries)} module(s)\n")
+
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module (top-level imports only)")
+
+    for self_us, cumulative_us, _, name in sorted(
+            (e for e in entries if e[2] == 0), key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {name}")
+
+    ours = sorted((e for e in entries if e[3].startswith("mcp_server")), key=lambda e: e[0], reverse=True)
+
+    print(f"\n{'self ms':>14}  mcp_server module")
+
+    for self_us, _, _, name in ours[:args.top]:
+        print(f"{self_us / 1000:>14.1f}  {name}")
+
+    eager = [name for name in DEFERRED if name in loaded]
+
+    print(f"\nDeferred modules imported at start-up: {', '.join(eager) if eager else 'none'}")
+
+    return 1 if eager else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
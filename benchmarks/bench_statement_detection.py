@@ -0,0 +1,140 @@
+"""Compare QueryValidator statement classification: lexer fast path vs sqlparse.
+
+Run from the repo root:  python benchmarks/bench_statement_detection.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mcp_server.security import sql_lexer                      # noqa: E402
+from mcp_server.security.query_validator import QueryValidator  # noqa: E402
+
+
+def _reporting_query(columns: int, predicates: int) -> str:
+    """A generated wide reporting query like the ones agents build."""
+
+    select = ",\n    ".join(
+        f"SUM(CASE WHEN f.status = 'S{i % 7}' THEN f.amount_{i % 11} ELSE 0 END) AS metric_{i}"
+        for i in range(columns)
+    )
+    where  = "\n  AND ".join(f"(f.dim_{i % 13} IN ('a;b', 'c''d', 'e') OR f.flag_{i % 5} = {i})" for i in range(predicates))
+
+    return (
+        "-- generated report; do not edit\n"
+        "WITH recent AS (\n"
+        "    SELECT * FROM dbo.facts WHERE loaded_at > DATEADD(day, -30, GETDATE())\n"
+        ")\n"
+        f"SELECT d.region,\n    {select}\n"
+        "FROM recent f\n"
+        "JOIN [dbo].[Dim Region] d ON d.id = f.region_id\n"
+        f"WHERE {where}\n"
+        "GROUP BY d.region\n"
+        "ORDER BY d.region;"
+    )
+
+
+CORPUS = [
+    "SELECT * FROM dbo.Customers WHERE CustomerId = 42",
+    "select top 100 o.OrderId, o.Total from Orders o order by o.CreatedAt desc",
+    "/* dashboard */ SELECT COUNT(*) FROM `analytics`.`events` WHERE name = 'signup;done'",
+    "-- header\nSELECT [Order Id], [Ship;To] FROM [Sales].[Order Lines]",
+    "WITH a AS (SELECT 1 AS x), b AS (SELECT x FROM a) SELECT * FROM b",
+    "WITH RECURSIVE t(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM t WHERE n < 10) SELECT n FROM t",
+    "WITH stale AS (SELECT id FROM jobs WHERE finished_at < '2024-01-01') DELETE FROM jobs WHERE id IN (SELECT id FROM stale)",
+    "INSERT INTO audit (event, detail) VALUES ('login', 'it''s fine; really')",
+    "UPDATE accounts SET balance = balance - 10 WHERE id = 7;",
+    "DELETE FROM sessions WHERE expires_at < NOW()",
+    "MERGE INTO target t USING source s ON t.id = s.id WHEN MATCHED THEN UPDATE SET t.v = s.v;",
+    "CREATE TABLE staging.load_2024 (id INT PRIMARY KEY, payload NVARCHAR(MAX))",
+    "ALTER TABLE dbo.Users ADD LastSeen DATETIME2 NULL",
+    "DROP TABLE IF EXISTS tmp_results",
+    "TRUNCATE TABLE logs",
+    "SELECT 1; DROP TABLE users",
+    "SELECT 'a;b'; SELECT \"c;d\"",
+    "SELECT 1;;",
+    "SELECT 1; -- trailing note",
+    "SELECT * FROM #tmp WHERE id > 3",
+    "SELECT 'it\\'s' FROM dual",
+    "EXEC sp_who2",
+    "(SELECT 1) UNION (SELECT 2)",
+    "CREATE PROCEDURE p AS BEGIN SELECT 1; SELECT 2; END",
+    "CREATE PROCEDURE p AS DECLARE @n INT; SET @n = 1; SELECT @n",
+    "SELECT 1\nGO\nDROP TABLE x",
+    "SELECT * FROM t\nGO 2\nSELECT 2",
+    "SELECT [GO] FROM t",
+    "selecté 1",
+    "SELECT naïve, café FROM menu",
+    "SELECT N'café' FROM menu",
+    _reporting_query(60, 40),
+    _reporting_query(400, 300),
+]
+
+
+def _sqlparse_path(validator: QueryValidator, sql: str) -> tuple[int, str]:
+    """Classification without the fast path (the pre-lexer behaviour)."""
+
+    import sqlparse
+
+    # sqlparse gives up on very long statements; those only work through the fast path.
+    try:
+        parsed = sqlparse.parse(sql.strip())
+    except sqlparse.exceptions.SQLParseError:
+
+        return 0, "ERROR"
+
+    real   = [s for s in parsed if s.ttype is not sqlparse.tokens.Whitespace and str(s).strip()]
+
+    if not parsed:
+
+        return 0, "UNKNOWN"
+
+    return len(real), (parsed[0].get_type() or "").upper() or validator._fallback_detect(sql)
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        fn()
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args   = parser.parse_args()
+
+    validator  = QueryValidator()
+    mismatches = 0
+
+    print(f"{'size':>8}  {'fast':>6}  {'sqlparse ms':>12}  {'lexer ms':>9}  {'speedup':>8}  query")
+
+    for sql in CORPUS:
+        expected = _sqlparse_path(validator, sql)
+        fast     = sql_lexer.classify(sql)
+
+        if fast is not None and expected[1] != "ERROR" and fast != expected:
+            mismatches += 1
+            print(f"MISMATCH {fast} != {expected}: {sql[:60]!r}")
+
+        slow_ms = _time(lambda: _sqlparse_path(validator, sql), args.repeat)
+        lex_ms  = _time(lambda: sql_lexer.classify(sql), args.repeat)
+        label   = " ".join(sql.split())[:50]
+
+        print(
+            f"{len(sql):>8}  {'yes' if fast else 'no':>6}  {slow_ms:>12.3f}  {lex_ms:>9.3f}  "
+            f"{slow_ms / lex_ms if lex_ms else 0:>7.0f}x  {label}"
+        )
+
+    print(f"\n{mismatches} mismatch(es) between the fast path and sqlparse.")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Admission:
+    """How one tool call got through its connection's scheduler."""
+
+    lane:         str
+    wait_ms:      float        = 0.0
+    queue_depth:  int          = 0       # calls already waiting when this one arrived
+    throttled_ms: float | None = None    # set when the rate limiter admitted the call before it queued
+
+    def to_dict(self) -> dict:
+        return {
+            "lane":        self.lane,
+            "wait_ms":     round(self.wait_ms, 2),
+            "queue_depth": self.queue_depth,
+        }
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BatchConfig:
+    """Limits for execute_batch."""
+
+    max_parallelism: int = 8
+    max_items:       int = 100
+
+    @staticmethod
+    def from_dict(data: dict) -> "BatchConfig":
+        """Build BatchConfig from the optional top-level `batch` block."""
+
+        return BatchConfig(
+            max_parallelism = max(1, int(data.get("max_parallelism", 8))),
+            max_items       = max(1, int(data.get("max_items", 100))),
+        )
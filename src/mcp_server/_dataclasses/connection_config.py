@@ -1,20 +1,50 @@
 from dataclasses import dataclass, field
 
+from mcp_server._dataclasses.health_config import HealthConfig
+from mcp_server._dataclasses.pool_config import PoolConfig
+from mcp_server._dataclasses.preflight_config import PreflightConfig
+from mcp_server._dataclasses.result_cache_config import ResultCacheConfig
+from mcp_server._dataclasses.scheduler_config import SchedulerConfig
+
 
 @dataclass
 class ConnectionConfig:
     """Named database connection configuration."""
 
-    name:                str
-    driver:              str
-    host:                str
-    port:                int
-    database:            str
-    username:            str            = ""
-    password:            str            = ""
-    trusted_connection:  bool           = False
-    driver_name:         str            = "ODBC Driver 17 for SQL Server"
-    extra:               dict           = field(default_factory=dict)
+    name:                  str
+    driver:                str
+    host:                  str
+    port:                  int
+    database:              str
+    username:              str               = ""
+    password:              str               = ""
+    trusted_connection:    bool              = False
+    driver_name:           str               = "ODBC Driver 17 for SQL Server"
+    fetch_batch_size:      int               = 1000
+    insert_batch_size:     int               = 1000
+    max_result_rows:       int               = 0
+    query_timeout_seconds: float             = 0.0
+    binary_encoding:       str               = "base64"
+    pool:                  PoolConfig        = field(default_factory=PoolConfig)
+    health:                HealthConfig      = field(default_factory=HealthConfig)
+    preflight:             PreflightConfig   = field(default_factory=PreflightConfig)
+    scheduler:             SchedulerConfig   = field(default_factory=SchedulerConfig)
+    result_cache:          ResultCacheConfig = field(default_factory=ResultCacheConfig)
+    extra:                 dict              = field(default_factory=dict)
+
+    def row_limit(self, max_rows: int | None = None) -> int | None:
+        """Effective row cap for one call: the smaller of max_rows and max_result_rows."""
+
+        limits = [n for n in (max_rows, self.max_result_rows) if n and n > 0]
+
+        return min(limits) if limits else None
+
+    def query_timeout(self, timeout_seconds: float | None = None) -> float | None:
+        """Effective statement timeout for one call: the smaller of the call's and the connection's."""
+
+        limits = [t for t in (timeout_seconds, self.query_timeout_seconds) if t and t > 0]
+
+        return min(limits) if limits else None
 
     @staticmethod
     def from_dict(name: str, data: dict) -> "ConnectionConfig":
@@ -23,18 +53,30 @@ class ConnectionConfig:
         known_keys = {
             "driver", "host", "port", "database",
             "username", "password", "trusted_connection", "driver_name",
+            "fetch_batch_size", "insert_batch_size", "max_result_rows", "query_timeout_seconds",
+            "binary_encoding", "pool", "health", "preflight", "scheduler", "result_cache",
         }
         extra = {k: v for k, v in data.items() if k not in known_keys}
 
         return ConnectionConfig(
-            name               = name,
-            driver             = data["driver"],
-            host               = data["host"],
-            port               = data.get("port", 1433 if data["driver"] == "sql_server" else 3306),
-            database           = data.get("database", ""),
-            username           = data.get("username", ""),
-            password           = data.get("password", ""),
-            trusted_connection = data.get("trusted_connection", False),
-            driver_name        = data.get("driver_name", "ODBC Driver 17 for SQL Server"),
-            extra              = extra,
+            name                  = name,
+            driver                = data["driver"],
+            host                  = data["host"],
+            port                  = data.get("port", 1433 if data["driver"] == "sql_server" else 3306),
+            database              = data.get("database", ""),
+            username              = data.get("username", ""),
+            password              = data.get("password", ""),
+            trusted_connection    = data.get("trusted_connection", False),
+            driver_name           = data.get("driver_name", "ODBC Driver 17 for SQL Server"),
+            fetch_batch_size      = int(data.get("fetch_batch_size", 1000)),
+            insert_batch_size     = int(data.get("insert_batch_size", 1000)),
+            max_result_rows       = int(data.get("max_result_rows", 0)),
+            query_timeout_seconds = float(data.get("query_timeout_seconds", 0)),
+            binary_encoding       = data.get("binary_encoding", "base64"),
+            pool                  = PoolConfig.from_dict(data.get("pool", {})),
+            health                = HealthConfig.from_dict(data.get("health", {})),
+            preflight             = PreflightConfig.from_dict(data.get("preflight", {})),
+            scheduler             = SchedulerConfig.from_dict(data.get("scheduler", {})),
+            result_cache          = ResultCacheConfig.from_dict(data.get("result_cache", {})),
+            extra                 = extra,
         )
@@ -0,0 +1,59 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class ConnectionHealth:
+    """What an adapter last observed about its server, reported by connection_status."""
+
+    last_ok_at:           float | None = None      # wall-clock time of the last successful open or ping
+    last_error:           str | None   = None
+    last_error_at:        float | None = None
+    last_ping_ms:         float | None = None
+    consecutive_failures: int          = 0
+    reconnects:           int          = 0         # connections opened after a failure
+
+    @property
+    def status(self) -> str:
+        if self.consecutive_failures:
+
+            return "failing"
+
+        return "healthy" if self.last_ok_at is not None else "unknown"
+
+    def record_success(self, ping_ms: float | None = None) -> None:
+        self.last_ok_at           = time.time()
+        self.consecutive_failures = 0
+
+        if ping_ms is not None:
+            self.last_ping_ms = ping_ms
+
+    def record_reconnect(self) -> None:
+        if self.consecutive_failures:
+            self.reconnects += 1
+
+        self.record_success()
+
+    def record_failure(self, error: BaseException) -> None:
+        self.last_error            = f"{type(error).__name__}: {error}"
+        self.last_error_at         = time.time()
+        self.consecutive_failures += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "status":               self.status,
+            "last_ok_at":           _iso(self.last_ok_at),
+            "last_error":           self.last_error,
+            "last_error_at":        _iso(self.last_error_at),
+            "last_ping_ms":         None if self.last_ping_ms is None else round(self.last_ping_ms, 2),
+            "consecutive_failures": self.consecutive_failures,
+            "reconnects":           self.reconnects,
+        }
+
+
+def _iso(timestamp: float | None) -> str | None:
+    if timestamp is None:
+
+        return None
+
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
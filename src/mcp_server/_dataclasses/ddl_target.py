@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DdlTarget:
+    """The object a CREATE/ALTER/DROP statement changes."""
+
+    action:      str
+    object_type: str
+    name:        str | None = None
+    schema:      str | None = None
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class HealthConfig:
+    """Liveness checks, reconnect backoff and read retries for one connection."""
+
+    ping_interval_seconds:         float | None = 30.0     # None disables pings; 0 pings on every checkout
+    reconnect_attempts:            int          = 3
+    reconnect_backoff_seconds:     float        = 0.5
+    reconnect_max_backoff_seconds: float        = 10.0
+    read_retries:                  int          = 2
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (0-based): exponential, capped."""
+
+        return min(self.reconnect_backoff_seconds * 2 ** attempt, self.reconnect_max_backoff_seconds)
+
+    @staticmethod
+    def from_dict(data: dict) -> "HealthConfig":
+        """Build HealthConfig from the optional `health` block of a connection entry."""
+
+        interval = data.get("ping_interval_seconds", 30.0)
+
+        return HealthConfig(
+            ping_interval_seconds         = None if interval is None else max(0.0, float(interval)),
+            reconnect_attempts            = max(1, int(data.get("reconnect_attempts", 3))),
+            reconnect_backoff_seconds     = max(0.0, float(data.get("reconnect_backoff_seconds", 0.5))),
+            reconnect_max_backoff_seconds = max(0.0, float(data.get("reconnect_max_backoff_seconds", 10.0))),
+            read_retries                  = max(0, int(data.get("read_retries", 2))),
+        )
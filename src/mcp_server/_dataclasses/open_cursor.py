@@ -0,0 +1,17 @@
+import time
+from dataclasses import dataclass, field
+
+from mcp_server.connections.row_stream import RowStream
+
+
+@dataclass
+class OpenCursor:
+    """A held-open result stream awaiting its next page."""
+
+    connection:     str
+    database:       str
+    statement_type: str
+    page_size:      int
+    result_format:  str
+    stream:         RowStream
+    last_access:    float = field(default_factory=time.monotonic)
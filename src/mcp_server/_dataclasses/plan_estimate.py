@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PlanEstimate:
+    """Optimizer estimates for a statement, read from its plan without running it."""
+
+    estimated_rows: float | None = None      # rows the statement is expected to return
+    estimated_cost: float | None = None      # optimizer cost units; only comparable within one server
+    operators:      list[str]    = field(default_factory=list)
+    full_scans:     list[str]    = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "estimated_rows": None if self.estimated_rows is None else round(self.estimated_rows, 2),
+            "estimated_cost": None if self.estimated_cost is None else round(self.estimated_cost, 4),
+            "operators":      self.operators,
+            "full_scans":     self.full_scans,
+        }
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PoolConfig:
+    """Sizing and lifetime limits for a per-connection pool."""
+
+    min_size:                 int   = 1
+    max_size:                 int   = 5
+    checkout_timeout_seconds: float = 30.0
+    idle_timeout_seconds:     float = 300.0
+    max_lifetime_seconds:     float = 1800.0
+
+    @staticmethod
+    def from_dict(data: dict) -> "PoolConfig":
+        """Build PoolConfig from the optional `pool` block of a connection entry."""
+
+        min_size = int(data.get("min_size", 1))
+        max_size = int(data.get("max_size", 5))
+
+        return PoolConfig(
+            min_size                 = max(0, min_size),
+            max_size                 = max(1, max_size, min_size),
+            checkout_timeout_seconds = float(data.get("checkout_timeout_seconds", 30.0)),
+            idle_timeout_seconds     = float(data.get("idle_timeout_seconds", 300.0)),
+            max_lifetime_seconds     = float(data.get("max_lifetime_seconds", 1800.0)),
+        )
@@ -0,0 +1,20 @@
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PooledConnection:
+    """A driver connection owned by a ConnectionPool."""
+
+    conn:             object
+    created_at:       float         = field(default_factory=time.monotonic)
+    last_used_at:     float         = field(default_factory=time.monotonic)
+    statement_cursor: object | None = None      # kept open so parameterized statements stay prepared
+    current_database: str | None    = None      # database the session is on, as far as we know
+    query_timeout:    float | None  = None      # statement timeout last applied to the session
+
+    def age(self, now: float) -> float:
+        return now - self.created_at
+
+    def idle_for(self, now: float) -> float:
+        return now - self.last_used_at
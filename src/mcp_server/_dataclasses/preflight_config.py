@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from mcp_server._dataclasses.plan_estimate import PlanEstimate
+
+
+@dataclass
+class PreflightConfig:
+    """Opt-in plan check before execute_query runs a SELECT."""
+
+    PREFLIGHT_ACTIONS = ("refuse", "paginate")
+
+    enabled:            bool  = False
+    max_estimated_rows: float = 0.0         # 0 = no row limit
+    max_estimated_cost: float = 0.0         # 0 = no cost limit
+    action:             str   = "refuse"    # what happens when max_estimated_rows is exceeded
+    page_rows:          int   = 1000        # page size forced by the paginate action
+
+    def rows_exceeded(self, estimate: PlanEstimate) -> bool:
+        return bool(self.max_estimated_rows and (estimate.estimated_rows or 0) > self.max_estimated_rows)
+
+    def cost_exceeded(self, estimate: PlanEstimate) -> bool:
+        return bool(self.max_estimated_cost and (estimate.estimated_cost or 0) > self.max_estimated_cost)
+
+    @staticmethod
+    def from_dict(data: dict) -> "PreflightConfig":
+        """Build PreflightConfig from the optional `preflight` block of a connection entry."""
+
+        action = str(data.get("action", "refuse")).lower()
+
+        if action not in PreflightConfig.PREFLIGHT_ACTIONS:
+            raise ValueError(f"preflight.action must be one of {list(PreflightConfig.PREFLIGHT_ACTIONS)}, got '{action}'.")
+
+        return PreflightConfig(
+            enabled            = bool(data.get("enabled", False)),
+            max_estimated_rows = max(0.0, float(data.get("max_estimated_rows", 0))),
+            max_estimated_cost = max(0.0, float(data.get("max_estimated_cost", 0))),
+            action             = action,
+            page_rows          = max(1, int(data.get("page_rows", 1000))),
+        )
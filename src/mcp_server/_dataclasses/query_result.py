@@ -1,5 +1,10 @@
+import base64
+import json
 from dataclasses import dataclass, field
 
+from mcp_server._dataclasses.admission import Admission
+from mcp_server.connections.arrow_batch_builder import ArrowBatchBuilder, require_pyarrow
+
 
 @dataclass
 class ColumnMeta:
@@ -14,27 +19,117 @@ class ColumnMeta:
 class QueryResult:
     """Structured result from a SQL execution."""
 
+    RESULT_FORMATS = ("rows", "compact", "columnar", "arrow")
+
     success:           bool
     connection:        str
     database:          str
     columns:           list[ColumnMeta]   = field(default_factory=list)
-    rows:              list[dict]         = field(default_factory=list)
+    rows:              list[dict | list]  = field(default_factory=list)     # dicts, or value lists in column order
     row_count:         int                = 0
     execution_time_ms: float              = 0.0
     message:           str                = ""
     statement_type:    str                = ""
+    truncated:         bool               = False
+    next_cursor:       str | None         = None
+    cached:            bool               = False
+    cache_age_seconds: float | None       = None
+    request_id:        str | None         = None
+    arrow:             object | None      = None     # pyarrow.Table read with result_format "arrow"
+    preflight:         dict | None        = None     # plan estimate checked before running, when enabled
+    queue:             Admission | None   = None     # scheduler lane, wait and queue depth for this call
 
-    def to_dict(self) -> dict:
-        """Serialize to JSON-friendly dict."""
+    def to_dict(self, result_format: str = "rows") -> dict:
+        """Serialize to JSON-friendly dict: rows as objects, compact arrays, or columnar arrays."""
 
-        return {
+        body = {
             "success":           self.success,
             "connection":        self.connection,
             "database":          self.database,
             "columns":           [{"name": c.name, "type": c.type, "nullable": c.nullable} for c in self.columns],
-            "rows":              self.rows,
+        }
+
+        if result_format == "arrow":
+            body["encoding"] = "arrow-ipc-stream+base64"
+            body["data"]     = self._arrow_ipc()
+        elif result_format == "columnar":
+            lists        = self._row_lists()
+            body["data"] = [list(col) for col in zip(*lists)] if lists else [[] for _ in self.columns]
+        elif result_format == "compact":
+            body["rows"] = self._row_lists()
+        else:
+            body["rows"] = self._row_dicts()
+
+        body.update({
             "row_count":         self.row_count,
             "execution_time_ms": round(self.execution_time_ms, 2),
             "message":           self.message,
             "statement_type":    self.statement_type,
-        }
+            "truncated":         self.truncated,
+            "next_cursor":       self.next_cursor,
+            "cached":            self.cached,
+            "cache_age_seconds": round(self.cache_age_seconds, 2) if self.cache_age_seconds is not None else None,
+            "request_id":        self.request_id,
+            "preflight":         self.preflight,
+            "queue":             self.queue.to_dict() if self.queue is not None else None,
+            "format":            result_format,
+        })
+
+        return body
+
+    def to_json(self, result_format: str = "rows") -> str:
+        """Serialize to JSON; only the default rows format is pretty-printed."""
+
+        self.validate_format(result_format)
+
+        if result_format == "rows":
+
+            return json.dumps(self.to_dict(result_format), indent=2, default=str)
+
+        return json.dumps(self.to_dict(result_format), separators=(",", ":"), default=str)
+
+    @classmethod
+    def validate_format(cls, result_format: str) -> None:
+        """Raise ValueError for an unknown result_format."""
+
+        if result_format not in cls.RESULT_FORMATS:
+            raise ValueError(f"Unknown result_format '{result_format}'. Use one of {list(cls.RESULT_FORMATS)}.")
+
+    def _arrow_ipc(self) -> str:
+        """The result as a base64 Arrow IPC stream; rows read as Python values are converted here."""
+
+        table = self.arrow
+
+        if table is None:
+            builder = ArrowBatchBuilder([c.name for c in self.columns])
+            table   = builder.pa.Table.from_batches([builder.build(self._row_lists())])
+
+        pa   = require_pyarrow()
+        sink = pa.BufferOutputStream()
+
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        return base64.b64encode(sink.getvalue()).decode("ascii")
+
+    def _row_lists(self) -> list[list]:
+        if not self.rows and self.arrow is not None:
+
+            return [list(row) for row in zip(*(column.to_pylist() for column in self.arrow.columns))]
+
+        if not self.rows or isinstance(self.rows[0], list):
+
+            return self.rows
+
+        names = [c.name for c in self.columns]
+
+        return [[row.get(n) for n in names] for row in self.rows]
+
+    def _row_dicts(self) -> list[dict]:
+        if self.rows and isinstance(self.rows[0], dict):
+
+            return self.rows
+
+        names = [c.name for c in self.columns]
+
+        return [dict(zip(names, row)) for row in self._row_lists()]
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RateLimitConfig:
+    """Load limits for one connection, or for one tool on it. 0 disables a limit."""
+
+    queries_per_second:   float = 0.0
+    burst:                int   = 0          # calls allowed back to back; 0 = one second's worth
+    max_concurrent_rows:  int   = 0          # rows all in-flight fetches may hold at once
+    window_seconds:       float = 60.0
+    max_rows_per_window:  int   = 0
+    max_bytes_per_window: int   = 0
+    max_delay_seconds:    float = 0.0        # wait this long for capacity before rejecting; 0 rejects at once
+    tools:                dict[str, "RateLimitConfig"] = field(default_factory=dict)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self.queries_per_second or self.max_concurrent_rows
+            or self.max_rows_per_window or self.max_bytes_per_window
+        )
+
+    @staticmethod
+    def from_dict(data: dict) -> "RateLimitConfig":
+        """Build RateLimitConfig from one connection entry of the top-level `rate_limits` block."""
+
+        return RateLimitConfig(
+            queries_per_second   = max(0.0, float(data.get("queries_per_second", 0))),
+            burst                = max(0, int(data.get("burst", 0))),
+            max_concurrent_rows  = max(0, int(data.get("max_concurrent_rows", 0))),
+            window_seconds       = max(1.0, float(data.get("window_seconds", 60))),
+            max_rows_per_window  = max(0, int(data.get("max_rows_per_window", 0))),
+            max_bytes_per_window = max(0, int(data.get("max_bytes_per_window", 0))),
+            max_delay_seconds    = max(0.0, float(data.get("max_delay_seconds", 0))),
+            tools                = {
+                tool: RateLimitConfig.from_dict(limits) for tool, limits in data.get("tools", {}).items()
+            },
+        )
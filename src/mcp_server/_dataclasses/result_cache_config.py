@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ResultCacheConfig:
+    """Opt-in per-connection cache settings for repeated SELECT results."""
+
+    enabled:     bool  = False
+    ttl_seconds: float = 60.0
+    max_bytes:   int   = 16 * 1024 * 1024
+
+    @staticmethod
+    def from_dict(data: dict) -> "ResultCacheConfig":
+        """Build ResultCacheConfig from the optional `result_cache` block of a connection entry."""
+
+        return ResultCacheConfig(
+            enabled     = bool(data.get("enabled", False)),
+            ttl_seconds = float(data.get("ttl_seconds", 60.0)),
+            max_bytes   = max(0, int(data.get("max_bytes", 16 * 1024 * 1024))),
+        )
@@ -0,0 +1,57 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+
+@dataclass
+class RunningQuery:
+    """An in-flight statement that cancel_query or a timeout can abort."""
+
+    request_id:       str
+    connection:       str
+    sql:              str
+    timeout_seconds:  float | None           = None
+    started_at:       float                  = field(default_factory=time.monotonic)
+    cancelled_reason: str | None             = None
+    _canceller:       Callable[[], None] | None = field(default=None, repr=False)
+    _lock:            threading.Lock         = field(default_factory=threading.Lock, repr=False)
+
+    def attach(self, canceller: Callable[[], None]) -> None:
+        """Set how to abort the statement; fires at once if cancellation was already requested."""
+
+        with self._lock:
+            self._canceller = canceller
+            cancelled       = self.cancelled_reason is not None
+
+        if cancelled:
+            canceller()
+
+    def detach(self) -> None:
+        """Forget the canceller before the connection goes back to the pool."""
+
+        with self._lock:
+            self._canceller = None
+
+    def cancel(self, reason: str) -> None:
+        with self._lock:
+            if self.cancelled_reason is None:
+                self.cancelled_reason = reason
+
+            canceller = self._canceller
+
+        # Called outside the lock so slow cancellers cannot stall detach(); they use attached()
+        # for the step that must not reach a reused connection.
+        if canceller is not None:
+            canceller()                 # adapters make this best-effort and non-raising
+
+    @contextmanager
+    def attached(self) -> Iterator[bool]:
+        """Hold off detach() for the block; yields whether the statement is still attached."""
+
+        with self._lock:
+            yield self._canceller is not None
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
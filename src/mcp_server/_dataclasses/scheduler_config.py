@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SchedulerConfig:
+    """Admission limits for tool calls against one connection."""
+
+    max_in_flight:         int   = 0         # 0 = the pool's max_size
+    max_queue:             int   = 100       # further calls are rejected at once; 0 = unbounded
+    queue_timeout_seconds: float = 30.0      # 0 waits indefinitely
+    metadata_reserved:     int   = 1         # slots heavy query calls may not take
+
+    @staticmethod
+    def from_dict(data: dict) -> "SchedulerConfig":
+        """Build SchedulerConfig from the optional `scheduler` block of a connection entry."""
+
+        return SchedulerConfig(
+            max_in_flight         = max(0, int(data.get("max_in_flight", 0))),
+            max_queue             = max(0, int(data.get("max_queue", 100))),
+            queue_timeout_seconds = max(0.0, float(data.get("queue_timeout_seconds", 30.0))),
+            metadata_reserved     = max(0, int(data.get("metadata_reserved", 1))),
+        )
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from mcp_server._dataclasses.ddl_target import DdlTarget
+
+
+@dataclass
+class SqlAnalysis:
+    """Everything the validator needs from one parse of a SQL string."""
+
+    statement_count:    int
+    statement_type:     str
+    has_where:          bool
+    referenced_objects: tuple[str, ...] | None = None     # filled lazily; the fast path doesn't parse
+    ddl_target:         DdlTarget | None       = None
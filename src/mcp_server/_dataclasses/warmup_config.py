@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class WarmupConfig:
+    """Which connections to open before the server starts taking requests."""
+
+    enabled:           bool             = False
+    connections:       list[str] | None = None     # None warms every configured connection
+    prefetch_metadata: bool             = False
+    timeout_seconds:   float            = 30.0
+
+    @staticmethod
+    def from_dict(data: dict) -> "WarmupConfig":
+        """Build WarmupConfig from the optional top-level `warmup` block."""
+
+        connections = data.get("connections")
+
+        return WarmupConfig(
+            enabled           = bool(data.get("enabled", False)),
+            connections       = None if connections is None else [str(c) for c in connections],
+            prefetch_metadata = bool(data.get("prefetch_metadata", False)),
+            timeout_seconds   = max(0.0, float(data.get("timeout_seconds", 30.0))),
+        )
@@ -0,0 +1,11 @@
+class SqlBulkInsertError(Exception):
+    """Raised when a bulk insert fails part-way; earlier batches stay committed."""
+
+    def __init__(self, table: str, committed_rows: int, detail: str = ""):
+        self.table          = table
+        self.committed_rows = committed_rows
+        self.detail         = detail
+
+        super().__init__(
+            f"Bulk insert into '{table}' failed after committing {committed_rows} row(s): {detail}"
+        )
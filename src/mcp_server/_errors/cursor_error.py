@@ -0,0 +1,8 @@
+class SqlCursorError(Exception):
+    """Raised when a pagination cursor is unknown, expired or already in use."""
+
+    def __init__(self, cursor: str, detail: str = ""):
+        self.cursor = cursor
+        self.detail = detail
+
+        super().__init__(f"Cursor '{cursor}' unavailable: {detail}")
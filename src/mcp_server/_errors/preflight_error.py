@@ -0,0 +1,8 @@
+class SqlPreflightError(Exception):
+    """Raised when a query's estimated plan is over the connection's pre-flight limits."""
+
+    def __init__(self, connection_name: str, detail: str = ""):
+        self.connection_name = connection_name
+        self.detail          = detail
+
+        super().__init__(f"Pre-flight check refused the query on '{connection_name}': {detail}")
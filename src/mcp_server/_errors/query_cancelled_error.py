@@ -0,0 +1,8 @@
+class SqlQueryCancelledError(Exception):
+    """Raised when a statement is aborted by cancel_query or its timeout."""
+
+    def __init__(self, request_id: str, detail: str = ""):
+        self.request_id = request_id
+        self.detail     = detail
+
+        super().__init__(f"Query '{request_id}' was cancelled: {detail}")
@@ -0,0 +1,9 @@
+class SqlRateLimitError(Exception):
+    """Raised when a call would exceed a connection's or tool's configured rate limits."""
+
+    def __init__(self, connection_name: str, detail: str = "", retry_after_seconds: float | None = None):
+        self.connection_name     = connection_name
+        self.detail              = detail
+        self.retry_after_seconds = retry_after_seconds
+
+        super().__init__(f"Rate limit reached on '{connection_name}': {detail}")
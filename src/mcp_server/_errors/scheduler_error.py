@@ -0,0 +1,8 @@
+class SqlSchedulerError(Exception):
+    """Raised when a call cannot get a slot on a busy connection: its queue is full or the wait timed out."""
+
+    def __init__(self, connection_name: str, detail: str = ""):
+        self.connection_name = connection_name
+        self.detail          = detail
+
+        super().__init__(f"Connection '{connection_name}' is busy: {detail}")
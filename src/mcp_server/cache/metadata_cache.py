@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from mcp_server._dataclasses.ddl_target import DdlTarget
+
+# (connection, kind, database, schema, table)
+MetadataKey = tuple[str, str, str | None, str | None, str | None]
+
+
+class MetadataCache:
+    """In-process TTL + LRU cache for catalog lookups, invalidated by DDL."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1024, enabled: bool = True):
+        self.ttl_seconds  = ttl_seconds
+        self.max_entries  = max(1, max_entries)
+        self.enabled      = enabled
+        self._entries:    OrderedDict[MetadataKey, tuple[float, object]] = OrderedDict()
+        self._generations: dict[str, int]                                 = {}
+        self._lock        = threading.Lock()
+
+    def get_or_load(self, key: MetadataKey, loader: Callable[[], object]) -> tuple[object, bool]:
+        """Return (value, cache_hit), calling loader on a miss or expired entry."""
+
+        if not self.enabled:
+
+            return loader(), False
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+
+                return entry[1], True
+
+            generation = self._generations.get(key[0], 0)
+
+        value = loader()
+
+        with self._lock:
+            # A DDL invalidation during the load makes the value suspect; don't cache it.
+            if self._generations.get(key[0], 0) == generation:
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return value, False
+
+    def invalidate(
+            self,
+            connection: str,
+            database: str | None = None,
+            table: str | None = None ) -> int:
+        """Drop cached entries for a connection, optionally narrowed to a database or table."""
+
+        # A table invalidation also drops table lists and schemas, which embed the table.
+        table_lower = table.lower() if table else None
+
+        with self._lock:
+            self._generations[connection] = self._generations.get(connection, 0) + 1
+
+            doomed = []
+
+            for key in self._entries:
+                conn, kind, db, _schema, tbl = key
+
+                if conn != connection:
+
+                    continue
+
+                if database is not None and db is not None and db != database:
+
+                    continue
+
+                if table_lower is not None and kind == "columns" and (tbl or "").lower() != table_lower:
+
+                    continue
+
+                if table_lower is not None and kind == "databases":
+
+                    continue
+
+                doomed.append(key)
+
+            for key in doomed:
+                del self._entries[key]
+
+        return len(doomed)
+
+    def invalidate_for_ddl(self, connection: str, database: str | None, target: DdlTarget | None) -> int:
+        """Invalidate whatever a CREATE/ALTER/DROP statement may have changed."""
+
+        if target is None:
+
+            return 0
+
+        if target.object_type == "DATABASE":
+
+            return self.invalidate(connection)
+
+        # Qualified names mean different things per driver (db.table vs schema.table),
+        # so a table is invalidated by name across the connection's databases.
+        if target.object_type in ("TABLE", "VIEW", "INDEX") and target.name:
+
+            return self.invalidate(connection, table=target.name)
+
+        return self.invalidate(connection, database)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,131 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from mcp_server._dataclasses.connection_config import ConnectionConfig
+from mcp_server._dataclasses.query_result import ColumnMeta
+
+# (connection, database, normalized sql, params)
+ResultKey = tuple[str, str, str, tuple]
+
+_QUOTED_OR_SPACE = re.compile(r"('(?:[^']|'')*'|\"[^\"]*\"|\[[^\]]*\]|`[^`]*`)|\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace outside literals and quoted identifiers, and drop a trailing semicolon."""
+
+    collapsed = _QUOTED_OR_SPACE.sub(lambda m: m.group(1) or " ", sql)
+
+    return collapsed.strip().rstrip(";").rstrip()
+
+
+class ResultCache:
+    """Per-connection TTL + LRU cache of complete SELECT results, bounded by a byte budget."""
+
+    def __init__(self):
+        self._entries:     dict[str, OrderedDict[ResultKey, tuple[float, int, list, list]]] = {}
+        self._sizes:       dict[str, int] = {}
+        self._generations: dict[tuple[str, str | None], int] = {}
+        self._lock         = threading.Lock()
+
+    def key(self, config: ConnectionConfig, database: str | None, sql: str, params: list | None = None) -> ResultKey:
+        return (config.name, database or config.database, normalize_sql(sql), tuple(params or ()))
+
+    def get(self, config: ConnectionConfig, key: ResultKey) -> tuple[list[ColumnMeta], list, float] | None:
+        """Return (columns, rows, age_seconds) for a fresh entry, or None."""
+
+        if not config.result_cache.enabled:
+
+            return None
+
+        with self._lock:
+            entries = self._entries.get(key[0])
+            entry   = entries.get(key) if entries else None
+
+            if entry is None:
+
+                return None
+
+            age = time.monotonic() - entry[0]
+
+            if age >= config.result_cache.ttl_seconds:
+                self._drop_locked(key)
+
+                return None
+
+            entries.move_to_end(key)
+
+            return entry[2], entry[3], age
+
+    def generation(self, key: ResultKey) -> tuple[int, int]:
+        """Snapshot the write generations of the key's connection and database before running the query."""
+
+        with self._lock:
+
+            return self._generation_locked(key)
+
+    def put(
+            self,
+            config: ConnectionConfig,
+            key: ResultKey,
+            generation: tuple[int, int],
+            columns: list[ColumnMeta],
+            rows: list ) -> bool:
+        """Store a complete result unless it is over budget or a write raced the read."""
+
+        settings = config.result_cache
+
+        if not settings.enabled:
+
+            return False
+
+        size = len(json.dumps(rows, separators=(",", ":"), default=str))
+
+        if size > settings.max_bytes:
+
+            return False
+
+        with self._lock:
+            if self._generation_locked(key) != generation:
+
+                return False
+
+            if key in self._entries.get(key[0], {}):
+                self._drop_locked(key)
+
+            entries = self._entries.setdefault(key[0], OrderedDict())
+            entries[key] = (time.monotonic(), size, columns, rows)
+            self._sizes[key[0]] = self._sizes.get(key[0], 0) + size
+
+            while self._sizes[key[0]] > settings.max_bytes:
+                self._drop_locked(next(iter(entries)))
+
+        return True
+
+    def invalidate(self, connection: str, database: str | None = None) -> int:
+        """Drop cached results for a connection, or only those read from one database."""
+
+        with self._lock:
+            entries = self._entries.get(connection, {})
+            doomed  = [k for k in entries if database is None or k[1] == database]
+
+            for k in doomed:
+                self._drop_locked(k)
+
+            self._generations[(connection, database)] = self._generations.get((connection, database), 0) + 1
+
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+    def _generation_locked(self, key: ResultKey) -> tuple[int, int]:
+        return self._generations.get((key[0], None), 0), self._generations.get((key[0], key[1]), 0)
+
+    def _drop_locked(self, key: ResultKey) -> None:
+        entry = self._entries[key[0]].pop(key)
+        self._sizes[key[0]] -= entry[1]
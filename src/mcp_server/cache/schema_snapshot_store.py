@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from mcp_server.connections.base_adapter import BaseAdapter
+
+
+class SchemaSnapshotStore:
+    """Versioned on-disk schema snapshots, reused while the database fingerprint is unchanged."""
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, directory: Path, enabled: bool = False, verify_interval_seconds: float = 30.0):
+        self.directory               = directory
+        self.enabled                 = enabled
+        self.verify_interval_seconds = verify_interval_seconds
+        self._verified:  dict[tuple, tuple[float, list[dict]]] = {}
+        self._lock       = threading.Lock()
+
+    def get_schema(
+            self,
+            adapter: BaseAdapter,
+            database: str,
+            schema: str | None = None ) -> tuple[list[dict], str]:
+        """Return (tables, source) where source is 'snapshot' or 'live'."""
+
+        if not self.enabled:
+
+            return adapter.introspect_schema(database, schema), "live"
+
+        key    = (adapter.config.name, database, schema)
+        tables = self._recently_verified(key)
+
+        if tables is not None:
+
+            return tables, "snapshot"
+
+        fingerprint = adapter.schema_fingerprint(database)
+
+        if fingerprint is None:
+
+            return adapter.introspect_schema(database, schema), "live"
+
+        tables = self._read(key, fingerprint)
+
+        if tables is not None:
+            self._remember(key, tables)
+
+            return tables, "snapshot"
+
+        tables = adapter.introspect_schema(database, schema)
+        self._write(key, fingerprint, tables)
+        self._remember(key, tables)
+
+        return tables, "live"
+
+    def find_table(
+            self,
+            adapter: BaseAdapter,
+            database: str,
+            table: str,
+            schema: str | None = None ) -> dict | None:
+        """Return a table entry from a valid snapshot of this database, or None."""
+
+        if not self.enabled:
+
+            return None
+
+        candidates = [(adapter.config.name, database, schema)]
+
+        if schema is not None:
+            candidates.append((adapter.config.name, database, None))
+
+        fingerprint = None
+
+        for key in candidates:
+            tables = self._recently_verified(key)
+
+            if tables is None and self._path(key).exists():
+                if fingerprint is None:
+                    fingerprint = adapter.schema_fingerprint(database)
+
+                    if fingerprint is None:
+
+                        return None
+
+                tables = self._read(key, fingerprint)
+
+                if tables is not None:
+                    self._remember(key, tables)
+
+            for tbl in tables or []:
+                if tbl["table"] == table and (schema is None or tbl.get("schema") == schema):
+
+                    return tbl
+
+        return None
+
+    def forget(self, connection: str) -> None:
+        """Drop in-memory verifications so the next read re-checks the fingerprint."""
+
+        with self._lock:
+            for key in [k for k in self._verified if k[0] == connection]:
+                del self._verified[key]
+
+    def _recently_verified(self, key: tuple) -> list[dict] | None:
+        with self._lock:
+            entry = self._verified.get(key)
+
+        if entry is None or time.monotonic() - entry[0] >= self.verify_interval_seconds:
+
+            return None
+
+        return entry[1]
+
+    def _remember(self, key: tuple, tables: list[dict]) -> None:
+        with self._lock:
+            self._verified[key] = (time.monotonic(), tables)
+
+    def _path(self, key: tuple) -> Path:
+        connection, database, schema = key
+
+        return self.directory / _safe_name(connection) / _safe_name(database) / f"{_safe_name(schema or '_all')}.json"
+
+    def _read(self, key: tuple, fingerprint: str) -> list[dict] | None:
+        """Load a snapshot if it exists and matches the version and fingerprint."""
+
+        try:
+            with open(self._path(key), "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+
+            return None
+
+        if data.get("version") != self.SNAPSHOT_VERSION or data.get("fingerprint") != fingerprint:
+
+            return None
+
+        return data.get("tables")
+
+    def _write(self, key: tuple, fingerprint: str, tables: list[dict]) -> None:
+        """Write atomically; a failed write only costs the next warm start."""
+
+        path = self._path(key)
+        tmp  = None
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # A unique temp file per write, so concurrent writers of one key never share it.
+            with tempfile.NamedTemporaryFile(
+                    "w", dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False) as f:
+                tmp = Path(f.name)
+                json.dump({
+                    "version":     self.SNAPSHOT_VERSION,
+                    "connection":  key[0],
+                    "database":    key[1],
+                    "schema":      key[2],
+                    "fingerprint": fingerprint,
+                    "created_at":  time.time(),
+                    "tables":      tables,
+                }, f, default=str)
+
+            os.replace(tmp, path)
+        except OSError:
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+
+
+def _safe_name(name: str) -> str:
+    """Filesystem-safe name; the hash of the raw name keeps e.g. 'a b' and 'a_b' apart."""
+
+    safe   = re.sub(r"[^\w.-]", "_", name)
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=4).hexdigest()
+
+    return f"{safe}-{digest}"
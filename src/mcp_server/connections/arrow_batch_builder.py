@@ -0,0 +1,91 @@
+import datetime
+import uuid
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# pyarrow is optional (pip install "sql-executor-mcp[arrow]") and only imported by
+# the features that need it.
+
+
+def require_pyarrow():
+    """Import pyarrow, or explain how to install it."""
+
+    try:
+        import pyarrow
+
+    except ImportError as e:
+        raise RuntimeError("This needs pyarrow. Install it with: pip install 'sql-executor-mcp[arrow]'") from e
+
+    return pyarrow
+
+
+def python_arrow_type(pa, py_type: type) -> "pa.DataType | None":
+    """Arrow type for a driver-reported Python column type. None means infer from the values."""
+
+    return {
+        bool:              pa.bool_(),
+        int:               pa.int64(),
+        float:             pa.float64(),
+        str:               pa.string(),
+        bytes:             pa.binary(),
+        bytearray:         pa.binary(),
+        datetime.datetime: pa.timestamp("us"),
+        datetime.date:     pa.date32(),
+        datetime.time:     pa.time64("us"),
+        uuid.UUID:         pa.string(),
+    }.get(py_type)
+
+
+class ArrowBatchBuilder:
+    """Builds RecordBatches column-wise from driver row chunks, keeping one schema across chunks."""
+
+    def __init__(self, names: list[str], types: list | None = None):
+        self.pa     = require_pyarrow()
+        self.names  = names
+        self.schema: "pa.Schema | None" = None
+        self._types = list(types) if types else [None] * len(names)
+
+    def build(self, rows: Sequence[Sequence]) -> "pa.RecordBatch":
+        """Convert one chunk of driver rows (tuples in column order) into a RecordBatch."""
+
+        pa      = self.pa
+        columns = list(zip(*rows)) if rows else [()] * len(self.names)
+        arrays  = [self._array(values, arrow_type) for values, arrow_type in zip(columns, self._types)]
+
+        if self.schema is None:
+            # Types inferred from the first chunk are pinned so every batch shares one schema.
+            # An all-NULL column says nothing about its type, so it becomes text; inferred
+            # decimals get full precision so later, larger values still fit.
+            arrays      = [self._widen(a) for a in arrays]
+            self._types = [a.type for a in arrays]
+            self.schema = pa.schema([pa.field(name, a.type) for name, a in zip(self.names, arrays)])
+
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def _array(self, values: Sequence, arrow_type) -> "pa.Array":
+        pa = self.pa
+
+        try:
+
+            return pa.array(values, type=arrow_type)
+
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+            if arrow_type is not None and not pa.types.is_string(arrow_type):
+                raise
+
+            return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+    def _widen(self, array: "pa.Array") -> "pa.Array":
+        pa = self.pa
+
+        if pa.types.is_null(array.type):
+
+            return array.cast(pa.string())
+
+        if pa.types.is_decimal(array.type) and array.type.precision < 38:
+
+            return array.cast(pa.decimal128(38, array.type.scale))
+
+        return array
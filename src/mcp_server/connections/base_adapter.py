@@ -1,27 +1,56 @@
+import functools
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Sequence
 
 from mcp_server._dataclasses.connection_config import ConnectionConfig
+from mcp_server._dataclasses.connection_health import ConnectionHealth
+from mcp_server._dataclasses.plan_estimate import PlanEstimate
+from mcp_server._dataclasses.pooled_connection import PooledConnection
 from mcp_server._dataclasses.query_result import ColumnMeta
+from mcp_server._dataclasses.running_query import RunningQuery
+from mcp_server._errors.bulk_insert_error import SqlBulkInsertError
+from mcp_server._errors.connection_error import SqlConnectionError
+from mcp_server._errors.query_cancelled_error import SqlQueryCancelledError
+from mcp_server.connections.arrow_batch_builder import require_pyarrow
+from mcp_server.connections.connection_pool import ConnectionPool
+from mcp_server.connections.request_scheduler import RequestScheduler
+from mcp_server.connections.row_stream import RowStream
+from mcp_server.connections.value_converters import Converter, binary_converter, serialize_value
 
 
 class BaseAdapter(ABC):
     """Abstract base for database adapters."""
 
+    SUPPORTS_EXPLAIN: bool = False     # True where _explain can read an estimated plan
+
     def __init__(self, config: ConnectionConfig):
         self.config     = config
-        self._conn      = None
+        self._pool:     ConnectionPool | None     = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock      = threading.Lock()
+        self.health     = ConnectionHealth()
+        self.scheduler  = RequestScheduler(
+            config.name, config.scheduler, config.scheduler.max_in_flight or config.pool.max_size,
+        )
 
     @abstractmethod
-    def connect(self) -> None:
+    def _open_connection(self) -> object:
+        """Open a new driver connection. Raise SqlConnectionError on failure."""
         ...
 
     @abstractmethod
-    def disconnect(self) -> None:
+    def _use_database_sql(self, database: str) -> str:
+        """Return the driver-specific statement that switches the current database."""
         ...
 
     @abstractmethod
-    def execute(self, sql: str, params: list | None = None) -> tuple[list[ColumnMeta], list[dict], int]:
-        """Execute SQL and return (columns, rows, affected_count)."""
+    def _column_meta(self, description) -> list[ColumnMeta]:
+        """Build ColumnMeta from a DB-API cursor.description."""
         ...
 
     @abstractmethod
@@ -36,12 +65,567 @@ class BaseAdapter(ABC):
     def describe_table(self, database: str, table: str, schema: str | None = None) -> list[dict]:
         ...
 
+    def introspect_schema(self, database: str, schema: str | None = None) -> list[dict]:
+        """Return every table with its columns, primary key and indexes."""
+
+        # Fallback: one describe_table per table, no keys or indexes. Adapters override with a bulk query.
+
+        tables = self.get_tables(database, schema)
+
+        return [
+            {
+                **tbl,
+                "columns":     self.describe_table(database, tbl["table"], tbl.get("schema", schema)),
+                "primary_key": [],
+                "indexes":     [],
+            }
+            for tbl in tables
+        ]
+
+    def schema_fingerprint(self, database: str) -> str | None:
+        """Cheap token that changes whenever the database's schema does. None if unsupported."""
+
+        return None
+
+    def connect(self, parallel: bool = False) -> None:
+        """Create the connection pool and open its minimum connections, concurrently if `parallel`."""
+
+        with self._lock:
+            if self._pool is not None:
+
+                return
+
+            pool = ConnectionPool(
+                name           = self.config.name,
+                config         = self.config.pool,
+                factory        = self._open_with_backoff,
+                closer         = self._close_connection,
+                database       = self.config.database,
+                validator      = self._check_alive,
+                validate_after = self.config.health.ping_interval_seconds,
+            )
+
+            try:
+                pool.fill(parallel)
+            except Exception:
+                pool.close()
+                raise
+
+            self._pool = pool
+
+    def disconnect(self) -> None:
+        """Close the pool. Checked-out connections are closed when released."""
+
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
     def ensure_connected(self) -> None:
-        """Reconnect if connection is stale."""
+        """Create the pool if it does not exist yet. Dead pooled connections are replaced on checkout."""
 
-        if self._conn is None:
+        if self._pool is None:
             self.connect()
 
+    def ping(self) -> float:
+        """Round-trip a liveness check on a pooled connection. Returns milliseconds; raises if unreachable."""
+
+        self.ensure_connected()
+        pool   = self._pool
+        pooled = pool.acquire(database=self.config.database)
+        alive  = self._check_alive(pooled.conn)
+
+        pool.release(pooled, discard=not alive)
+
+        if not alive:
+            pool.discard_idle()
+            raise SqlConnectionError(self.config.name, self.health.last_error or "ping failed")
+
+        return self.health.last_ping_ms
+
+    def run_read(self, fn: Callable, /, *args, **kwargs):
+        """Call an idempotent read, retrying with backoff when it fails on a transient connection error."""
+
+        retries = self.config.health.read_retries
+
+        for attempt in range(retries + 1):
+            try:
+
+                return fn(*args, **kwargs)
+
+            except Exception as e:
+                if attempt >= retries or not self._is_transient(e):
+                    raise
+
+                self.health.record_failure(e)
+
+                if self._pool is not None:
+                    self._pool.discard_idle()
+
+                time.sleep(self.config.health.backoff(attempt))
+
+    def pool_stats(self) -> dict | None:
+        """Current pool occupancy, or None before the first connection."""
+
+        pool = self._pool
+
+        if pool is None:
+
+            return None
+
+        return {
+            "size":     pool.size,
+            "idle":     pool.idle_count,
+            "in_use":   pool.in_use_count,
+            "max_size": pool.config.max_size,
+        }
+
+    @contextmanager
+    def connection(self, database: str | None = None) -> Iterator[PooledConnection]:
+        """Check a pooled connection out for one call, switched to `database` (default: the configured one)."""
+
+        self.ensure_connected()
+        pool    = self._pool
+        pooled  = pool.acquire(database=database or self.config.database)
+        discard = False
+
+        try:
+            self._switch_database(pooled, database)
+
+            yield pooled
+        except Exception as e:
+            discard = not self._rollback_quietly(pooled) or self._is_transient(e)
+            raise
+        finally:
+            pool.release(pooled, discard=discard)
+
+    def open_stream(
+            self,
+            sql: str,
+            params: list | None = None,
+            database: str | None = None,
+            batch_size: int | None = None,
+            timeout: float | None = None,
+            query: RunningQuery | None = None ) -> RowStream:
+        """Execute SQL on a checked-out connection. Close the RowStream to commit and release it."""
+
+        self.ensure_connected()
+        pool   = self._pool
+        pooled = pool.acquire(database=database or self.config.database)
+        cursor = None
+
+        try:
+            self._switch_database(pooled, database)
+            self._apply_timeout(pooled, timeout)
+
+            cursor = self._statement_cursor(pooled) if params else pooled.conn.cursor()
+
+            self._attach(pooled, cursor, query)
+
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+
+            columns = self._column_meta(cursor.description) if cursor.description else []
+
+        except Exception as e:
+            if query is not None:
+                query.detach()
+
+            if cursor is not None:
+                self._abandon_cursor(cursor)
+
+                if pooled.statement_cursor is cursor:
+                    pooled.statement_cursor = None
+
+            pool.release(pooled, discard=not self._rollback_quietly(pooled) or self._is_transient(e))
+
+            # A cancelled statement can surface as a network-looking driver error; never retry it.
+            if query is not None and query.cancelled_reason is not None and not isinstance(e, SqlQueryCancelledError):
+                raise SqlQueryCancelledError(query.request_id, query.cancelled_reason) from e
+
+            raise
+
+        return RowStream(
+            pool        = pool,
+            pooled      = pooled,
+            cursor      = cursor,
+            columns     = columns,
+            batch_size  = batch_size or self.config.fetch_batch_size,
+            converters  = [self._converter_for(col) for col in cursor.description or []],
+            abandon     = self._abandon_cursor,
+            query       = query,
+            arrow_types = functools.partial(self.arrow_types, cursor.description),
+        )
+
+    def execute(
+            self,
+            sql: str,
+            params: list | None = None,
+            database: str | None = None,
+            timeout: float | None = None,
+            query: RunningQuery | None = None ) -> tuple[list[ColumnMeta], list[dict], int]:
+        """Execute SQL and return (columns, rows, affected_count)."""
+
+        with self.open_stream(sql, params, database, timeout=timeout, query=query) as stream:
+            rows     = stream.read()
+            affected = len(rows) if stream.columns else stream.affected
+
+            return stream.columns, rows, affected
+
+    def explain(
+            self,
+            sql: str,
+            params: list | None = None,
+            database: str | None = None,
+            timeout: float | None = None,
+            query: RunningQuery | None = None ) -> PlanEstimate | None:
+        """Estimate a statement's rows and cost from its plan, without running it. None if unsupported."""
+
+        if not self.SUPPORTS_EXPLAIN:
+
+            return None
+
+        with self.connection(database) as pooled:
+            self._apply_timeout(pooled, timeout)
+
+            try:
+
+                return self._explain(pooled, sql, params, query)
+
+            except Exception as e:
+                if query is not None and query.cancelled_reason is not None and not isinstance(e, SqlQueryCancelledError):
+                    raise SqlQueryCancelledError(query.request_id, query.cancelled_reason) from e
+
+                raise
+
+            finally:
+                if query is not None:
+                    query.detach()
+
+    def bulk_insert(
+            self,
+            table: str,
+            columns: list[str],
+            rows: Iterable[Sequence],
+            database: str | None = None,
+            schema: str | None = None,
+            batch_size: int | None = None ) -> tuple[int, int]:
+        """Insert rows on one connection, committing every batch. Returns (rows_inserted, batches)."""
+
+        batch_size = max(1, batch_size or self.config.insert_batch_size)
+        table_sql  = self.quote_identifier(table)
+        column_sql = ", ".join(self.quote_identifier(c) for c in columns)
+        width      = len(columns)
+        inserted   = 0
+        batches    = 0
+
+        if schema:
+            table_sql = f"{self.quote_identifier(schema)}.{table_sql}"
+
+        with self.connection(database) as pooled:
+            batch = []
+
+            try:
+                for row in rows:
+                    if len(row) != width:
+                        raise ValueError(f"Row {inserted + len(batch) + 1} has {len(row)} value(s); expected {width}.")
+
+                    batch.append(row)
+
+                    if len(batch) >= batch_size:
+                        self._insert_batch(pooled, table_sql, column_sql, width, batch)
+                        pooled.conn.commit()
+                        inserted += len(batch)
+                        batches  += 1
+                        batch     = []
+
+                if batch:
+                    self._insert_batch(pooled, table_sql, column_sql, width, batch)
+                    pooled.conn.commit()
+                    inserted += len(batch)
+                    batches  += 1
+
+            except Exception as e:
+                pooled.statement_cursor = None
+                raise SqlBulkInsertError(table, inserted, f"{type(e).__name__}: {e}") from e
+
+        return inserted, batches
+
+    def arrow_types(self, description) -> list:
+        """Arrow type per result column from cursor.description; None entries are inferred from the data."""
+
+        pa = require_pyarrow()
+
+        return [self._arrow_type(pa, column) for column in description or []]
+
+    def quote_identifier(self, name: str) -> str:
+        """Quote one identifier part for this driver."""
+
+        return '"' + name.replace('"', '""') + '"'
+
     @property
     def is_connected(self) -> bool:
-        return self._conn is not None
+        return self._pool is not None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Bounded executor for blocking driver calls, sized so every admitted call gets a thread."""
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers        = max(self.config.pool.max_size, self.scheduler.max_in_flight),
+                    thread_name_prefix = f"sql-{self.config.name}",
+                )
+
+            return self._executor
+
+    @staticmethod
+    def _assemble_schema(column_rows: list, index_rows: list) -> list[dict]:
+        """Group bulk introspection rows into per-table dicts."""
+
+        # column_rows: (schema, table, table_type, column, type, is_nullable, max_length, default, position)
+        # index_rows:  (schema, table, index, is_primary, is_unique, column, key_ordinal)
+
+        tables: dict[tuple, dict] = {}
+
+        for row in column_rows:
+            key = (row[0], row[1])
+            tbl = tables.get(key)
+
+            if tbl is None:
+                tbl = tables[key] = {
+                    "schema":      row[0],
+                    "table":       row[1],
+                    "type":        row[2],
+                    "columns":     [],
+                    "primary_key": [],
+                    "indexes":     [],
+                }
+
+            tbl["columns"].append({
+                "column":     row[3],
+                "type":       row[4],
+                "nullable":   row[5] == "YES",
+                "max_length": row[6],
+                "default":    row[7],
+                "position":   row[8],
+            })
+
+        indexes: dict[tuple, dict] = {}
+
+        for row in index_rows:
+            tbl = tables.get((row[0], row[1]))
+
+            if tbl is None:
+
+                continue
+
+            if row[3]:
+                tbl["primary_key"].append(row[5])
+
+            idx = indexes.get((row[0], row[1], row[2]))
+
+            if idx is None:
+                idx = indexes[(row[0], row[1], row[2])] = {
+                    "name":    row[2],
+                    "primary": bool(row[3]),
+                    "unique":  bool(row[4]),
+                    "columns": [],
+                }
+                tbl["indexes"].append(idx)
+
+            idx["columns"].append(row[5])
+
+        return list(tables.values())
+
+    @staticmethod
+    def _close_connection(conn: object) -> None:
+        conn.close()
+
+    @staticmethod
+    def _abandon_cursor(cursor) -> bool:
+        """Close a cursor with unread rows. Returns False if its connection can't be reused."""
+
+        try:
+            cursor.close()
+
+            return True
+
+        except Exception:
+
+            return False
+
+    def _open_with_backoff(self) -> object:
+        """Open a driver connection, retrying with exponential backoff while the server is unreachable."""
+
+        attempts = self.config.health.reconnect_attempts
+
+        for attempt in range(attempts):
+            try:
+                conn = self._open_connection()
+            except SqlConnectionError as e:
+                self.health.record_failure(e)
+
+                if attempt + 1 >= attempts:
+                    raise
+
+                # Jitter keeps every server in a fleet from reconnecting in lockstep after a failover.
+                time.sleep(self.config.health.backoff(attempt) * random.uniform(0.5, 1.0))
+
+                continue
+
+            self.health.record_reconnect()
+
+            return conn
+
+    def _ping(self, conn: object) -> None:
+        """Cheapest round trip that proves the session is alive. Raises if it is not."""
+
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _check_alive(self, conn: object) -> bool:
+        """Ping a connection and record the outcome in self.health."""
+
+        start = time.perf_counter()
+
+        try:
+            self._ping(conn)
+        except Exception as e:
+            self.health.record_failure(e)
+
+            return False
+
+        self.health.record_success((time.perf_counter() - start) * 1000)
+
+        return True
+
+    def _explain(
+            self,
+            pooled: PooledConnection,
+            sql: str,
+            params: list | None,
+            query: RunningQuery | None ) -> PlanEstimate | None:
+        """Read the estimated plan on a checked-out connection. Adapters that override this set SUPPORTS_EXPLAIN."""
+
+        return None
+
+    def _is_transient(self, error: BaseException) -> bool:
+        """True for errors meaning the connection dropped, where a retry on a fresh one may succeed."""
+
+        return False
+
+    def _switch_database(self, pooled: PooledConnection, database: str | None) -> None:
+        """Issue USE only when the session is not already on the target database."""
+
+        # Calls without a database go back to the configured default, so one caller's
+        # database never leaks into the next caller's session.
+        target = database or self.config.database
+
+        if not target or pooled.current_database == target:
+
+            return
+
+        cursor = pooled.conn.cursor()
+
+        try:
+            cursor.execute(self._use_database_sql(target))
+        finally:
+            cursor.close()
+
+        pooled.current_database = target
+
+    def _apply_timeout(self, pooled: PooledConnection, timeout: float | None) -> None:
+        """Set the driver's statement timeout on the session. Default: rely on the cancel watchdog only."""
+
+        pooled.query_timeout = timeout
+
+    def _attach(self, pooled: PooledConnection, cursor, query: RunningQuery | None) -> None:
+        """Let `query` abort the statement about to run on `cursor`. Raises if it was already cancelled."""
+
+        if query is None:
+
+            return
+
+        query.attach(functools.partial(self._cancel, pooled, cursor, query))
+
+        if query.cancelled_reason is not None:
+            raise SqlQueryCancelledError(query.request_id, query.cancelled_reason)
+
+    def _cancel(self, pooled: PooledConnection, cursor, query: RunningQuery) -> None:
+        """Abort the statement running on `cursor` from another thread. Best effort, never raises."""
+
+        with query.attached() as attached:
+            if not attached:
+
+                return
+
+            try:
+                cursor.cancel()
+            except Exception:
+                pass
+
+    def _insert_batch(
+            self,
+            pooled: PooledConnection,
+            table_sql: str,
+            column_sql: str,
+            width: int,
+            batch: list[Sequence] ) -> None:
+        """Insert one batch with executemany on the statement cursor."""
+
+        placeholders = ", ".join(["?"] * width)
+        cursor       = self._statement_cursor(pooled)
+        cursor.executemany(f"INSERT INTO {table_sql} ({column_sql}) VALUES ({placeholders})", batch)
+
+    def _new_statement_cursor(self, conn: object) -> object:
+        """Open the cursor used for parameterized statements. Adapters override to enable preparation."""
+
+        return conn.cursor()
+
+    def _statement_cursor(self, pooled: PooledConnection) -> object:
+        """Reuse the connection's statement cursor so the driver can skip re-preparing repeated SQL."""
+
+        if pooled.statement_cursor is None:
+            pooled.statement_cursor = self._new_statement_cursor(pooled.conn)
+
+        return pooled.statement_cursor
+
+    def _converter_for(self, column) -> Converter | None:
+        """Pick a value converter for one cursor.description entry. None means pass-through."""
+
+        return serialize_value
+
+    def _arrow_type(self, pa, column) -> object | None:
+        """Arrow type for one cursor.description entry. Default: infer from the values."""
+
+        return None
+
+    @property
+    def _binary_encoder(self) -> Converter:
+        return binary_converter(self.config.binary_encoding)
+
+    @staticmethod
+    def _rollback_quietly(pooled: PooledConnection) -> bool:
+        """Roll back after a failed call. Returns False if the connection looks unusable."""
+
+        try:
+            pooled.conn.rollback()
+
+            return True
+
+        except Exception:
+
+            return False
@@ -1,21 +1,37 @@
+import asyncio
+import functools
+import importlib
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable
+
+from mcp_server._dataclasses.admission import Admission
 from mcp_server._dataclasses.connection_config import ConnectionConfig
 from mcp_server._errors.connection_error import SqlConnectionError
 from mcp_server.connections.base_adapter import BaseAdapter
-from mcp_server.connections.sql_server_adapter import SqlServerAdapter
-from mcp_server.connections.mysql_adapter import MySqlAdapter
+from mcp_server.connections.query_tracker import QueryTracker
 
 
 class ConnectionManager:
     """Manages named database connections and adapter lifecycle."""
 
-    DRIVER_MAP = {
-        "sql_server": SqlServerAdapter,
-        "mysql":      MySqlAdapter,
+    # "module:Class" paths are imported on first use, so a deployment only loads the
+    # driver (pyodbc, mysql.connector) its connections actually need. Classes work too.
+    DRIVER_MAP: dict[str, str | type[BaseAdapter]] = {
+        "sql_server": "mcp_server.connections.sql_server_adapter:SqlServerAdapter",
+        "mysql":      "mcp_server.connections.mysql_adapter:MySqlAdapter",
     }
 
+    DEFAULT_EXECUTOR_WORKERS = 4
+    CONTROL_EXECUTOR_WORKERS = 2
+
     def __init__(self, connections_config: dict):
         self._configs:  dict[str, ConnectionConfig] = {}
         self._adapters: dict[str, BaseAdapter]      = {}
+        self._lock      = threading.Lock()
+        self._default_executor: ThreadPoolExecutor | None = None
+        self._control_executor: ThreadPoolExecutor | None = None
+        self.tracker:   QueryTracker                = QueryTracker()
 
         for name, cfg in connections_config.items():
             self._configs[name] = ConnectionConfig.from_dict(name, cfg)
@@ -29,19 +45,73 @@ class ConnectionManager:
                 f"Unknown connection. Available: {list(self._configs.keys())}",
             )
 
-        if connection_name not in self._adapters:
-            config        = self._configs[connection_name]
-            adapter_class = self.DRIVER_MAP.get(config.driver)
+        with self._lock:
+            if connection_name not in self._adapters:
+                config        = self._configs[connection_name]
+                adapter_class = self._adapter_class(connection_name, config.driver)
+
+                self._adapters[connection_name] = adapter_class(config)
+
+            return self._adapters[connection_name]
+
+    def get_executor(self, connection_name: str | None) -> Executor:
+        """Return the executor serving a connection, or a shared fallback for unknown names."""
+
+        try:
+
+            return self.get_adapter(connection_name).executor
+
+        except SqlConnectionError:
+            with self._lock:
+                if self._default_executor is None:
+                    self._default_executor = ThreadPoolExecutor(
+                        max_workers        = self.DEFAULT_EXECUTOR_WORKERS,
+                        thread_name_prefix = "sql-default",
+                    )
+
+                return self._default_executor
+
+    async def run_async(
+            self,
+            connection_name: str | None,
+            fn: Callable,
+            /,
+            *args,
+            lane: str = "query",
+            throttled_ms: float | None = None,
+            **kwargs ):
+        """Run a blocking callable on the executor for connection_name, once its scheduler admits it.
+
+        throttled_ms is the delay of a rate-limit admission the caller already made; the Admission carries it.
+        """
+
+        try:
+            adapter = self.get_adapter(connection_name)
+        except SqlConnectionError:
+            loop = asyncio.get_running_loop()
+
+            return await loop.run_in_executor(
+                self.get_executor(connection_name), functools.partial(fn, *args, **kwargs),
+            )
+
+        admission              = await adapter.scheduler.acquire_async(lane)
+        admission.throttled_ms = throttled_ms
+
+        return await asyncio.wrap_future(self._dispatch(adapter, admission, fn, *args, **kwargs))
+
+    async def run_control(self, fn: Callable, /, *args, **kwargs):
+        """Run a short control call (cancel, cursor close) on an executor no query work shares."""
 
-            if adapter_class is None:
-                raise SqlConnectionError(
-                    connection_name,
-                    f"Unsupported driver '{config.driver}'. Supported: {list(self.DRIVER_MAP.keys())}",
+        with self._lock:
+            if self._control_executor is None:
+                self._control_executor = ThreadPoolExecutor(
+                    max_workers        = self.CONTROL_EXECUTOR_WORKERS,
+                    thread_name_prefix = "sql-control",
                 )
 
-            self._adapters[connection_name] = adapter_class(config)
+        loop = asyncio.get_running_loop()
 
-        return self._adapters[connection_name]
+        return await loop.run_in_executor(self._control_executor, functools.partial(fn, *args, **kwargs))
 
     def list_connections(self) -> list[dict]:
         """Return summary of all configured connections."""
@@ -59,8 +129,44 @@ class ConnectionManager:
     def disconnect_all(self) -> None:
         """Disconnect all active adapters."""
 
-        for adapter in self._adapters.values():
-            if adapter.is_connected:
+        with self._lock:
+            for adapter in self._adapters.values():
                 adapter.disconnect()
 
-        self._adapters.clear()
+            self._adapters.clear()
+
+    @staticmethod
+    def _dispatch(adapter: BaseAdapter, admission: Admission, fn: Callable, /, *args, **kwargs) -> Future:
+        """Run an admitted call on the adapter's executor; its slot is freed however the future ends."""
+
+        future = adapter.executor.submit(adapter.scheduler.run, admission, fn, *args, **kwargs)
+        future.add_done_callback(lambda _: adapter.scheduler.release(admission))
+
+        return future
+
+    def _adapter_class(self, connection_name: str, driver: str) -> type[BaseAdapter]:
+        """Resolve a DRIVER_MAP entry, importing the adapter module the first time it is needed."""
+
+        entry = self.DRIVER_MAP.get(driver)
+
+        if entry is None:
+            raise SqlConnectionError(
+                connection_name,
+                f"Unsupported driver '{driver}'. Supported: {list(self.DRIVER_MAP.keys())}",
+            )
+
+        if not isinstance(entry, str):
+
+            return entry
+
+        module_name, _, class_name = entry.partition(":")
+
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            raise SqlConnectionError(
+                connection_name,
+                f"Driver '{driver}' is not available: {e}. Install its client library.",
+            ) from e
+
+        return getattr(module, class_name)
@@ -0,0 +1,238 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from mcp_server._dataclasses.pool_config import PoolConfig
+from mcp_server._dataclasses.pooled_connection import PooledConnection
+from mcp_server._errors.connection_error import SqlConnectionError
+
+
+class ConnectionPool:
+    """Thread-safe pool of driver connections for one named connection."""
+
+    def __init__(
+            self,
+            name: str,
+            config: PoolConfig,
+            factory: Callable[[], object],
+            closer: Callable[[object], None],
+            database: str | None = None,
+            validator: Callable[[object], bool] | None = None,
+            validate_after: float | None = None ):
+        self.name            = name
+        self.config          = config
+        self.database        = database        # the database new connections start on
+        self._factory        = factory
+        self._closer         = closer
+        self._validator      = validator       # liveness check for idle connections on checkout
+        self._validate_after = validate_after  # idle seconds before a connection is checked; None = never
+        self._idle:   deque[PooledConnection] = deque()
+        self._size    = 0
+        self._closed  = False
+        self._cond    = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def in_use_count(self) -> int:
+        return self._size - len(self._idle)
+
+    def fill(self, parallel: bool = False) -> None:
+        """Open connections until the pool holds at least min_size; with `parallel`, open them concurrently."""
+
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.config.min_size:
+
+                    return
+
+                count       = self.config.min_size - self._size if parallel else 1
+                self._size += count
+
+            if count == 1:
+                self.release(self._open())
+
+                continue
+
+            with ThreadPoolExecutor(max_workers=count, thread_name_prefix=f"fill-{self.name}") as executor:
+                futures = [executor.submit(self._open) for _ in range(count)]
+
+            for future in futures:
+                if future.exception() is None:
+                    self.release(future.result())
+
+            for future in futures:
+                if future.exception() is not None:
+                    raise future.exception()
+
+    def acquire(self, timeout: float | None = None, database: str | None = None) -> PooledConnection:
+        """Check out a connection, preferring one already on `database`; open one if below max_size, else wait."""
+
+        if timeout is None:
+            timeout = self.config.checkout_timeout_seconds
+
+        deadline = time.monotonic() + timeout
+
+        while True:
+            pooled, reused = self._checkout(timeout, deadline, database)
+
+            if not reused or self._validate_after is None or self._validator is None:
+
+                return pooled
+
+            if pooled.idle_for(time.monotonic()) < self._validate_after or self._validator(pooled.conn):
+
+                return pooled
+
+            # One dead session usually means the server restarted or failed over,
+            # so its idle peers are dead too; replace them all with fresh connections.
+            self.release(pooled, discard=True)
+            self.discard_idle()
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """Return a checked-out connection; discarded connections are closed."""
+
+        now   = time.monotonic()
+        stale = []
+
+        with self._cond:
+            if discard or self._closed or pooled.age(now) >= self.config.max_lifetime_seconds:
+                self._size -= 1
+                stale.append(pooled)
+            else:
+                pooled.last_used_at = now
+                self._idle.append(pooled)
+
+            stale.extend(self._evict_locked(now))
+            self._cond.notify()
+
+        self._close_all(stale)
+
+    def discard_idle(self) -> None:
+        """Close every idle connection; checkouts open fresh ones."""
+
+        with self._cond:
+            stale       = list(self._idle)
+            self._size -= len(stale)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        self._close_all(stale)
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts."""
+
+        with self._cond:
+            self._closed = True
+            stale        = list(self._idle)
+            self._size  -= len(stale)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        self._close_all(stale)
+
+    def _checkout(self, timeout: float, deadline: float, database: str | None) -> tuple[PooledConnection, bool]:
+        """Take an idle connection or open a new one. Returns (connection, was_idle)."""
+
+        stale = []
+
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise SqlConnectionError(self.name, "Connection pool is closed.")
+
+                    now = time.monotonic()
+                    stale.extend(self._evict_locked(now))
+
+                    if self._idle:
+                        pooled = self._pop_idle_locked(database)
+
+                        if pooled.age(now) >= self.config.max_lifetime_seconds:
+                            self._size -= 1
+                            stale.append(pooled)
+
+                            continue
+
+                        return pooled, True
+
+                    if self._size < self.config.max_size:
+                        self._size += 1
+
+                        break
+
+                    remaining = deadline - now
+
+                    if remaining <= 0:
+                        raise SqlConnectionError(
+                            self.name,
+                            f"Timed out after {timeout:g}s waiting for a pooled connection "
+                            f"(max_size={self.config.max_size}).",
+                        )
+
+                    self._cond.wait(remaining)
+        finally:
+            self._close_all(stale)
+
+        return self._open(), False
+
+    def _open(self) -> PooledConnection:
+        """Open a new connection for a slot already reserved in _size."""
+
+        try:
+
+            return PooledConnection(conn=self._factory(), current_database=self.database or None)
+
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _pop_idle_locked(self, database: str | None) -> PooledConnection:
+        """Take the newest idle connection on `database`, else the newest overall. Caller holds the lock."""
+
+        if database:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].current_database == database:
+                    pooled = self._idle[i]
+                    del self._idle[i]
+
+                    return pooled
+
+        return self._idle.pop()
+
+    def _evict_locked(self, now: float) -> list[PooledConnection]:
+        """Drop idle connections past their lifetime or idle timeout. Caller holds the lock."""
+
+        evicted = []
+
+        for pooled in list(self._idle):
+            expired = pooled.age(now) >= self.config.max_lifetime_seconds
+            idle    = (
+                pooled.idle_for(now) >= self.config.idle_timeout_seconds
+                and self._size - len(evicted) > self.config.min_size
+            )
+
+            if expired or idle:
+                self._idle.remove(pooled)
+                evicted.append(pooled)
+
+        self._size -= len(evicted)
+
+        return evicted
+
+    def _close_all(self, connections: list[PooledConnection]) -> None:
+        for pooled in connections:
+            try:
+                self._closer(pooled.conn)
+            except Exception:
+                pass
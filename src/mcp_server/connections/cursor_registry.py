@@ -0,0 +1,148 @@
+import secrets
+import threading
+import time
+
+from mcp_server._dataclasses.open_cursor import OpenCursor
+from mcp_server._errors.cursor_error import SqlCursorError
+
+
+class CursorRegistry:
+    """Holds paginated result streams between calls and expires abandoned ones."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_open: int = 32):
+        self.ttl_seconds = ttl_seconds
+        self.max_open    = max(1, max_open)
+        self._cursors:   dict[str, OpenCursor] = {}
+        self._in_use:    set[str]              = set()
+        self._lock       = threading.Lock()
+        self._sweeper:   threading.Thread | None = None
+
+    def register(self, entry: OpenCursor, max_per_connection: int | None = None) -> str:
+        """Store an open stream and return its opaque token.
+
+        Each parked cursor keeps a pooled connection checked out, so max_per_connection (kept
+        below the pool's max_size) caps them per connection; the oldest idle ones are closed
+        first. Raises SqlCursorError when the cursor cannot be parked; the caller keeps the stream.
+        """
+
+        token   = secrets.token_urlsafe(16)
+        evicted = []
+
+        with self._lock:
+            idle = [t for t in self._cursors if t not in self._in_use]
+            idle.sort(key=lambda t: self._cursors[t].last_access)
+
+            if max_per_connection is not None:
+                same = [t for t in self._cursors if self._cursors[t].connection == entry.connection]
+                mine = [t for t in idle if self._cursors[t].connection == entry.connection]
+
+                while len(same) >= max_per_connection and mine:
+                    oldest = mine.pop(0)
+                    same.remove(oldest)
+                    idle.remove(oldest)
+                    evicted.append(self._cursors.pop(oldest))
+
+                if len(same) >= max_per_connection:
+                    raise SqlCursorError(
+                        token,
+                        f"Connection '{entry.connection}' already has {len(same)} cursor(s) being read; "
+                        f"at most {max_per_connection} can stay open without starving its pool.",
+                    )
+
+            self._cursors[token] = entry
+
+            while len(self._cursors) > self.max_open and idle:
+                evicted.append(self._cursors.pop(idle.pop(0)))
+
+            self._start_sweeper()
+
+        for old in evicted:
+            old.stream.close()
+
+        return token
+
+    def checkout(self, token: str) -> OpenCursor:
+        """Claim a cursor for one page fetch. Pair with checkin() or close()."""
+
+        self.sweep()
+
+        with self._lock:
+            entry = self._cursors.get(token)
+
+            if entry is None:
+                raise SqlCursorError(token, "Unknown or expired cursor.")
+
+            if token in self._in_use:
+                raise SqlCursorError(token, "Cursor is already being read by another call.")
+
+            self._in_use.add(token)
+
+            return entry
+
+    def checkin(self, token: str) -> None:
+        """Release a claimed cursor so later calls can continue paging."""
+
+        with self._lock:
+            self._in_use.discard(token)
+
+            entry = self._cursors.get(token)
+
+            if entry is not None:
+                entry.last_access = time.monotonic()
+
+    def close(self, token: str) -> bool:
+        """Close and forget a cursor. Returns False if it was unknown."""
+
+        with self._lock:
+            entry = self._cursors.pop(token, None)
+            self._in_use.discard(token)
+
+        if entry is None:
+
+            return False
+
+        entry.stream.close()
+
+        return True
+
+    def sweep(self) -> int:
+        """Close cursors idle for longer than the TTL. Returns how many were closed."""
+
+        cutoff = time.monotonic() - self.ttl_seconds
+
+        with self._lock:
+            expired = [
+                t for t, entry in self._cursors.items()
+                if t not in self._in_use and entry.last_access < cutoff
+            ]
+            entries = [self._cursors.pop(t) for t in expired]
+
+        for entry in entries:
+            entry.stream.close()
+
+        return len(entries)
+
+    @property
+    def open_count(self) -> int:
+        return len(self._cursors)
+
+    def _start_sweeper(self) -> None:
+        """Start the background TTL sweeper once. Caller holds the lock."""
+
+        if self._sweeper is not None:
+
+            return
+
+        self._sweeper = threading.Thread(
+            target = self._sweep_loop,
+            name   = "sql-cursor-sweeper",
+            daemon = True,
+        )
+        self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        interval = max(1.0, self.ttl_seconds / 2)
+
+        while True:
+            time.sleep(interval)
+            self.sweep()
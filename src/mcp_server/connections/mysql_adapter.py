@@ -1,176 +1,407 @@
+import json
+from typing import Iterator, Sequence
+
 import mysql.connector
+from mysql.connector import FieldFlag, FieldType
 
 from mcp_server._dataclasses.connection_config import ConnectionConfig
+from mcp_server._dataclasses.plan_estimate import PlanEstimate
+from mcp_server._dataclasses.pooled_connection import PooledConnection
 from mcp_server._dataclasses.query_result import ColumnMeta
+from mcp_server._dataclasses.running_query import RunningQuery
 from mcp_server._errors.connection_error import SqlConnectionError
 from mcp_server.connections.base_adapter import BaseAdapter
+from mcp_server.connections.value_converters import Converter, maybe_bytes, serialize_value, to_iso, to_str
 
 
 class MySqlAdapter(BaseAdapter):
     """Adapter for MySQL via mysql-connector-python."""
 
+    TYPE_NAMES = {
+        FieldType.TINY:       "TINYINT",
+        FieldType.SHORT:      "SMALLINT",
+        FieldType.LONG:       "INT",
+        FieldType.LONGLONG:   "BIGINT",
+        FieldType.FLOAT:      "FLOAT",
+        FieldType.DOUBLE:     "DOUBLE",
+        FieldType.DECIMAL:    "DECIMAL",
+        FieldType.NEWDECIMAL: "DECIMAL",
+        FieldType.STRING:     "CHAR",
+        FieldType.VAR_STRING: "VARCHAR",
+        FieldType.BLOB:       "BLOB",
+        FieldType.DATE:       "DATE",
+        FieldType.DATETIME:   "DATETIME",
+        FieldType.TIMESTAMP:  "TIMESTAMP",
+    }
+
+    NATIVE_TYPES = {
+        FieldType.TINY, FieldType.SHORT, FieldType.LONG, FieldType.LONGLONG,
+        FieldType.INT24, FieldType.FLOAT, FieldType.DOUBLE, FieldType.YEAR,
+        FieldType.BIT, FieldType.NULL, FieldType.ENUM,
+    }
+
+    CONVERTERS = {
+        FieldType.DECIMAL:    to_str,
+        FieldType.NEWDECIMAL: to_str,
+        FieldType.TIME:       to_str,
+        FieldType.DATE:       to_iso,
+        FieldType.NEWDATE:    to_iso,
+        FieldType.DATETIME:   to_iso,
+        FieldType.TIMESTAMP:  to_iso,
+    }
+
+    # Text, blob and decimal columns are inferred from the values: the description does not
+    # say whether a string column is binary, nor give a decimal's precision.
+    ARROW_TYPES = {
+        FieldType.TINY:      "int64",
+        FieldType.SHORT:     "int64",
+        FieldType.LONG:      "int64",
+        FieldType.INT24:     "int64",
+        FieldType.LONGLONG:  "int64",
+        FieldType.YEAR:      "int64",
+        FieldType.BIT:       "int64",
+        FieldType.FLOAT:     "float64",
+        FieldType.DOUBLE:    "float64",
+        FieldType.DATE:      "date32",
+        FieldType.NEWDATE:   "date32",
+        FieldType.DATETIME:  "timestamp",
+        FieldType.TIMESTAMP: "timestamp",
+        FieldType.TIME:      "duration",
+        FieldType.ENUM:      "string",
+    }
+
+    # Server gone away, lost connection, can't connect, server shutdown in progress.
+    TRANSIENT_ERRNOS = {1053, 2003, 2006, 2013, 2055}
+
+    # Text and binary share these codes; only binary columns come back as bytes.
+    MAYBE_BINARY_TYPES = {
+        FieldType.STRING, FieldType.VAR_STRING, FieldType.VARCHAR,
+        FieldType.BLOB, FieldType.TINY_BLOB, FieldType.MEDIUM_BLOB, FieldType.LONG_BLOB,
+        FieldType.JSON, FieldType.GEOMETRY,
+    }
+
+    SUPPORTS_EXPLAIN = True
+
     def __init__(self, config: ConnectionConfig):
         super().__init__(config)
 
-    def connect(self) -> None:
-        """Establish a MySQL connection."""
+    def _open_connection(self) -> object:
+        """Open a new MySQL connection."""
 
         try:
-            self._conn = mysql.connector.connect(
+
+            return mysql.connector.connect(
                 host     = self.config.host,
                 port     = self.config.port,
                 database = self.config.database,
                 user     = self.config.username,
                 password = self.config.password,
             )
+
         except mysql.connector.Error as e:
             raise SqlConnectionError(self.config.name, str(e))
 
-    def disconnect(self) -> None:
-        """Close the MySQL connection."""
+    def _use_database_sql(self, database: str) -> str:
+        return f"USE `{database}`"
+
+    def _column_meta(self, description) -> list[ColumnMeta]:
+        """Map mysql.connector cursor.description to ColumnMeta."""
+
+        return [
+            ColumnMeta(
+                name     = col[0],
+                type     = self._mysql_type_name(col[1]),
+                nullable = col[6] if len(col) > 6 else True,
+            )
+            for col in description
+        ]
+
+    def _apply_timeout(self, pooled: PooledConnection, timeout: float | None) -> None:
+        """max_execution_time bounds SELECTs server-side; other statements rely on KILL QUERY."""
+
+        millis = int(timeout * 1000) if timeout else 0
+
+        if (pooled.query_timeout or 0) != millis:
+            cursor = pooled.conn.cursor()
 
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+            try:
+                cursor.execute("SET SESSION max_execution_time = %s", [millis])
+            finally:
+                cursor.close()
 
-    def execute(self, sql: str, params: list | None = None) -> tuple[list[ColumnMeta], list[dict], int]:
-        """Execute SQL and return structured results."""
+            pooled.query_timeout = millis
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
+    def _cancel(self, pooled: PooledConnection, cursor, query: RunningQuery) -> None:
+        """KILL QUERY from a side connection; the pooled session itself stays usable."""
 
+        # Connecting can be slow, so it happens before taking the query's lock. The KILL
+        # itself is sent under it, and only while the statement is still attached, so it
+        # can never reach whichever call gets this connection next.
         try:
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-
-            columns  = []
-            rows     = []
-            affected = cursor.rowcount
-
-            if cursor.description:
-                columns = [
-                    ColumnMeta(
-                        name     = col[0],
-                        type     = self._mysql_type_name(col[1]),
-                        nullable = col[6] if len(col) > 6 else True,
-                    )
-                    for col in cursor.description
-                ]
-
-                raw_rows  = cursor.fetchall()
-                col_names = [c.name for c in columns]
-                rows = [
-                    {col_names[i]: self._serialize_value(row[i]) for i in range(len(col_names))}
-                    for row in raw_rows
-                ]
-                affected = len(rows)
-
-            self._conn.commit()
-
-            return columns, rows, affected
+            connection_id = int(pooled.conn.connection_id)
+            side          = self._open_connection()
+        except Exception:
 
-        except mysql.connector.Error as e:
-            self._conn.rollback()
-            raise
+            return
+
+        try:
+            with query.attached() as attached:
+                if attached:
+                    side_cursor = side.cursor()
+                    side_cursor.execute(f"KILL QUERY {connection_id}")
+                    side_cursor.close()
+        except Exception:
+            pass
+        finally:
+            self._close_connection(side)
+
+    def _ping(self, conn: object) -> None:
+        """COM_PING skips the parser and the result-set round trip of SELECT 1."""
+
+        conn.ping(reconnect=False)
+
+    def _is_transient(self, error: BaseException) -> bool:
+        return isinstance(error, mysql.connector.Error) and error.errno in self.TRANSIENT_ERRNOS
+
+    def _explain(
+            self,
+            pooled: PooledConnection,
+            sql: str,
+            params: list | None,
+            query: RunningQuery | None ) -> PlanEstimate:
+        """EXPLAIN FORMAT=JSON; ? placeholders need the prepared cursor, as in execute."""
+
+        cursor = self._new_statement_cursor(pooled.conn) if params else pooled.conn.cursor()
+
+        try:
+            self._attach(pooled, cursor, query)
+            cursor.execute(f"EXPLAIN FORMAT=JSON {sql}", params) if params else cursor.execute(f"EXPLAIN FORMAT=JSON {sql}")
+            document = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+        if isinstance(document, (bytes, bytearray)):
+            document = document.decode("utf-8")
+
+        return self._parse_explain(json.loads(document))
+
+    @classmethod
+    def _parse_explain(cls, document: dict) -> PlanEstimate:
+        """Query cost, plus rows produced by the last table joined; LIMIT is not reflected."""
+
+        block    = document.get("query_block", {})
+        cost     = block.get("cost_info", {}).get("query_cost")
+        estimate = PlanEstimate(estimated_cost=float(cost) if cost is not None else None)
+        produced = None
+
+        for table in cls._explain_tables(block):
+            name     = table.get("table_name", "?")
+            access   = table.get("access_type", "?")
+            examined = table.get("rows_examined_per_scan", 0)
+            produced = table.get("rows_produced_per_join", produced)
+
+            estimate.operators.append(f"{access} {name} (~{examined:,} rows examined)")
+
+            # ALL is a full table scan, index a full index scan.
+            if access in ("ALL", "index"):
+                estimate.full_scans.append(f"{name} (~{examined:,} rows read)")
+
+        estimate.estimated_rows = float(produced) if produced is not None else None
+
+        return estimate
+
+    @classmethod
+    def _explain_tables(cls, node) -> Iterator[dict]:
+        """Every "table" entry in an EXPLAIN document, in document order."""
+
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "table" and isinstance(value, dict):
+                    yield value
+
+                yield from cls._explain_tables(value)
+
+        elif isinstance(node, list):
+            for item in node:
+                yield from cls._explain_tables(item)
+
+    def quote_identifier(self, name: str) -> str:
+        return "`" + name.replace("`", "``") + "`"
+
+    def _insert_batch(
+            self,
+            pooled: PooledConnection,
+            table_sql: str,
+            column_sql: str,
+            width: int,
+            batch: list[Sequence] ) -> None:
+        """One multi-row INSERT per batch instead of a round trip per row."""
+
+        row_sql = "(" + ", ".join(["%s"] * width) + ")"
+        cursor  = pooled.conn.cursor()
+
+        try:
+            cursor.execute(
+                f"INSERT INTO {table_sql} ({column_sql}) VALUES " + ", ".join([row_sql] * len(batch)),
+                [value for row in batch for value in row],
+            )
         finally:
             cursor.close()
 
+    def _new_statement_cursor(self, conn: object) -> object:
+        """Server-side prepared cursor; re-executing the same SQL skips the prepare round trip."""
+
+        return conn.cursor(prepared=True)
+
+    def _converter_for(self, column) -> Converter | None:
+        """Pick a converter from the column's type code once per result set."""
+
+        type_code = column[1]
+
+        if type_code in self.NATIVE_TYPES:
+
+            return None
+
+        if type_code in self.MAYBE_BINARY_TYPES:
+
+            return maybe_bytes(self._binary_encoder)
+
+        return self.CONVERTERS.get(type_code, serialize_value)
+
+    def _arrow_type(self, pa, column) -> object | None:
+        name = self.ARROW_TYPES.get(column[1])
+
+        if name is None:
+
+            return None
+
+        if name in ("timestamp", "duration"):
+
+            return getattr(pa, name)("us")
+
+        if name == "int64" and len(column) > 7 and column[7] & FieldFlag.UNSIGNED:
+
+            return pa.uint64()
+
+        return getattr(pa, name)()
+
+    @staticmethod
+    def _abandon_cursor(cursor) -> bool:
+        """mysql.connector cannot close a cursor with unread rows, so the connection is dropped."""
+
+        return False
+
     def get_databases(self) -> list[str]:
         """List all databases on the server."""
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
-        cursor.execute("SHOW DATABASES")
-        results = [row[0] for row in cursor.fetchall()]
-        cursor.close()
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute("SHOW DATABASES")
+            results = [row[0] for row in cursor.fetchall()]
+            cursor.close()
 
         return results
 
     def get_tables(self, database: str, schema: str | None = None) -> list[dict]:
         """List tables in a database."""
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            "SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE "
-            "FROM INFORMATION_SCHEMA.TABLES "
-            "WHERE TABLE_SCHEMA = %s "
-            "ORDER BY TABLE_NAME",
-            [database],
-        )
-        results = [
-            {"schema": row[0], "table": row[1], "type": row[2]}
-            for row in cursor.fetchall()
-        ]
-        cursor.close()
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(
+                "SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE "
+                "FROM INFORMATION_SCHEMA.TABLES "
+                "WHERE TABLE_SCHEMA = %s "
+                "ORDER BY TABLE_NAME",
+                [database],
+            )
+            results = [
+                {"schema": row[0], "table": row[1], "type": row[2]}
+                for row in cursor.fetchall()
+            ]
+            cursor.close()
 
         return results
 
     def describe_table(self, database: str, table: str, schema: str | None = None) -> list[dict]:
         """Return column metadata for a table."""
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            "SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, "
-            "CHARACTER_MAXIMUM_LENGTH, COLUMN_DEFAULT, ORDINAL_POSITION "
-            "FROM INFORMATION_SCHEMA.COLUMNS "
-            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s "
-            "ORDER BY ORDINAL_POSITION",
-            [database, table],
-        )
-        results = [
-            {
-                "column":     row[0],
-                "type":       row[1],
-                "nullable":   row[2] == "YES",
-                "max_length": row[3],
-                "default":    row[4],
-                "position":   row[5],
-            }
-            for row in cursor.fetchall()
-        ]
-        cursor.close()
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(
+                "SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, "
+                "CHARACTER_MAXIMUM_LENGTH, COLUMN_DEFAULT, ORDINAL_POSITION "
+                "FROM INFORMATION_SCHEMA.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s "
+                "ORDER BY ORDINAL_POSITION",
+                [database, table],
+            )
+            results = [
+                {
+                    "column":     row[0],
+                    "type":       row[1],
+                    "nullable":   row[2] == "YES",
+                    "max_length": row[3],
+                    "default":    row[4],
+                    "position":   row[5],
+                }
+                for row in cursor.fetchall()
+            ]
+            cursor.close()
 
         return results
 
-    @staticmethod
-    def _mysql_type_name(type_code) -> str:
-        """Map mysql.connector type codes to readable names."""
-
-        type_map = {
-            mysql.connector.FieldType.TINY:       "TINYINT",
-            mysql.connector.FieldType.SHORT:      "SMALLINT",
-            mysql.connector.FieldType.LONG:       "INT",
-            mysql.connector.FieldType.LONGLONG:   "BIGINT",
-            mysql.connector.FieldType.FLOAT:      "FLOAT",
-            mysql.connector.FieldType.DOUBLE:     "DOUBLE",
-            mysql.connector.FieldType.DECIMAL:    "DECIMAL",
-            mysql.connector.FieldType.NEWDECIMAL: "DECIMAL",
-            mysql.connector.FieldType.STRING:     "CHAR",
-            mysql.connector.FieldType.VAR_STRING: "VARCHAR",
-            mysql.connector.FieldType.BLOB:       "BLOB",
-            mysql.connector.FieldType.DATE:       "DATE",
-            mysql.connector.FieldType.DATETIME:   "DATETIME",
-            mysql.connector.FieldType.TIMESTAMP:  "TIMESTAMP",
-        }
-
-        return type_map.get(type_code, str(type_code))
-
-    @staticmethod
-    def _serialize_value(value) -> object:
-        """Coerce non-serializable types to strings."""
-
-        if value is None:
+    def introspect_schema(self, database: str, schema: str | None = None) -> list[dict]:
+        """Bulk introspection on one connection: columns joined with tables, then index columns."""
+
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(
+                "SELECT t.TABLE_SCHEMA, t.TABLE_NAME, t.TABLE_TYPE, "
+                "c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE, "
+                "c.CHARACTER_MAXIMUM_LENGTH, c.COLUMN_DEFAULT, c.ORDINAL_POSITION "
+                "FROM INFORMATION_SCHEMA.TABLES t "
+                "JOIN INFORMATION_SCHEMA.COLUMNS c "
+                "ON c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME "
+                "WHERE t.TABLE_SCHEMA = %s "
+                "ORDER BY t.TABLE_NAME, c.ORDINAL_POSITION",
+                [database],
+            )
+            column_rows = cursor.fetchall()
+            cursor.execute(
+                "SELECT TABLE_SCHEMA, TABLE_NAME, INDEX_NAME, INDEX_NAME = 'PRIMARY', "
+                "NON_UNIQUE = 0, COLUMN_NAME, SEQ_IN_INDEX "
+                "FROM INFORMATION_SCHEMA.STATISTICS "
+                "WHERE TABLE_SCHEMA = %s "
+                "ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX",
+                [database],
+            )
+            index_rows = cursor.fetchall()
+            cursor.close()
 
-            return None
+        return self._assemble_schema(column_rows, index_rows)
+
+    def schema_fingerprint(self, database: str) -> str | None:
+        """CRC32 checksums over information_schema column and index definitions."""
+
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*), COALESCE(SUM(CRC32(CONCAT_WS('|', TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, "
+                "IS_NULLABLE, IFNULL(COLUMN_DEFAULT, ''), COLUMN_KEY, ORDINAL_POSITION))), 0), "
+                "(SELECT COALESCE(SUM(CRC32(CONCAT_WS('|', TABLE_NAME, INDEX_NAME, NON_UNIQUE, "
+                "COLUMN_NAME, SEQ_IN_INDEX))), 0) "
+                "FROM INFORMATION_SCHEMA.STATISTICS WHERE TABLE_SCHEMA = %s) "
+                "FROM INFORMATION_SCHEMA.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s",
+                [database, database],
+            )
+            row = cursor.fetchone()
+            cursor.close()
 
-        if isinstance(value, (int, float, str, bool)):
+        return "|".join(str(v) for v in row)
 
-            return value
+    @classmethod
+    def _mysql_type_name(cls, type_code) -> str:
+        """Map mysql.connector type codes to readable names."""
 
-        return str(value)
+        return cls.TYPE_NAMES.get(type_code, str(type_code))
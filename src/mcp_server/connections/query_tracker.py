@@ -0,0 +1,94 @@
+import secrets
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from mcp_server._dataclasses.running_query import RunningQuery
+from mcp_server._errors.query_cancelled_error import SqlQueryCancelledError
+
+
+class QueryTracker:
+    """Registry of in-flight statements by request id, with per-query timeout watchdogs."""
+
+    def __init__(self):
+        self._running: dict[str, RunningQuery] = {}
+        self._lock     = threading.Lock()
+
+    @contextmanager
+    def track(
+            self,
+            request_id: str | None,
+            connection: str,
+            sql: str,
+            timeout_seconds: float | None = None ) -> Iterator[RunningQuery]:
+        """Register a statement for the duration of one tool call and enforce its timeout."""
+
+        query = RunningQuery(
+            request_id      = request_id or secrets.token_hex(8),
+            connection      = connection,
+            sql             = sql,
+            timeout_seconds = timeout_seconds,
+        )
+
+        with self._lock:
+            if query.request_id in self._running:
+                raise ValueError(f"request_id '{query.request_id}' is already running.")
+
+            self._running[query.request_id] = query
+
+        timer = None
+
+        if timeout_seconds:
+            timer = threading.Timer(
+                timeout_seconds, query.cancel, [f"exceeded the {timeout_seconds:g}s query timeout"],
+            )
+            timer.daemon = True
+            timer.start()
+
+        try:
+            yield query
+        except Exception as e:
+            if query.cancelled_reason is not None:
+                raise SqlQueryCancelledError(query.request_id, query.cancelled_reason) from e
+
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+            query.detach()
+
+            with self._lock:
+                self._running.pop(query.request_id, None)
+
+    def cancel(self, request_id: str, reason: str = "cancelled by cancel_query") -> bool:
+        """Abort a running statement. Returns False if no such request is running."""
+
+        with self._lock:
+            query = self._running.get(request_id)
+
+        if query is None:
+
+            return False
+
+        query.cancel(reason)
+
+        return True
+
+    def running(self, connection: str | None = None) -> list[dict]:
+        """Summaries of in-flight statements, optionally for one connection."""
+
+        with self._lock:
+            queries = list(self._running.values())
+
+        return [
+            {
+                "request_id":      q.request_id,
+                "connection":      q.connection,
+                "elapsed_seconds": round(q.elapsed(), 2),
+                "timeout_seconds": q.timeout_seconds,
+                "sql":             q.sql[:200],
+            }
+            for q in queries
+            if connection is None or q.connection == connection
+        ]
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from mcp_server._dataclasses.admission import Admission
+from mcp_server._dataclasses.scheduler_config import SchedulerConfig
+from mcp_server._errors.scheduler_error import SqlSchedulerError
+
+
+class _Waiter:
+    """One queued call; its future resolves to an Admission once a slot is granted."""
+
+    def __init__(self, lane: str, queue_depth: int):
+        self.lane        = lane
+        self.queue_depth = queue_depth
+        self.enqueued    = time.perf_counter()
+        self.future      = Future()
+        self.granted     = False
+
+    def wait_ms(self) -> float:
+        return (time.perf_counter() - self.enqueued) * 1000
+
+
+class RequestScheduler:
+    """Caps concurrent tool calls on one connection and queues the rest in priority lanes."""
+
+    # Earlier lanes are admitted first. Only the first lane may use the reserved slots.
+    LANES = ("metadata", "query")
+
+    _local = threading.local()
+
+    def __init__(self, name: str, config: SchedulerConfig, max_in_flight: int):
+        self.name          = name
+        self.config        = config
+        self.max_in_flight = max(1, max_in_flight)
+        self._reserved     = min(config.metadata_reserved, self.max_in_flight - 1)
+        self._queues       = {lane: deque() for lane in self.LANES}
+        self._running      = {lane: 0 for lane in self.LANES}
+        self._lock         = threading.Lock()
+        self._admitted     = 0
+        self._rejected     = 0
+        self._timed_out    = 0
+        self._wait_ms      = 0.0
+
+    async def acquire_async(self, lane: str, timeout: float | None = None) -> Admission:
+        """Wait until a slot is free in `lane`, holding no thread. Raises SqlSchedulerError when full or timed out."""
+
+        waiter  = self._enqueue(lane)
+        timeout = self._timeout(timeout)
+
+        try:
+
+            return await asyncio.wait_for(asyncio.wrap_future(waiter.future), timeout)
+
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+
+            raise self._timed_out_error(waiter) from None
+
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def release(self, admission: Admission) -> None:
+        """Free the slot held by an admitted call and admit the next waiter."""
+
+        with self._lock:
+            self._running[admission.lane] -= 1
+            self._dispatch()
+
+    def run(self, admission: Admission, fn, /, *args, **kwargs):
+        """Call fn on a worker thread with `admission` visible to current(). Does not release."""
+
+        self._local.admission = admission
+
+        try:
+
+            return fn(*args, **kwargs)
+
+        finally:
+            self._local.admission = None
+
+    @classmethod
+    def current(cls) -> Admission | None:
+        """The Admission of the call running on this thread, if it came through a scheduler."""
+
+        return getattr(cls._local, "admission", None)
+
+    def stats(self) -> dict:
+        with self._lock:
+
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight":     dict(self._running),
+                "queued":        {lane: len(queue) for lane, queue in self._queues.items()},
+                "admitted":      self._admitted,
+                "rejected":      self._rejected,
+                "timed_out":     self._timed_out,
+                "avg_wait_ms":   round(self._wait_ms / self._admitted, 2) if self._admitted else 0.0,
+            }
+
+    def _enqueue(self, lane: str) -> _Waiter:
+        if lane not in self._queues:
+            raise ValueError(f"Unknown scheduler lane '{lane}'. Expected one of {list(self.LANES)}.")
+
+        with self._lock:
+            depth = sum(len(queue) for queue in self._queues.values())
+
+            if self.config.max_queue and depth >= self.config.max_queue:
+                self._rejected += 1
+
+                raise SqlSchedulerError(
+                    self.name,
+                    f"{sum(self._running.values())} call(s) running and {depth} waiting (max_queue "
+                    f"{self.config.max_queue}). Retry shortly.",
+                )
+
+            waiter = _Waiter(lane, depth)
+            self._queues[lane].append(waiter)
+            self._dispatch()
+
+        return waiter
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters, highest-priority lane first, FIFO within a lane. Caller holds the lock."""
+
+        for lane in self.LANES:
+            queue = self._queues[lane]
+
+            while queue and self._has_slot(lane):
+                waiter = queue.popleft()
+
+                # A waiter that timed out or was cancelled may still be queued briefly.
+                if not waiter.future.set_running_or_notify_cancel():
+                    continue
+
+                wait_ms              = waiter.wait_ms()
+                waiter.granted       = True
+                self._running[lane] += 1
+                self._admitted      += 1
+                self._wait_ms       += wait_ms
+                waiter.future.set_result(Admission(lane=lane, wait_ms=wait_ms, queue_depth=waiter.queue_depth))
+
+    def _has_slot(self, lane: str) -> bool:
+        running = sum(self._running.values())
+
+        if running >= self.max_in_flight:
+
+            return False
+
+        if lane == self.LANES[0]:
+
+            return True
+
+        return running - self._running[self.LANES[0]] < self.max_in_flight - self._reserved
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Withdraw a waiter that gave up; a slot granted in the meantime is handed back."""
+
+        with self._lock:
+            if waiter.granted:
+                self._running[waiter.lane] -= 1
+                self._dispatch()
+
+                return
+
+            waiter.future.cancel()
+
+            if waiter in self._queues[waiter.lane]:
+                self._queues[waiter.lane].remove(waiter)
+
+    def _timeout(self, timeout: float | None) -> float | None:
+        timeout = self.config.queue_timeout_seconds if timeout is None else timeout
+
+        return timeout or None
+
+    def _timed_out_error(self, waiter: _Waiter) -> SqlSchedulerError:
+        with self._lock:
+            self._timed_out += 1
+
+        return SqlSchedulerError(
+            self.name,
+            f"waited {waiter.wait_ms():.0f} ms in the {waiter.lane} queue (queue depth {waiter.queue_depth} "
+            f"on arrival) without getting one of {self.max_in_flight} slot(s). Retry later.",
+        )
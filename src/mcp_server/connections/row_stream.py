@@ -0,0 +1,238 @@
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from mcp_server._dataclasses.pooled_connection import PooledConnection
+from mcp_server._dataclasses.query_result import ColumnMeta
+from mcp_server._dataclasses.running_query import RunningQuery
+from mcp_server.connections.arrow_batch_builder import ArrowBatchBuilder
+from mcp_server.connections.connection_pool import ConnectionPool
+from mcp_server.connections.value_converters import Converter
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+class RowStream:
+    """Batched fetchmany reader over an executed cursor; holds its pooled connection until close()."""
+
+    def __init__(
+            self,
+            pool: ConnectionPool,
+            pooled: PooledConnection,
+            cursor,
+            columns: list[ColumnMeta],
+            batch_size: int,
+            converters: list[Converter | None],
+            abandon: Callable[[object], bool],
+            query: RunningQuery | None = None,
+            arrow_types: Callable[[], list] | None = None ):
+        self.columns      = columns
+        self.description  = cursor.description
+        self.batch_size   = max(1, batch_size)
+        self.affected     = cursor.rowcount
+        self.rows_read    = 0
+        self.exhausted    = not columns
+        self._pool        = pool
+        self._pooled      = pooled
+        self._cursor      = cursor
+        self._convert     = [(i, conv) for i, conv in enumerate(converters) if conv is not None]
+        self._abandon     = abandon
+        self._col_names   = [c.name for c in columns]
+        self._pending:    list[tuple] = []
+        self._closed      = False
+        self._failed      = False
+        self._reusable    = pooled.statement_cursor is cursor
+        self._query       = query
+        self._arrow_types = arrow_types     # called once, on the first read_arrow
+        self._arrow:      ArrowBatchBuilder | None = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def fetch_raw(self, size: int | None = None) -> list[tuple]:
+        """Return up to `size` driver rows (default: one batch)."""
+
+        size = size or self.batch_size
+        rows = self._pending[:size]
+        del self._pending[:size]
+
+        while len(rows) < size and not self.exhausted:
+            chunk = self._fetchmany(min(self.batch_size, size - len(rows)))
+
+            if not chunk:
+                self.exhausted = True
+
+                break
+
+            rows.extend(chunk)
+
+        self.rows_read += len(rows)
+
+        return rows
+
+    def fetch(self, size: int | None = None, as_lists: bool = False) -> list[dict] | list[list]:
+        """Return up to `size` serialized rows (default: one batch) as dicts or value lists."""
+
+        raw_rows = self.fetch_raw(size)
+
+        return self._to_lists(raw_rows) if as_lists else self._to_dicts(raw_rows)
+
+    def batches(self, as_lists: bool = False) -> Iterator[list[dict] | list[list]]:
+        """Yield serialized row batches until the result set is exhausted."""
+
+        while True:
+            batch = self.fetch(as_lists=as_lists)
+
+            if not batch:
+
+                return
+
+            yield batch
+
+    def read(self, limit: int | None = None, as_lists: bool = False) -> list[dict] | list[list]:
+        """Consume up to `limit` rows (all rows if None) into a list."""
+
+        rows = []
+
+        while limit is None or len(rows) < limit:
+            size  = self.batch_size if limit is None else min(self.batch_size, limit - len(rows))
+            batch = self.fetch(size, as_lists)
+
+            if not batch:
+
+                break
+
+            rows.extend(batch)
+
+        return rows
+
+    def read_arrow(self, limit: int | None = None) -> "pa.Table":
+        """Consume up to `limit` rows into an Arrow table, one record batch per fetchmany chunk."""
+
+        # Driver tuples go column-wise into Arrow arrays without the per-cell converters
+        # or per-row dicts; the builder is kept so every page shares one schema.
+        if self._arrow is None:
+            types       = self._arrow_types() if self._arrow_types is not None else None
+            self._arrow = ArrowBatchBuilder(self._col_names, types)
+
+        batches = []
+        read    = 0
+
+        while limit is None or read < limit:
+            size = self.batch_size if limit is None else min(self.batch_size, limit - read)
+            rows = self.fetch_raw(size)
+
+            if not rows:
+
+                break
+
+            batches.append(self._arrow.build(rows))
+            read += len(rows)
+
+        if not batches:
+            batches.append(self._arrow.build([]))
+
+        return self._arrow.pa.Table.from_batches(batches, schema=self._arrow.schema)
+
+    def has_more(self) -> bool:
+        """Check for unread rows, buffering at most one row to find out."""
+
+        if self._pending:
+
+            return True
+
+        if self.exhausted:
+
+            return False
+
+        chunk = self._fetchmany(1)
+
+        if not chunk:
+            self.exhausted = True
+
+            return False
+
+        self._pending.extend(chunk)
+
+        return True
+
+    def close(self) -> None:
+        """Close the cursor, end the transaction and return the connection to the pool."""
+
+        if self._closed:
+
+            return
+
+        self._closed = True
+        discard      = False
+
+        # A late cancel must never reach whichever call gets this connection next.
+        if self._query is not None:
+            self._query.detach()
+
+        try:
+            if self._reusable and not (self.exhausted and not self._failed):
+                self._pooled.statement_cursor = None     # only a fully read cursor goes back for reuse
+
+            if self._failed:
+                self._cursor.close()
+                self._pooled.conn.rollback()
+            elif self.exhausted:
+                if not self._reusable:
+                    self._cursor.close()
+
+                self._pooled.conn.commit()
+            else:
+                discard = not self._abandon(self._cursor)
+
+                if not discard:
+                    self._pooled.conn.commit()
+        except Exception:
+            discard = True
+        finally:
+            self._pool.release(self._pooled, discard=discard)
+
+    def _fetchmany(self, size: int) -> list[tuple]:
+        try:
+
+            return self._cursor.fetchmany(size)
+
+        except Exception:
+            self._failed   = True
+            self.exhausted = True
+            self.close()
+            raise
+
+    def _to_lists(self, raw_rows: list[tuple]) -> list[list]:
+        """Apply the per-column converters positionally; JSON-native columns are copied as-is."""
+
+        if not self._convert:
+
+            return [list(row) for row in raw_rows]
+
+        convert = self._convert
+        rows    = []
+
+        for row in raw_rows:
+            values = list(row)
+
+            for i, conv in convert:
+                value = values[i]
+
+                if value is not None:
+                    values[i] = conv(value)
+
+            rows.append(values)
+
+        return rows
+
+    def _to_dicts(self, raw_rows: list[tuple]) -> list[dict]:
+        names = self._col_names
+
+        return [dict(zip(names, values)) for values in self._to_lists(raw_rows)]
+
+    def __enter__(self) -> "RowStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -1,19 +1,41 @@
+import decimal
+import math
+import re
+from xml.etree import ElementTree
+
 import pyodbc
 
 from mcp_server._dataclasses.connection_config import ConnectionConfig
+from mcp_server._dataclasses.plan_estimate import PlanEstimate
+from mcp_server._dataclasses.pooled_connection import PooledConnection
 from mcp_server._dataclasses.query_result import ColumnMeta
+from mcp_server._dataclasses.running_query import RunningQuery
 from mcp_server._errors.connection_error import SqlConnectionError
+from mcp_server.connections.arrow_batch_builder import python_arrow_type
 from mcp_server.connections.base_adapter import BaseAdapter
+from mcp_server.connections.value_converters import (
+    Converter, JSON_NATIVE_TYPES, PYTHON_TYPE_CONVERTERS, serialize_value,
+)
 
 
 class SqlServerAdapter(BaseAdapter):
     """Adapter for Microsoft SQL Server via pyodbc."""
 
+    # SQLSTATE class 08 is "connection exception". The native codes cover AG failover
+    # (database not accessible on the new secondary) and dropped TCP sessions.
+    TRANSIENT_NATIVE_ERRORS = {976, 978, 983, 4060, 10053, 10054, 10060, 40613}
+    NATIVE_ERROR_PATTERN    = re.compile(r"\((\d+)\)")
+
+    SUPPORTS_EXPLAIN = True
+    SHOWPLAN_NS      = "{http://schemas.microsoft.com/sqlserver/2004/07/showplan}"
+    SCAN_OPERATORS   = {"Table Scan", "Clustered Index Scan", "Index Scan"}
+    MAX_OPERATORS    = 20
+
     def __init__(self, config: ConnectionConfig):
         super().__init__(config)
 
-    def connect(self) -> None:
-        """Establish a pyodbc connection."""
+    def _open_connection(self) -> object:
+        """Open a new pyodbc connection."""
 
         try:
             if self.config.trusted_connection:
@@ -32,78 +54,155 @@ class SqlServerAdapter(BaseAdapter):
                     f"PWD={self.config.password};"
                 )
 
-            self._conn = pyodbc.connect(conn_str, timeout=10)
+            return pyodbc.connect(conn_str, timeout=10)
+
         except pyodbc.Error as e:
             raise SqlConnectionError(self.config.name, str(e))
 
-    def disconnect(self) -> None:
-        """Close the pyodbc connection."""
+    def _use_database_sql(self, database: str) -> str:
+        return f"USE [{database}]"
 
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+    def _column_meta(self, description) -> list[ColumnMeta]:
+        """Map pyodbc cursor.description to ColumnMeta."""
 
-    def execute(self, sql: str, params: list | None = None) -> tuple[list[ColumnMeta], list[dict], int]:
-        """Execute SQL and return structured results."""
+        return [
+            ColumnMeta(
+                name     = col[0],
+                type     = col[1].__name__ if hasattr(col[1], "__name__") else str(col[1]),
+                nullable = col[6] if len(col) > 6 else True,
+            )
+            for col in description
+        ]
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
+    def _apply_timeout(self, pooled: PooledConnection, timeout: float | None) -> None:
+        """pyodbc's connection.timeout is SQL_ATTR_QUERY_TIMEOUT for statements run on it, in whole seconds."""
 
-        try:
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-
-            columns  = []
-            rows     = []
-            affected = cursor.rowcount
-
-            if cursor.description:
-                columns = [
-                    ColumnMeta(
-                        name     = col[0],
-                        type     = col[1].__name__ if hasattr(col[1], "__name__") else str(col[1]),
-                        nullable = col[6] if len(col) > 6 else True,
-                    )
-                    for col in cursor.description
-                ]
-
-                raw_rows = cursor.fetchall()
-                col_names = [c.name for c in columns]
-                rows = [
-                    {col_names[i]: self._serialize_value(row[i]) for i in range(len(col_names))}
-                    for row in raw_rows
-                ]
-                affected = len(rows)
-
-            self._conn.commit()
-
-            return columns, rows, affected
+        seconds = math.ceil(timeout) if timeout else 0
 
-        except pyodbc.Error as e:
-            self._conn.rollback()
-            raise
+        if (pooled.query_timeout or 0) != seconds:
+            pooled.conn.timeout  = seconds
+            pooled.query_timeout = seconds
+
+    def _is_transient(self, error: BaseException) -> bool:
+        if not isinstance(error, pyodbc.Error) or not error.args:
+
+            return False
+
+        if str(error.args[0]).startswith("08"):
+
+            return True
+
+        message = str(error.args[-1])
+
+        return any(int(code) in self.TRANSIENT_NATIVE_ERRORS for code in self.NATIVE_ERROR_PATTERN.findall(message))
+
+    def _explain(
+            self,
+            pooled: PooledConnection,
+            sql: str,
+            params: list | None,
+            query: RunningQuery | None ) -> PlanEstimate:
+        """With SHOWPLAN_XML on, the server compiles the batch and returns its estimated plan instead of running it."""
+
+        cursor = pooled.conn.cursor()
+
+        try:
+            self._attach(pooled, cursor, query)
+            cursor.execute("SET SHOWPLAN_XML ON")
+
+            try:
+                cursor.execute(sql, params) if params else cursor.execute(sql)
+                plan = cursor.fetchone()[0]
+            finally:
+                try:
+                    cursor.execute("SET SHOWPLAN_XML OFF")
+                except Exception:
+                    # A session stuck in showplan mode would answer every query with a plan; never pool it.
+                    self._close_connection(pooled.conn)
+                    raise
         finally:
             cursor.close()
 
+        return self._parse_showplan(plan)
+
+    @classmethod
+    def _parse_showplan(cls, plan_xml: str) -> PlanEstimate:
+        """Statement-level estimates plus one line per plan operator, flagging scans."""
+
+        ns       = cls.SHOWPLAN_NS
+        root     = ElementTree.fromstring(plan_xml)
+        stmt     = root.find(f".//{ns}StmtSimple")
+        estimate = PlanEstimate()
+
+        if stmt is not None:
+            estimate.estimated_rows = _as_float(stmt.get("StatementEstRows"))
+            estimate.estimated_cost = _as_float(stmt.get("StatementSubTreeCost"))
+
+        for op in root.iter(f"{ns}RelOp"):
+            physical = op.get("PhysicalOp", "?")
+            obj      = op.find(f"./*/{ns}Object")
+            name     = ".".join(obj.get(k) for k in ("Schema", "Table") if obj.get(k)) if obj is not None else ""
+            rows     = _as_float(op.get("EstimateRows")) or 0
+
+            if len(estimate.operators) < cls.MAX_OPERATORS:
+                estimate.operators.append(f"{physical} {name} (~{rows:,.0f} rows)".replace("  ", " "))
+
+            if physical in cls.SCAN_OPERATORS and name:
+                read = _as_float(op.get("TableCardinality") or op.get("EstimatedRowsRead")) or rows
+                estimate.full_scans.append(f"{name} (~{read:,.0f} rows read)")
+
+        return estimate
+
+    def quote_identifier(self, name: str) -> str:
+        return "[" + name.replace("]", "]]") + "]"
+
+    def _new_statement_cursor(self, conn: object) -> object:
+        """pyodbc re-prepares only when the SQL text changes; fast_executemany binds parameter arrays."""
+
+        cursor                  = conn.cursor()
+        cursor.fast_executemany = True
+
+        return cursor
+
+    def _converter_for(self, column) -> Converter | None:
+        """pyodbc reports the Python type of each column, so dispatch on it once per result set."""
+
+        py_type = column[1]
+
+        if py_type in JSON_NATIVE_TYPES:
+
+            return None
+
+        if py_type in (bytes, bytearray):
+
+            return self._binary_encoder
+
+        return PYTHON_TYPE_CONVERTERS.get(py_type, serialize_value)
+
+    def _arrow_type(self, pa, column) -> object | None:
+        """pyodbc reports each column's Python type, plus precision and scale for decimals."""
+
+        if column[1] is decimal.Decimal:
+            precision, scale = column[4], column[5]
+
+            return pa.decimal128(precision, scale) if precision and precision <= 38 and scale is not None else None
+
+        return python_arrow_type(pa, column[1])
+
     def get_databases(self) -> list[str]:
         """List all databases on the server."""
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
-        cursor.execute("SELECT name FROM sys.databases ORDER BY name")
-        results = [row[0] for row in cursor.fetchall()]
-        cursor.close()
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute("SELECT name FROM sys.databases ORDER BY name")
+            results = [row[0] for row in cursor.fetchall()]
+            cursor.close()
 
         return results
 
     def get_tables(self, database: str, schema: str | None = None) -> list[dict]:
         """List tables in a database, optionally filtered by schema."""
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
-
         sql = (
             f"SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE "
             f"FROM [{database}].INFORMATION_SCHEMA.TABLES "
@@ -116,21 +215,76 @@ class SqlServerAdapter(BaseAdapter):
 
         sql += "ORDER BY TABLE_SCHEMA, TABLE_NAME"
 
-        cursor.execute(sql, params) if params else cursor.execute(sql)
-        results = [
-            {"schema": row[0], "table": row[1], "type": row[2]}
-            for row in cursor.fetchall()
-        ]
-        cursor.close()
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(sql, params) if params else cursor.execute(sql)
+            results = [
+                {"schema": row[0], "table": row[1], "type": row[2]}
+                for row in cursor.fetchall()
+            ]
+            cursor.close()
 
         return results
 
+    def introspect_schema(self, database: str, schema: str | None = None) -> list[dict]:
+        """Bulk introspection in one batch: columns joined with tables, then index key columns."""
+
+        schema_filter = "AND t.TABLE_SCHEMA = ? " if schema else ""
+        index_filter  = "AND s.name = ? " if schema else ""
+
+        sql = (
+            f"SELECT t.TABLE_SCHEMA, t.TABLE_NAME, t.TABLE_TYPE, "
+            f"c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE, "
+            f"c.CHARACTER_MAXIMUM_LENGTH, c.COLUMN_DEFAULT, c.ORDINAL_POSITION "
+            f"FROM [{database}].INFORMATION_SCHEMA.TABLES t "
+            f"JOIN [{database}].INFORMATION_SCHEMA.COLUMNS c "
+            f"ON c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME "
+            f"WHERE 1 = 1 {schema_filter}"
+            f"ORDER BY t.TABLE_SCHEMA, t.TABLE_NAME, c.ORDINAL_POSITION; "
+            f"SELECT s.name, o.name, i.name, i.is_primary_key, i.is_unique, c.name, ic.key_ordinal "
+            f"FROM [{database}].sys.indexes i "
+            f"JOIN [{database}].sys.objects o ON o.object_id = i.object_id "
+            f"JOIN [{database}].sys.schemas s ON s.schema_id = o.schema_id "
+            f"JOIN [{database}].sys.index_columns ic "
+            f"ON ic.object_id = i.object_id AND ic.index_id = i.index_id "
+            f"JOIN [{database}].sys.columns c "
+            f"ON c.object_id = ic.object_id AND c.column_id = ic.column_id "
+            f"WHERE o.is_ms_shipped = 0 AND i.name IS NOT NULL AND ic.is_included_column = 0 {index_filter}"
+            f"ORDER BY s.name, o.name, i.name, ic.key_ordinal"
+        )
+        params = [schema, schema] if schema else []
+
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(sql, params) if params else cursor.execute(sql)
+            column_rows = cursor.fetchall()
+            index_rows  = cursor.fetchall() if cursor.nextset() else []
+            cursor.close()
+
+        return self._assemble_schema(column_rows, index_rows)
+
+    def schema_fingerprint(self, database: str) -> str | None:
+        """Object count and latest modify_date, plus column and index counts."""
+
+        sql = (
+            f"SELECT COUNT(*), CONVERT(varchar(33), MAX(o.modify_date), 126), "
+            f"(SELECT COUNT(*) FROM [{database}].sys.columns), "
+            f"(SELECT COUNT(*) FROM [{database}].sys.indexes) "
+            f"FROM [{database}].sys.objects o "
+            f"WHERE o.is_ms_shipped = 0"
+        )
+
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(sql)
+            row = cursor.fetchone()
+            cursor.close()
+
+        return "|".join(str(v) for v in row)
+
     def describe_table(self, database: str, table: str, schema: str | None = None) -> list[dict]:
         """Return column metadata for a table."""
 
-        self.ensure_connected()
-        cursor = self._conn.cursor()
-
         sql = (
             f"SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, "
             f"CHARACTER_MAXIMUM_LENGTH, COLUMN_DEFAULT, ORDINAL_POSITION "
@@ -145,32 +299,24 @@ class SqlServerAdapter(BaseAdapter):
 
         sql += "ORDER BY ORDINAL_POSITION"
 
-        cursor.execute(sql, params)
-        results = [
-            {
-                "column":     row[0],
-                "type":       row[1],
-                "nullable":   row[2] == "YES",
-                "max_length": row[3],
-                "default":    row[4],
-                "position":   row[5],
-            }
-            for row in cursor.fetchall()
-        ]
-        cursor.close()
+        with self.connection() as pooled:
+            cursor = pooled.conn.cursor()
+            cursor.execute(sql, params)
+            results = [
+                {
+                    "column":     row[0],
+                    "type":       row[1],
+                    "nullable":   row[2] == "YES",
+                    "max_length": row[3],
+                    "default":    row[4],
+                    "position":   row[5],
+                }
+                for row in cursor.fetchall()
+            ]
+            cursor.close()
 
         return results
 
-    @staticmethod
-    def _serialize_value(value) -> object:
-        """Coerce non-serializable types to strings."""
-
-        if value is None:
-
-            return None
-
-        if isinstance(value, (int, float, str, bool)):
-
-            return value
 
-        return str(value)
+def _as_float(value) -> float | None:
+    return float(value) if value not in (None, "") else None
@@ -0,0 +1,89 @@
+import base64
+import binascii
+import datetime
+import decimal
+import uuid
+from typing import Callable
+
+# Converters never see None; RowStream skips them for NULL cells.
+Converter = Callable[[object], object]
+
+
+def to_iso(value) -> str:
+    try:
+
+        return value.isoformat()
+
+    except AttributeError:
+
+        return str(value)
+
+
+def to_str(value) -> str:
+    return str(value)
+
+
+def bytes_to_base64(value) -> str:
+    return base64.b64encode(bytes(value)).decode("ascii")
+
+
+def bytes_to_hex(value) -> str:
+    return binascii.hexlify(bytes(value)).decode("ascii")
+
+
+def serialize_value(value) -> object:
+    """Generic fallback: pass JSON-native types through, encode the rest by type."""
+
+    if isinstance(value, (int, float, str, bool)) or value is None:
+
+        return value
+
+    converter = PYTHON_TYPE_CONVERTERS.get(type(value))
+
+    if converter is not None:
+
+        return converter(value)
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+
+        return bytes_to_base64(value)
+
+    if isinstance(value, (set, frozenset, list, tuple)):
+
+        return [serialize_value(v) for v in value]
+
+    return str(value)
+
+
+def binary_converter(encoding: str) -> Converter:
+    """Return the bytes encoder for a connection's binary_encoding setting."""
+
+    return bytes_to_hex if encoding == "hex" else bytes_to_base64
+
+
+def maybe_bytes(encode: Converter) -> Converter:
+    """Wrap a bytes encoder for columns whose driver may return either str or bytes."""
+
+    def convert(value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+
+            return encode(value)
+
+        return value
+
+    return convert
+
+
+PYTHON_TYPE_CONVERTERS: dict[type, Converter] = {
+    datetime.datetime:  to_iso,
+    datetime.date:      to_iso,
+    datetime.time:      to_iso,
+    datetime.timedelta: to_str,
+    decimal.Decimal:    to_str,
+    uuid.UUID:          to_str,
+    bytes:              bytes_to_base64,
+    bytearray:          bytes_to_base64,
+    memoryview:         bytes_to_base64,
+}
+
+JSON_NATIVE_TYPES = (int, float, str, bool)
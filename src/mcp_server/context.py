@@ -1,15 +1,30 @@
 import json
+import threading
 from pathlib import Path
 
+from mcp_server._dataclasses.batch_config import BatchConfig
+from mcp_server._dataclasses.warmup_config import WarmupConfig
 from mcp_server.connections.connection_manager import ConnectionManager
+from mcp_server.connections.cursor_registry import CursorRegistry
+from mcp_server.cache.metadata_cache import MetadataCache
+from mcp_server.cache.result_cache import ResultCache
+from mcp_server.cache.schema_snapshot_store import SchemaSnapshotStore
 from mcp_server.security.allowlist import Allowlist
 from mcp_server.security.query_validator import QueryValidator
+from mcp_server.security.rate_limiter import RateLimiter
 
 _config_path = Path(__file__).resolve().parent.parent.parent / "config.json"
 
 _connection_manager: ConnectionManager | None = None
 _allowlist:          Allowlist | None          = None
 _query_validator:    QueryValidator | None     = None
+_rate_limiter:       RateLimiter | None        = None
+_cursor_registry:    CursorRegistry | None     = None
+_metadata_cache:     MetadataCache | None      = None
+_schema_snapshots:   SchemaSnapshotStore | None = None
+_result_cache:       ResultCache | None        = None
+_batch_config:       BatchConfig | None        = None
+_init_lock          = threading.Lock()
 
 
 def _load_config() -> dict:
@@ -31,9 +46,10 @@ def get_connection_manager() -> ConnectionManager:
 
     global _connection_manager
 
-    if _connection_manager is None:
-        config              = _load_config()
-        _connection_manager = ConnectionManager(config["connections"])
+    with _init_lock:
+        if _connection_manager is None:
+            config              = _load_config()
+            _connection_manager = ConnectionManager(config["connections"])
 
     return _connection_manager
 
@@ -43,19 +59,146 @@ def get_allowlist() -> Allowlist:
 
     global _allowlist
 
-    if _allowlist is None:
-        config     = _load_config()
-        _allowlist = Allowlist(config["allowlist"])
+    with _init_lock:
+        if _allowlist is None:
+            config     = _load_config()
+            _allowlist = Allowlist(config["allowlist"])
 
     return _allowlist
 
 
+def get_rate_limiter() -> RateLimiter:
+    """Return the shared RateLimiter; connections without a rate_limits entry are unlimited."""
+
+    global _rate_limiter
+
+    with _init_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(_load_config().get("rate_limits", {}))
+
+    return _rate_limiter
+
+
 def get_query_validator() -> QueryValidator:
     """Return the shared QueryValidator."""
 
     global _query_validator
 
-    if _query_validator is None:
-        _query_validator = QueryValidator()
+    with _init_lock:
+        if _query_validator is None:
+            _query_validator = QueryValidator()
 
     return _query_validator
+
+
+def get_cursor_registry() -> CursorRegistry:
+    """Return the shared CursorRegistry for paginated results."""
+
+    global _cursor_registry
+
+    with _init_lock:
+        if _cursor_registry is None:
+            settings         = _load_config().get("cursors", {})
+            _cursor_registry = CursorRegistry(
+                ttl_seconds = float(settings.get("ttl_seconds", 300)),
+                max_open    = int(settings.get("max_open", 32)),
+            )
+
+    return _cursor_registry
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Return the shared MetadataCache for catalog lookups."""
+
+    global _metadata_cache
+
+    with _init_lock:
+        if _metadata_cache is None:
+            settings        = _load_config().get("metadata_cache", {})
+            _metadata_cache = MetadataCache(
+                ttl_seconds = float(settings.get("ttl_seconds", 300)),
+                max_entries = int(settings.get("max_entries", 1024)),
+                enabled     = bool(settings.get("enabled", True)),
+            )
+
+    return _metadata_cache
+
+
+def get_schema_snapshots() -> SchemaSnapshotStore:
+    """Return the shared on-disk SchemaSnapshotStore (disabled unless configured)."""
+
+    global _schema_snapshots
+
+    with _init_lock:
+        if _schema_snapshots is None:
+            settings  = _load_config().get("schema_snapshots", {})
+            directory = Path(settings.get("directory", ".schema_snapshots"))
+
+            if not directory.is_absolute():
+                directory = _config_path.parent / directory
+
+            _schema_snapshots = SchemaSnapshotStore(
+                directory               = directory,
+                enabled                 = bool(settings.get("enabled", False)),
+                verify_interval_seconds = float(settings.get("verify_interval_seconds", 30)),
+            )
+
+    return _schema_snapshots
+
+
+def get_result_cache() -> ResultCache:
+    """Return the shared ResultCache. Each connection opts in via its result_cache block."""
+
+    global _result_cache
+
+    with _init_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache()
+
+    return _result_cache
+
+
+def get_import_directory() -> Path | None:
+    """Directory bulk_insert may read files from, or None when file imports are disabled."""
+
+    directory = _load_config().get("bulk_insert", {}).get("import_directory")
+
+    if not directory:
+
+        return None
+
+    path = Path(directory)
+
+    return path if path.is_absolute() else _config_path.parent / path
+
+
+def get_export_directory() -> Path | None:
+    """Directory export_query may write files to, or None when exports are disabled."""
+
+    directory = _load_config().get("export", {}).get("directory")
+
+    if not directory:
+
+        return None
+
+    path = Path(directory)
+
+    return path if path.is_absolute() else _config_path.parent / path
+
+
+def get_batch_config() -> BatchConfig:
+    """Return execute_batch limits from the top-level batch block."""
+
+    global _batch_config
+
+    with _init_lock:
+        if _batch_config is None:
+            _batch_config = BatchConfig.from_dict(_load_config().get("batch", {}))
+
+    return _batch_config
+
+
+def get_warmup_config() -> WarmupConfig:
+    """Return start-up warm-up settings from the top-level warmup block."""
+
+    return WarmupConfig.from_dict(_load_config().get("warmup", {}))
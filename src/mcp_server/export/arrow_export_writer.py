@@ -0,0 +1,37 @@
+from mcp_server.connections.arrow_batch_builder import ArrowBatchBuilder
+from mcp_server.export.export_writer import ExportWriter
+
+
+class ArrowExportWriter(ExportWriter):
+    """Arrow IPC file. Each batch becomes one record batch; column types come from the driver."""
+
+    SUFFIXES      = (".arrow", ".feather")
+    NATIVE_VALUES = True
+
+    def __init__(self, path, columns, arrow_types=None):
+        super().__init__(path, columns, arrow_types)
+        self._builder = ArrowBatchBuilder([c.name for c in columns], arrow_types)
+        self._writer  = None
+
+    def write(self, rows: list) -> None:
+        batch = self._builder.build(rows)
+
+        # The schema is only final after the first batch, so the file opens lazily.
+        if self._writer is None:
+            self._writer = self._open(batch.schema)
+
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        if self._writer is None:
+            self._writer = self._open(self._builder.build([]).schema)
+
+        self._writer.close()
+
+    def file_types(self) -> list[str] | None:
+        schema = self._builder.schema
+
+        return [str(t) for t in schema.types] if schema is not None else None
+
+    def _open(self, schema):
+        return self._builder.pa.ipc.new_file(str(self.path), schema)
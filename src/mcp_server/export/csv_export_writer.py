@@ -0,0 +1,21 @@
+import csv
+
+from mcp_server.export.export_writer import ExportWriter
+
+
+class CsvExportWriter(ExportWriter):
+    """CSV with a header row; NULL is an empty field, as bulk_insert reads it back."""
+
+    SUFFIXES = (".csv",)
+
+    def __init__(self, path, columns, arrow_types=None):
+        super().__init__(path, columns, arrow_types)
+        self._file   = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([c.name for c in columns])
+
+    def write(self, rows: list) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from mcp_server._dataclasses.query_result import ColumnMeta
+
+
+class ExportWriter(ABC):
+    """Streams row batches into one output file."""
+
+    SUFFIXES:      tuple[str, ...] = ()
+    NATIVE_VALUES: bool            = False     # True: raw driver tuples; False: JSON-safe value lists
+
+    def __init__(self, path: Path, columns: list[ColumnMeta], arrow_types: list | None = None):
+        self.path        = path
+        self.columns     = columns
+        self.arrow_types = arrow_types
+
+    @abstractmethod
+    def write(self, rows: list) -> None:
+        """Append one batch of rows in column order."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file. Called once, also when nothing was written."""
+        ...
+
+    def file_types(self) -> list[str] | None:
+        """Column types as stored in the file, for formats that carry their own schema."""
+
+        return None
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
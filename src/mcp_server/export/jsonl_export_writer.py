@@ -0,0 +1,24 @@
+import json
+
+from mcp_server.export.export_writer import ExportWriter
+
+
+class JsonlExportWriter(ExportWriter):
+    """One JSON object per row, keyed by column name."""
+
+    SUFFIXES = (".jsonl", ".ndjson")
+
+    def __init__(self, path, columns, arrow_types=None):
+        super().__init__(path, columns, arrow_types)
+        self._file  = open(path, "w", encoding="utf-8")
+        self._names = [c.name for c in columns]
+
+    def write(self, rows: list) -> None:
+        names = self._names
+
+        self._file.writelines(
+            json.dumps(dict(zip(names, row)), separators=(",", ":"), default=str) + "\n" for row in rows
+        )
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,43 @@
+from mcp_server.export.arrow_export_writer import ArrowExportWriter
+
+
+class ParquetExportWriter(ArrowExportWriter):
+    """Parquet file. Batches are grouped into row groups of about ROW_GROUP_ROWS rows."""
+
+    SUFFIXES       = (".parquet",)
+    ROW_GROUP_ROWS = 65536      # one row group per fetch batch would make files slow to scan
+
+    def __init__(self, path, columns, arrow_types=None):
+        super().__init__(path, columns, arrow_types)
+        self._pending      = []
+        self._pending_rows = 0
+
+    def write(self, rows: list) -> None:
+        batch = self._builder.build(rows)
+
+        if self._writer is None:
+            self._writer = self._open(batch.schema)
+
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+
+        if self._pending_rows >= self.ROW_GROUP_ROWS:
+            self._flush()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._flush()
+
+        super().close()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._writer.write_table(self._builder.pa.Table.from_batches(self._pending))
+
+        self._pending      = []
+        self._pending_rows = 0
+
+    def _open(self, schema):
+        import pyarrow.parquet
+
+        return pyarrow.parquet.ParquetWriter(str(self.path), schema)
@@ -1,9 +1,19 @@
+import hashlib
 import re
-import sqlparse
-from sqlparse.sql import Statement
-from sqlparse.tokens import Keyword, DML, DDL
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
+from mcp_server._dataclasses.ddl_target import DdlTarget
+from mcp_server._dataclasses.sql_analysis import SqlAnalysis
 from mcp_server._errors.query_validation_error import QueryValidationError
+from mcp_server.security import sql_lexer
+
+if TYPE_CHECKING:
+    from sqlparse.sql import Statement
+
+# sqlparse is imported where it is used: most statements never reach it (see sql_lexer),
+# so a freshly spawned server does not pay for it at start-up.
 
 
 class QueryValidator:
@@ -18,23 +28,55 @@ class QueryValidator:
     ALLOWED_FOR_DELETE  = {"DELETE"}
     ALLOWED_FOR_DROP    = {"DROP"}
 
-    def detect_statement_type(self, sql: str) -> str:
-        """Parse SQL and return the primary statement type."""
+    DDL_TYPES = {"CREATE", "ALTER", "DROP"}
+
+    _IDENT_PART = r'(?:\[[^\]]*\]|`[^`]*`|"[^"]*"|[^\s(;,.\[`"]+)'
+
+    _DDL_PATTERN = re.compile(
+        r"^\s*(CREATE|ALTER|DROP)\s+"
+        r"(?:OR\s+(?:ALTER|REPLACE)\s+)?"
+        r"(?:(?:UNIQUE|CLUSTERED|NONCLUSTERED|TEMPORARY|TEMP)\s+)*"
+        r"(TABLE|VIEW|INDEX|DATABASE|SCHEMA|PROCEDURE|PROC|FUNCTION|TRIGGER)\s+"
+        r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+        rf"({_IDENT_PART}(?:\.{_IDENT_PART})*)",
+        re.IGNORECASE,
+    )
+    _INDEX_ON_PATTERN = re.compile(rf"\bON\s+({_IDENT_PART}(?:\.{_IDENT_PART})*)", re.IGNORECASE)
+
+    _OBJECT_KEYWORDS = {"FROM", "JOIN", "INTO", "UPDATE", "TABLE", "USING"}
+
+    def __init__(self, cache_size: int = 256):
+        self.cache_size = max(1, cache_size)
+        self._analyses: OrderedDict[bytes, SqlAnalysis] = OrderedDict()
+        self._lock      = threading.Lock()
+
+    def analyze(self, sql: str) -> SqlAnalysis:
+        """Parse SQL once and memoize the analysis. Validators and tools share the result."""
 
-        parsed = sqlparse.parse(sql.strip())
+        key = hashlib.blake2b(sql.encode("utf-8"), digest_size=16).digest()
 
-        if not parsed:
+        with self._lock:
+            analysis = self._analyses.get(key)
 
-            return "UNKNOWN"
+            if analysis is not None:
+                self._analyses.move_to_end(key)
 
-        stmt      = parsed[0]
-        stmt_type = stmt.get_type()
+                return analysis
 
-        if stmt_type:
+        analysis = self._analyze(sql)
 
-            return stmt_type.upper()
+        with self._lock:
+            self._analyses[key] = analysis
 
-        return self._fallback_detect(sql)
+            while len(self._analyses) > self.cache_size:
+                self._analyses.popitem(last=False)
+
+        return analysis
+
+    def detect_statement_type(self, sql: str) -> str:
+        """Parse SQL and return the primary statement type."""
+
+        return self.analyze(sql).statement_type
 
     def validate_query(self, sql: str) -> str:
         """Validate SQL is a SELECT. Returns the statement type."""
@@ -72,7 +114,8 @@ class QueryValidator:
     def validate_delete(self, sql: str) -> str:
         """Validate SQL is a DELETE statement specifically."""
 
-        stmt_type = self.detect_statement_type(sql)
+        analysis  = self.analyze(sql)
+        stmt_type = analysis.statement_type
 
         if stmt_type not in self.ALLOWED_FOR_DELETE:
             raise QueryValidationError(
@@ -80,7 +123,7 @@ class QueryValidator:
                 f"delete_statement only allows DELETE. Got: {stmt_type}",
             )
 
-        if not self._has_where_clause(sql):
+        if not analysis.has_where:
             raise QueryValidationError(
                 stmt_type,
                 "DELETE without WHERE clause is not allowed. Add a WHERE clause.",
@@ -104,15 +147,164 @@ class QueryValidator:
     def validate_no_multi_statement(self, sql: str) -> None:
         """Reject SQL containing multiple statements (injection prevention)."""
 
-        parsed = sqlparse.parse(sql.strip())
-        real   = [s for s in parsed if s.ttype is not sqlparse.tokens.Whitespace and str(s).strip()]
-
-        if len(real) > 1:
+        if self.analyze(sql).statement_count > 1:
             raise QueryValidationError(
                 "MULTI",
                 "Multiple statements detected. Submit one statement at a time.",
             )
 
+    @staticmethod
+    def validate_params(params: list | None) -> list | None:
+        """Check bind parameters are a flat list of JSON scalars for the ? placeholders."""
+
+        if params is None:
+
+            return None
+
+        if not isinstance(params, (list, tuple)):
+            raise ValueError("params must be a list of values bound to ? placeholders, in order.")
+
+        for value in params:
+            if value is not None and not isinstance(value, (str, int, float, bool)):
+                raise ValueError(f"Unsupported parameter value {value!r}. Use strings, numbers, booleans or null.")
+
+        return list(params)
+
+    def extract_ddl_target(self, sql: str) -> DdlTarget | None:
+        """Identify the object a CREATE/ALTER/DROP changes. None for non-DDL statements."""
+
+        return self.analyze(sql).ddl_target
+
+    def referenced_objects(self, sql: str) -> tuple[str, ...]:
+        """Tables and views the statement names. Parses with sqlparse on first request."""
+
+        analysis = self.analyze(sql)
+
+        if analysis.referenced_objects is None:
+            import sqlparse
+
+            parsed = sqlparse.parse(sql.strip())
+            analysis.referenced_objects = self._referenced_objects(parsed[0]) if parsed else ()
+
+        return analysis.referenced_objects
+
+    def _analyze(self, sql: str) -> SqlAnalysis:
+        fast = sql_lexer.classify(sql)
+
+        if fast is not None:
+            statement_count, stmt_type = fast
+            referenced                 = None
+        else:
+            import sqlparse
+
+            parsed = sqlparse.parse(sql.strip())
+            real   = [s for s in parsed if s.ttype is not sqlparse.tokens.Whitespace and str(s).strip()]
+
+            if not parsed:
+
+                return SqlAnalysis(statement_count=0, statement_type="UNKNOWN", has_where=False, referenced_objects=())
+
+            statement_count = len(real)
+            stmt_type       = (parsed[0].get_type() or "").upper() or self._fallback_detect(sql)
+            referenced      = self._referenced_objects(parsed[0])
+
+        return SqlAnalysis(
+            statement_count    = statement_count,
+            statement_type     = stmt_type,
+            has_where          = self._has_where_clause(sql),
+            referenced_objects = referenced,
+            ddl_target         = self._ddl_target(sql, stmt_type),
+        )
+
+    def _ddl_target(self, sql: str, stmt_type: str) -> DdlTarget | None:
+        match = self._DDL_PATTERN.match(self._strip_leading_comments(sql))
+
+        if match is None:
+
+            return DdlTarget(action=stmt_type, object_type="UNKNOWN") if stmt_type in self.DDL_TYPES else None
+
+        action, object_type, name = match.group(1).upper(), match.group(2).upper(), match.group(3)
+
+        if object_type == "INDEX":
+            on_match = self._INDEX_ON_PATTERN.search(sql, match.end())
+            name     = on_match.group(1) if on_match else None
+        elif re.match(r"\s*,", sql[match.end():]):
+            name = None     # DROP TABLE a, b — more than one object
+
+        parts = self._split_identifier(name) if name else []
+
+        return DdlTarget(
+            action      = action,
+            object_type = "PROCEDURE" if object_type == "PROC" else object_type,
+            name        = parts[-1] if parts else None,
+            schema      = parts[-2] if len(parts) > 1 else None,
+        )
+
+    @classmethod
+    def _referenced_objects(cls, statement: "Statement") -> tuple[str, ...]:
+        """Tables and views named after FROM/JOIN/INTO/UPDATE/TABLE, minus CTE names."""
+
+        found: list[str] = []
+        ctes:  set[str]  = set()
+        cls._collect_objects(statement, found, ctes)
+
+        return tuple(dict.fromkeys(name for name in found if name.lower() not in ctes))
+
+    @classmethod
+    def _collect_objects(cls, token_list, found: list[str], ctes: set[str]) -> None:
+        from sqlparse.sql import Function, Identifier, IdentifierList, Parenthesis
+        from sqlparse.tokens import CTE, DML, Comment, Keyword
+
+        expect = None
+
+        for token in token_list.tokens:
+            if token.is_whitespace or token.ttype in Comment:
+
+                continue
+
+            if token.ttype in CTE:
+                expect = "cte"
+
+                continue
+
+            if token.ttype in Keyword or token.ttype in DML:
+                value  = token.normalized
+                expect = "object" if value in cls._OBJECT_KEYWORDS or value.endswith("JOIN") else None
+
+                continue
+
+            if expect and isinstance(token, (Identifier, IdentifierList, Function)):
+                items = token.get_identifiers() if isinstance(token, IdentifierList) else [token]
+
+                for item in items:
+                    if not isinstance(item, (Identifier, Function)) or isinstance(item.token_first(), Parenthesis):
+
+                        continue
+
+                    if expect == "cte":
+                        ctes.add((item.get_name() or "").lower())
+                    else:
+                        parent = (item.get_parent_name() or "").strip('[]`"')
+                        name   = (item.get_real_name() or "").strip('[]`"')
+
+                        if name:
+                            found.append(f"{parent}.{name}" if parent else name)
+
+            expect = None
+
+            if token.is_group:
+                cls._collect_objects(token, found, ctes)
+
+    @staticmethod
+    def _split_identifier(name: str) -> list[str]:
+        """Split a possibly quoted, dotted identifier into its parts."""
+
+        return [part.strip('[]`"') for part in re.findall(QueryValidator._IDENT_PART, name)]
+
+    @staticmethod
+    def _strip_leading_comments(sql: str) -> str:
+        return re.sub(r"^(?:\s*(?:--[^\n]*(?:\n|$)|/\*.*?\*/))*", "", sql, flags=re.DOTALL)
+
     @staticmethod
     def _has_where_clause(sql: str) -> bool:
         """Check if a SQL statement contains a WHERE clause."""
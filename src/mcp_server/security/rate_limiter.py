@@ -0,0 +1,295 @@
+import asyncio
+import threading
+import time
+
+from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server._dataclasses.rate_limit_config import RateLimitConfig
+from mcp_server._errors.rate_limit_error import SqlRateLimitError
+from mcp_server.connections.request_scheduler import RequestScheduler
+
+
+class _TokenBucket:
+    """Refills at `rate` tokens per second up to `capacity`. Usage charged after the fact may drive it negative."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate     = rate
+        self.capacity = capacity
+        self.tokens   = capacity
+        self.updated  = time.monotonic()
+
+    def wait_for(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 when they already are)."""
+
+        self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.tokens -= amount
+
+
+class _Scope:
+    """The buckets and in-flight row count behind one connection's, or one tool's, limits."""
+
+    def __init__(self, label: str, config: RateLimitConfig):
+        window              = config.window_seconds
+        self.label          = label
+        self.config         = config
+        self.rows_in_flight = 0
+        self.queries        = None
+        self.rows           = None
+        self.bytes          = None
+
+        if config.queries_per_second:
+            self.queries = _TokenBucket(
+                config.queries_per_second, config.burst or max(1, int(config.queries_per_second)),
+            )
+
+        # A window budget refills continuously, so it behaves like a sliding window over window_seconds.
+        if config.max_rows_per_window:
+            self.rows  = _TokenBucket(config.max_rows_per_window / window, config.max_rows_per_window)
+
+        if config.max_bytes_per_window:
+            self.bytes = _TokenBucket(config.max_bytes_per_window / window, config.max_bytes_per_window)
+
+    def wait(self, now: float, queries: bool = True) -> tuple[float, str]:
+        """Seconds until this scope admits one more call, and which limit is binding."""
+
+        config = self.config
+        waits  = [(0.0, "")]
+
+        if queries and self.queries is not None:
+            waits.append((self.queries.wait_for(1, now), f"{config.queries_per_second:g} queries/s"))
+
+        if self.rows is not None:
+            waits.append((self.rows.wait_for(1, now),
+                          f"{config.max_rows_per_window:,} rows per {config.window_seconds:g}s"))
+
+        if self.bytes is not None:
+            waits.append((self.bytes.wait_for(1, now),
+                          f"{config.max_bytes_per_window:,} bytes per {config.window_seconds:g}s"))
+
+        return max(waits)
+
+    def rows_available(self) -> int | None:
+        if not self.config.max_concurrent_rows:
+
+            return None
+
+        return self.config.max_concurrent_rows - self.rows_in_flight
+
+
+class Permit:
+    """Admission for one tool call. Charge what it returned, then release it (or use it as a context manager)."""
+
+    def __init__(self, limiter: "RateLimiter", scopes: list[_Scope], rows: int | None, reserved: int, delay: float):
+        self.rows          = rows          # page size to use; may be smaller than requested
+        self.delay_seconds = delay
+        self._limiter      = limiter
+        self._scopes       = scopes
+        self._reserved     = reserved
+
+    def charge(self, rows: int, nbytes: int) -> None:
+        """Count returned rows and payload bytes against the window budgets."""
+
+        with self._limiter._condition:
+            for scope in self._scopes:
+                if scope.rows is not None:
+                    scope.rows.take(rows)
+
+                if scope.bytes is not None:
+                    scope.bytes.take(nbytes)
+
+    def annotate(self, result: QueryResult) -> None:
+        """Mention a rate-limit delay in the result's message."""
+
+        if self.delay_seconds:
+            note           = f"Delayed {self.delay_seconds * 1000:.0f} ms by rate limits."
+            result.message = f"{result.message} {note}".strip()
+
+    def settle(self, rows: int) -> None:
+        """Shrink the row reservation to the rows the finished call actually holds."""
+
+        self._free(self._reserved - min(rows, self._reserved))
+
+    def release(self) -> None:
+        """Return the permit's row reservation."""
+
+        self._free(self._reserved)
+
+    def _free(self, rows: int) -> None:
+        if rows <= 0:
+
+            return
+
+        with self._limiter._condition:
+            for scope in self._scopes:
+                if scope.config.max_concurrent_rows:
+                    scope.rows_in_flight -= rows
+
+            self._reserved -= rows
+            self._limiter._condition.notify_all()
+
+    def __enter__(self) -> "Permit":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class RateLimiter:
+    """Token-bucket limits per connection and per tool, from the top-level rate_limits block."""
+
+    def __init__(self, rate_limits_config: dict):
+        self._configs:  dict[str, RateLimitConfig]            = {}
+        self._scopes:   dict[tuple[str, str | None], _Scope]  = {}
+        self._condition = threading.Condition()
+
+        for conn_name, limits in rate_limits_config.items():
+            self._configs[conn_name] = RateLimitConfig.from_dict(limits)
+
+    async def wait_async(self, connection_name: str, tool: str) -> float:
+        """Sleep until the query and window budgets admit one more call, before it takes a scheduler slot.
+
+        Takes the call's query token; admit() on the worker then only reserves rows. Returns the
+        seconds waited, or raises SqlRateLimitError when that would exceed max_delay_seconds.
+        """
+
+        scopes = self._scopes_for(connection_name, tool)
+
+        if not scopes:
+
+            return 0.0
+
+        start    = time.monotonic()
+        deadline = start + min(scope.config.max_delay_seconds for scope in scopes)
+        delayed  = False
+
+        while True:
+            with self._condition:
+                blocked = self._blocked(scopes, 0, time.monotonic())
+
+                if blocked is None:
+                    self._reserve(scopes, 0)
+
+                    return time.monotonic() - start if delayed else 0.0
+
+            wait, reason = blocked
+
+            if wait > deadline - time.monotonic():
+
+                raise SqlRateLimitError(connection_name, f"{reason} exceeded. Retry in {wait:.2f}s.", wait)
+
+            await asyncio.sleep(wait)
+            delayed = True
+
+    def admit(self, connection_name: str, tool: str, rows: int | None = 0) -> Permit:
+        """Wait for capacity (up to max_delay_seconds) or raise SqlRateLimitError.
+
+        rows is the page size a fetching call asks for: None for unbounded, 0 for calls that
+        return no result rows. Under max_concurrent_rows the permit's rows may come back smaller.
+
+        A call already admitted by a connection's scheduler never waits here, since it would hold
+        the slot: its delay was served by wait_async, and without slack it is refused at once.
+        """
+
+        scopes = self._scopes_for(connection_name, tool)
+
+        if not scopes:
+
+            return Permit(self, [], rows, 0, 0.0)
+
+        admission = RequestScheduler.current()
+        prepaid   = admission is not None and admission.throttled_ms is not None
+        throttled = admission.throttled_ms / 1000 if prepaid else 0.0
+        start     = time.monotonic()
+        deadline  = start if admission is not None else start + min(scope.config.max_delay_seconds for scope in scopes)
+        delayed   = False
+
+        with self._condition:
+            while (blocked := self._blocked(scopes, rows, time.monotonic(), queries=not prepaid)) is not None:
+                wait, reason = blocked
+                remaining    = deadline - time.monotonic()
+
+                if wait is None and remaining <= 0 or wait is not None and wait > remaining:
+                    retry = f"Retry in {wait:.2f}s." if wait is not None else "Retry when running fetches finish."
+
+                    raise SqlRateLimitError(connection_name, f"{reason} exceeded. {retry}", wait)
+
+                # Releases notify, so waiting on in-flight rows ends as soon as a fetch finishes.
+                self._condition.wait(remaining if wait is None else wait)
+                delayed = True
+
+            granted, reserved = self._reserve(scopes, rows, queries=not prepaid)
+
+        return Permit(self, scopes, granted, reserved, (time.monotonic() - start if delayed else 0.0) + throttled)
+
+    @staticmethod
+    def _blocked(
+            scopes: list[_Scope],
+            rows: int | None,
+            now: float,
+            queries: bool = True ) -> tuple[float | None, str] | None:
+        """None if a call can start now, else (seconds to wait, or None to wait for a release; reason)."""
+
+        waits = []
+
+        for scope in scopes:
+            wait, limit = scope.wait(now, queries)
+
+            if wait:
+                waits.append((wait, f"{scope.label} limit of {limit}"))
+
+            available = scope.rows_available()
+
+            if rows != 0 and available is not None and available <= 0:
+
+                return None, f"{scope.label} limit of {scope.config.max_concurrent_rows:,} rows in flight"
+
+        return max(waits) if waits else None
+
+    @staticmethod
+    def _reserve(scopes: list[_Scope], rows: int | None, queries: bool = True) -> tuple[int | None, int]:
+        """Take a query token from every scope and reserve in-flight rows. Returns (page rows, reserved)."""
+
+        available = [n for n in (scope.rows_available() for scope in scopes) if n is not None]
+        granted   = rows
+        reserved  = 0
+
+        if rows != 0 and available:
+            granted  = min([rows, *available]) if rows else min(available)
+            reserved = granted
+
+        for scope in scopes:
+            if queries and scope.queries is not None:
+                scope.queries.take(1)
+
+            if scope.config.max_concurrent_rows:
+                scope.rows_in_flight += reserved
+
+        return granted, reserved
+
+    def _scopes_for(self, connection_name: str, tool: str) -> list[_Scope]:
+        """The connection-wide scope and the tool's own scope, where configured."""
+
+        config = self._configs.get(connection_name)
+
+        if config is None:
+
+            return []
+
+        scopes = []
+
+        # Buckets live as long as the limiter, so limits hold across calls.
+        with self._condition:
+            for key, limits in ((None, config), (tool, config.tools.get(tool))):
+                if limits is None or not limits.enabled:
+                    continue
+
+                if (connection_name, key) not in self._scopes:
+                    self._scopes[(connection_name, key)] = _Scope(key or "connection", limits)
+
+                scopes.append(self._scopes[(connection_name, key)])
+
+        return scopes
@@ -0,0 +1,183 @@
+import re
+
+# Leading keywords the fast path classifies on its own. Anything else goes to sqlparse.
+STATEMENT_KEYWORDS = {
+    "SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "REPLACE",
+    "CREATE", "ALTER", "DROP", "TRUNCATE",
+}
+CTE_BODY_KEYWORDS = {"SELECT", "INSERT", "UPDATE", "DELETE", "MERGE"}
+
+# Words that change where sqlparse splits statements: GO separates batches, BEGIN and
+# DECLARE open blocks whose semicolons do not split, DELIMITER redefines the separator.
+DEFER_KEYWORDS = {"GO", "BEGIN", "DECLARE", "DELIMITER"}
+
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_@$#]*")
+
+
+def classify(sql: str) -> tuple[int, str] | None:
+    """Return (statement_count, statement_type), or None when the fast path is unsure."""
+
+    # Constructs the dialects disagree on (backslash escapes, `#` comments vs temp
+    # tables, dollar quoting, nested comments, BEGIN...END bodies, GO batches) and
+    # non-ASCII identifiers defer to sqlparse, so the fast path is never looser than it.
+
+    i, n        = 0, len(sql)
+    depth       = 0
+    statements  = 0
+    pending     = False     # the current statement has content
+    first_word  = None
+    in_cte      = False
+    stmt_type   = None
+
+    while i < n:
+        ch = sql[i]
+
+        if ch in " \t\r\n\f\v":
+            i += 1
+
+            continue
+
+        if ch == "-" and sql.startswith("--", i):
+            if statements:
+
+                return None     # sqlparse counts some trailing comments as statements
+
+            end = sql.find("\n", i)
+            i   = n if end < 0 else end + 1
+
+            continue
+
+        if ch == "/" and sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+
+            if statements or end < 0 or sql.find("/*", i + 2, end) >= 0:
+
+                return None
+
+            i = end + 2
+
+            continue
+
+        if ch in "#$\\" or not ch.isascii():
+
+            return None
+
+        if first_word is None and not ch.isalpha() and ch != "_":
+
+            return None         # leading punctuation, e.g. "(SELECT 1) UNION (SELECT 2)"
+
+        if ch in "'\"`[":
+            close = "]" if ch == "[" else ch
+            start = i
+            i     = _skip_quoted(sql, i + 1, close, backslash_unsafe=ch != "[")
+
+            if i < 0:
+
+                return None
+
+            # sqlparse only reads [name] after a separator, and without "[" or "]]" inside;
+            # otherwise it lexes the brackets as punctuation and the contents as words.
+            if ch == "[" and (
+                    start and (sql[start - 1].isalnum() or sql[start - 1] in "_])")
+                    or i - start == 2 or "[" in sql[start + 1:i - 1] or "]]" in sql[start + 1:i - 1]):
+
+                return None
+
+            pending = True
+
+            continue
+
+        if ch == "(":
+            depth  += 1
+            pending = True
+            i      += 1
+
+            continue
+
+        if ch == ")":
+            depth  -= 1
+            pending = True
+            i      += 1
+
+            if depth < 0:
+
+                return None
+
+            continue
+
+        if ch == ";":
+            if depth != 0:
+
+                return None
+
+            statements += 1     # like sqlparse, a bare ";" is a statement of its own
+            pending     = False
+            i      += 1
+
+            continue
+
+        match = _WORD.match(sql, i)
+
+        if match is None:
+            pending = True
+            i      += 1
+
+            continue
+
+        word    = match.group(0).upper()
+        pending = True
+        i       = match.end()
+
+        if word in DEFER_KEYWORDS:
+
+            return None
+
+        if first_word is None:
+            first_word = word
+
+            if word == "WITH":
+                in_cte = True
+            elif word in STATEMENT_KEYWORDS:
+                stmt_type = word
+            else:
+
+                return None
+
+            continue
+
+        if in_cte and stmt_type is None and depth == 0 and word in CTE_BODY_KEYWORDS:
+            stmt_type = word
+
+    if pending:
+        statements += 1
+
+    if stmt_type is None:
+
+        return None
+
+    return statements, stmt_type
+
+
+def _skip_quoted(sql: str, start: int, close: str, backslash_unsafe: bool) -> int:
+    """Return the index just past the closing quote, or -1 if unterminated or ambiguous."""
+
+    i, n = start, len(sql)
+
+    while i < n:
+        ch = sql[i]
+
+        if ch == "\\" and backslash_unsafe:
+
+            return -1       # MySQL treats it as an escape, SQL Server does not
+
+        if ch == close:
+            if i + 1 < n and sql[i + 1] == close:
+                i += 2      # doubled quote escapes itself
+
+                continue
+
+            return i + 1
+
+        i += 1
+
+    return -1
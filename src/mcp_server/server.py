@@ -7,6 +7,7 @@ if str(_src_dir) not in sys.path:
 
 from mcp.server import FastMCP
 from mcp_server.tools.tools_manager import ToolsManager
+from mcp_server.warmup import warm_up
 
 server = FastMCP("SQL Executor MCP Server")
 tools  = ToolsManager(server)
@@ -14,6 +15,7 @@ tools.populate_tools()
 
 
 def run():
+    warm_up()
     server.run()
 
 
@@ -0,0 +1,60 @@
+import functools
+import inspect
+import json
+from typing import Awaitable, Callable
+
+from mcp_server.context import get_connection_manager, get_rate_limiter
+from mcp_server._errors.rate_limit_error import SqlRateLimitError
+from mcp_server._errors.scheduler_error import SqlSchedulerError
+
+
+def make_async_tool(
+        fn: Callable[..., str],
+        lane: str = "query",
+        control: bool = False,
+        rate_limited: bool = False ) -> Callable[..., Awaitable[str]]:
+    """Wrap a sync tool so its blocking body runs on the connection's executor, admitted through `lane`.
+
+    A rate_limited tool serves any rate-limit delay here, before it queues for a scheduler slot.
+    """
+
+    if inspect.iscoroutinefunction(fn):
+
+        return fn
+
+    if control:
+        # Control calls get their own executor so they never queue behind the work they stop.
+        @functools.wraps(fn)
+        async def control_wrapper(*args, **kwargs) -> str:
+
+            return await get_connection_manager().run_control(fn, *args, **kwargs)
+
+        return control_wrapper
+
+    signature = inspect.signature(fn)
+
+    # wraps() keeps the signature FastMCP builds the tool's argument schema from.
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> str:
+        bound           = signature.bind_partial(*args, **kwargs)
+        connection_name = bound.arguments.get("connection_name")
+
+        try:
+            throttled = None
+
+            if rate_limited and connection_name:
+                throttled = await get_rate_limiter().wait_async(connection_name, fn.__name__) * 1000
+
+            return await get_connection_manager().run_async(
+                connection_name, fn, *args, lane=lane, throttled_ms=throttled, **kwargs,
+            )
+
+        except (SqlSchedulerError, SqlRateLimitError) as e:
+
+            return json.dumps({
+                "success":    False,
+                "connection": connection_name,
+                "message":    f"{type(e).__name__}: {e}",
+            }, indent=2)
+
+    return wrapper
@@ -0,0 +1,182 @@
+import csv
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from mcp_server.context import get_connection_manager, get_allowlist, get_result_cache, get_import_directory
+from mcp_server.context import get_rate_limiter
+from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server._errors.bulk_insert_error import SqlBulkInsertError
+from mcp_server.connections.request_scheduler import RequestScheduler
+
+
+def bulk_insert(
+        connection_name: str,
+        table: str,
+        columns: list[str] | None = None,
+        rows: list[list] | None = None,
+        file_path: str | None = None,
+        database: str | None = None,
+        schema: str | None = None,
+        batch_size: int | None = None ) -> str:
+    """Insert many rows from row arrays or a CSV/JSONL file, committing in batches."""
+
+    manager   = get_connection_manager()
+    allowlist = get_allowlist()
+    target_db = database
+
+    try:
+        if (rows is None) == (file_path is None):
+            raise ValueError("Pass exactly one of rows or file_path.")
+
+        adapter   = manager.get_adapter(connection_name)
+        target_db = database or adapter.config.database
+        allowlist.validate_database(connection_name, target_db)
+
+        if schema:
+            allowlist.validate_schema(connection_name, schema)
+
+        with get_rate_limiter().admit(connection_name, "bulk_insert") as permit:
+            start = time.perf_counter()
+
+            with _open_source(columns, rows, file_path) as (source_columns, source_rows):
+                try:
+                    inserted, batches = adapter.bulk_insert(
+                        table, source_columns, source_rows, database, schema, batch_size,
+                    )
+                except SqlBulkInsertError as e:
+                    if e.committed_rows:
+                        get_result_cache().invalidate(connection_name, target_db)
+
+                    raise
+
+            elapsed = (time.perf_counter() - start) * 1000
+            get_result_cache().invalidate(connection_name, target_db)
+
+            result = QueryResult(
+                success           = True,
+                connection        = connection_name,
+                database          = target_db,
+                row_count         = inserted,
+                execution_time_ms = elapsed,
+                message           = f"Inserted {inserted} row(s) into {table} in {batches} committed batch(es).",
+                statement_type    = "INSERT",
+                queue             = RequestScheduler.current(),
+            )
+
+            permit.annotate(result)
+            payload = json.dumps(result.to_dict(), indent=2, default=str)
+            permit.charge(0, len(payload))
+
+            return payload
+
+    except Exception as e:
+        result = QueryResult(
+            success        = False,
+            connection     = connection_name,
+            database       = target_db or "",
+            message        = f"{type(e).__name__}: {e}",
+            statement_type = "INSERT",
+        )
+
+        return json.dumps(result.to_dict(), indent=2)
+
+
+@contextmanager
+def _open_source(
+        columns: list[str] | None,
+        rows: list[list] | None,
+        file_path: str | None ) -> Iterator[tuple[list[str], Iterator[list]]]:
+    """Yield (columns, row iterator) for inline rows or a streamed file."""
+
+    if rows is not None:
+        if not columns:
+            raise ValueError("columns is required when passing rows.")
+
+        yield columns, (_row_values(row, columns) for row in rows)
+
+        return
+
+    path = _resolve_import_path(file_path)
+
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        if path.suffix.lower() == ".csv":
+            yield _csv_rows(f, columns)
+        else:
+            yield _jsonl_rows(f, columns)
+
+
+def _resolve_import_path(file_path: str) -> Path:
+    """Only files inside the configured import directory may be loaded."""
+
+    import_dir = get_import_directory()
+
+    if import_dir is None:
+        raise PermissionError("File imports are disabled. Set bulk_insert.import_directory in config.json.")
+
+    path = Path(file_path)
+    path = (path if path.is_absolute() else import_dir / path).resolve()
+
+    if not path.is_relative_to(import_dir.resolve()):
+        raise PermissionError(f"{file_path} is outside the import directory {import_dir}.")
+
+    if path.suffix.lower() not in (".csv", ".jsonl", ".ndjson"):
+        raise ValueError(f"Unsupported file type '{path.suffix}'. Use .csv, .jsonl or .ndjson.")
+
+    return path
+
+
+def _csv_rows(f, columns: list[str] | None) -> tuple[list[str], Iterator[list]]:
+    """The header row names the columns; empty fields load as NULL."""
+
+    reader = csv.reader(f)
+    header = next(reader, None)
+
+    if header is None:
+        raise ValueError("CSV file is empty.")
+
+    columns = columns or header
+    missing = [c for c in columns if c not in header]
+
+    if missing:
+        raise ValueError(f"CSV header has no column(s) {missing}.")
+
+    positions = [header.index(c) for c in columns]
+
+    return columns, ([record[i] if record[i] != "" else None for i in positions] for record in reader if record)
+
+
+def _jsonl_rows(f, columns: list[str] | None) -> tuple[list[str], Iterator[list]]:
+    """One JSON object (or value array in column order) per line."""
+
+    lines = (line for line in f if line.strip())
+    first = next(lines, None)
+
+    if first is None:
+        raise ValueError("JSONL file is empty.")
+
+    first_record = json.loads(first)
+
+    if columns is None:
+        if not isinstance(first_record, dict):
+            raise ValueError("columns is required when JSONL lines are arrays.")
+
+        columns = list(first_record)
+
+    def records() -> Iterator[list]:
+        yield _row_values(first_record, columns)
+
+        for line in lines:
+            yield _row_values(json.loads(line), columns)
+
+    return columns, records()
+
+
+def _row_values(row, columns: list[str]) -> list:
+    if isinstance(row, dict):
+
+        return [row.get(c) for c in columns]
+
+    return list(row)
@@ -0,0 +1,31 @@
+import json
+
+from mcp_server.context import get_connection_manager
+
+
+def cancel_query(request_id: str) -> str:
+    """Abort an in-flight statement started with the given request_id.
+
+    Tracking ends when the call that ran the statement returns, so pages read later through
+    fetch_cursor cannot be cancelled; close_cursor releases those.
+    """
+
+    tracker = get_connection_manager().tracker
+
+    try:
+        cancelled = tracker.cancel(request_id)
+
+        return json.dumps({
+            "success":    cancelled,
+            "request_id": request_id,
+            "message":    "Cancellation requested." if cancelled else "No running statement has this request_id.",
+            "running":    tracker.running(),
+        }, indent=2)
+
+    except Exception as e:
+
+        return json.dumps({
+            "success":    False,
+            "request_id": request_id,
+            "message":    f"{type(e).__name__}: {e}",
+        }, indent=2)
@@ -0,0 +1,26 @@
+import json
+
+from mcp_server.context import get_cursor_registry
+
+
+def close_cursor(cursor: str) -> str:
+    """Close a paginated result early and release its connection."""
+
+    registry = get_cursor_registry()
+
+    try:
+        closed = registry.close(cursor)
+
+        return json.dumps({
+            "success": closed,
+            "cursor":  cursor,
+            "message": "Cursor closed." if closed else "Unknown or expired cursor.",
+        }, indent=2)
+
+    except Exception as e:
+
+        return json.dumps({
+            "success": False,
+            "cursor":  cursor,
+            "message": f"{type(e).__name__}: {e}",
+        }, indent=2)
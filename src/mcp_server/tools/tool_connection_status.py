@@ -0,0 +1,52 @@
+import json
+
+from mcp_server.context import get_connection_manager
+
+
+def connection_status(connection_name: str | None = None, ping: bool = True) -> str:
+    """Report pool occupancy, liveness and running statements for one or every configured connection."""
+
+    manager = get_connection_manager()
+
+    try:
+        summaries = manager.list_connections()
+
+        if connection_name is not None:
+            manager.get_adapter(connection_name)
+            summaries = [s for s in summaries if s["name"] == connection_name]
+
+        statuses = [_status(manager, summary, ping) for summary in summaries]
+
+        return json.dumps({
+            "success":     True,
+            "connections": statuses,
+            "count":       len(statuses),
+        }, indent=2)
+
+    except Exception as e:
+
+        return json.dumps({
+            "success":    False,
+            "connection": connection_name,
+            "message":    f"{type(e).__name__}: {e}",
+        }, indent=2)
+
+
+def _status(manager, summary: dict, ping: bool) -> dict:
+    adapter = manager.get_adapter(summary["name"])
+    status  = {**summary, "reachable": None}
+
+    if ping:
+        try:
+            status["ping_ms"]   = round(adapter.ping(), 2)
+            status["reachable"] = True
+        except Exception as e:
+            status["reachable"] = False
+            status["message"]   = f"{type(e).__name__}: {e}"
+
+    status["health"]    = adapter.health.to_dict()
+    status["pool"]      = adapter.pool_stats()
+    status["scheduler"] = adapter.scheduler.stats()
+    status["running"]   = manager.tracker.running(summary["name"])
+
+    return status
@@ -1,14 +1,19 @@
 import time
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_result_cache
+from mcp_server.context import get_rate_limiter
 from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server.connections.request_scheduler import RequestScheduler
 
 
 def delete_statement(
         connection_name: str,
         sql: str,
-        database: str | None = None ) -> str:
+        database: str | None = None,
+        params: list | None = None,
+        timeout_seconds: float | None = None,
+        request_id: str | None = None ) -> str:
     """Execute a DELETE statement. Requires WHERE clause. Gated — requires explicit permission."""
 
     manager   = get_connection_manager()
@@ -18,32 +23,40 @@ def delete_statement(
     try:
         validator.validate_no_multi_statement(sql)
         stmt_type = validator.validate_delete(sql)
+        params    = validator.validate_params(params)
 
         adapter = manager.get_adapter(connection_name)
 
         if database:
             allowlist.validate_database(connection_name, database)
-            adapter.ensure_connected()
-            use_sql = f"USE [{database}]" if adapter.config.driver == "sql_server" else f"USE `{database}`"
-            cursor = adapter._conn.cursor()
-            cursor.execute(use_sql)
-            cursor.close()
 
-        start                       = time.perf_counter()
-        columns, rows, affected     = adapter.execute(sql)
-        elapsed                     = (time.perf_counter() - start) * 1000
+        with get_rate_limiter().admit(connection_name, "delete_statement") as permit:
+            timeout = adapter.config.query_timeout(timeout_seconds)
 
-        result = QueryResult(
-            success           = True,
-            connection        = connection_name,
-            database          = database or adapter.config.database,
-            row_count         = affected,
-            execution_time_ms = elapsed,
-            message           = f"DELETE executed successfully. {affected} row(s) affected.",
-            statement_type    = stmt_type,
-        )
+            with manager.tracker.track(request_id, connection_name, sql, timeout) as query:
+                start                   = time.perf_counter()
+                columns, rows, affected = adapter.execute(sql, params, database=database, timeout=timeout, query=query)
+                elapsed                 = (time.perf_counter() - start) * 1000
+
+            get_result_cache().invalidate(connection_name, database or adapter.config.database)
+
+            result = QueryResult(
+                success           = True,
+                connection        = connection_name,
+                database          = database or adapter.config.database,
+                row_count         = affected,
+                execution_time_ms = elapsed,
+                message           = f"DELETE executed successfully. {affected} row(s) affected.",
+                statement_type    = stmt_type,
+                request_id        = query.request_id,
+                queue             = RequestScheduler.current(),
+            )
+
+            permit.annotate(result)
+            payload = json.dumps(result.to_dict(), indent=2, default=str)
+            permit.charge(0, len(payload))
 
-        return json.dumps(result.to_dict(), indent=2, default=str)
+            return payload
 
     except Exception as e:
         result = QueryResult(
@@ -52,6 +65,7 @@ def delete_statement(
             database       = database or "",
             message        = f"{type(e).__name__}: {e}",
             statement_type = "DELETE",
+            request_id     = request_id,
         )
 
         return json.dumps(result.to_dict(), indent=2)
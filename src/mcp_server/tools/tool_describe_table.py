@@ -1,6 +1,6 @@
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist
+from mcp_server.context import get_connection_manager, get_allowlist, get_metadata_cache, get_schema_snapshots
 
 
 def describe_table(
@@ -12,6 +12,8 @@ def describe_table(
 
     manager   = get_connection_manager()
     allowlist = get_allowlist()
+    cache     = get_metadata_cache()
+    snapshots = get_schema_snapshots()
 
     try:
         allowlist.validate_database(connection_name, database)
@@ -19,9 +21,12 @@ def describe_table(
         if schema:
             allowlist.validate_schema(connection_name, schema)
 
-        adapter = manager.get_adapter(connection_name)
-        adapter.ensure_connected()
-        columns = adapter.describe_table(database, table, schema)
+        adapter      = manager.get_adapter(connection_name)
+        loaded, hit  = cache.get_or_load(
+            (connection_name, "columns", database, schema, table),
+            lambda: adapter.run_read(_load_columns, adapter, snapshots, database, table, schema),
+        )
+        columns, source = loaded
 
         return json.dumps({
             "success":    True,
@@ -31,6 +36,8 @@ def describe_table(
             "schema":     schema,
             "columns":    columns,
             "count":      len(columns),
+            "cached":     hit,
+            "source":     source,
         }, indent=2)
 
     except Exception as e:
@@ -42,3 +49,15 @@ def describe_table(
             "table":      table,
             "message":    f"{type(e).__name__}: {e}",
         }, indent=2)
+
+
+def _load_columns(adapter, snapshots, database: str, table: str, schema: str | None) -> tuple[list[dict], str]:
+    """Serve from a still-valid schema snapshot when one covers the table, else query live."""
+
+    snapshot_table = snapshots.find_table(adapter, database, table, schema)
+
+    if snapshot_table is not None:
+
+        return snapshot_table["columns"], "snapshot"
+
+    return adapter.describe_table(database, table, schema), "live"
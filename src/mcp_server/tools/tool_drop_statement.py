@@ -1,14 +1,18 @@
 import time
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_metadata_cache
+from mcp_server.context import get_schema_snapshots, get_result_cache, get_rate_limiter
 from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server.connections.request_scheduler import RequestScheduler
 
 
 def drop_statement(
         connection_name: str,
         sql: str,
-        database: str | None = None ) -> str:
+        database: str | None = None,
+        timeout_seconds: float | None = None,
+        request_id: str | None = None ) -> str:
     """Execute a DROP statement. Gated — requires explicit permission."""
 
     manager   = get_connection_manager()
@@ -23,27 +27,42 @@ def drop_statement(
 
         if database:
             allowlist.validate_database(connection_name, database)
-            adapter.ensure_connected()
-            use_sql = f"USE [{database}]" if adapter.config.driver == "sql_server" else f"USE `{database}`"
-            cursor = adapter._conn.cursor()
-            cursor.execute(use_sql)
-            cursor.close()
 
-        start                       = time.perf_counter()
-        columns, rows, affected     = adapter.execute(sql)
-        elapsed                     = (time.perf_counter() - start) * 1000
+        with get_rate_limiter().admit(connection_name, "drop_statement") as permit:
+            timeout = adapter.config.query_timeout(timeout_seconds)
 
-        result = QueryResult(
-            success           = True,
-            connection        = connection_name,
-            database          = database or adapter.config.database,
-            row_count         = affected,
-            execution_time_ms = elapsed,
-            message           = f"DROP executed successfully.",
-            statement_type    = stmt_type,
-        )
+            with manager.tracker.track(request_id, connection_name, sql, timeout) as query:
+                start                   = time.perf_counter()
+                columns, rows, affected = adapter.execute(sql, database=database, timeout=timeout, query=query)
+                elapsed                 = (time.perf_counter() - start) * 1000
+
+            get_result_cache().invalidate(connection_name, database or adapter.config.database)
+
+            if stmt_type in validator.DDL_TYPES:
+                get_metadata_cache().invalidate_for_ddl(
+                    connection_name,
+                    database or adapter.config.database,
+                    validator.extract_ddl_target(sql),
+                )
+                get_schema_snapshots().forget(connection_name)
+
+            result = QueryResult(
+                success           = True,
+                connection        = connection_name,
+                database          = database or adapter.config.database,
+                row_count         = affected,
+                execution_time_ms = elapsed,
+                message           = f"DROP executed successfully.",
+                statement_type    = stmt_type,
+                request_id        = query.request_id,
+                queue             = RequestScheduler.current(),
+            )
+
+            permit.annotate(result)
+            payload = json.dumps(result.to_dict(), indent=2, default=str)
+            permit.charge(0, len(payload))
 
-        return json.dumps(result.to_dict(), indent=2, default=str)
+            return payload
 
     except Exception as e:
         result = QueryResult(
@@ -52,6 +71,7 @@ def drop_statement(
             database       = database or "",
             message        = f"{type(e).__name__}: {e}",
             statement_type = "DROP",
+            request_id     = request_id,
         )
 
         return json.dumps(result.to_dict(), indent=2)
@@ -0,0 +1,169 @@
+import asyncio
+import time
+import json
+
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_batch_config
+from mcp_server.context import get_rate_limiter
+from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server.security.rate_limiter import Permit
+from mcp_server.tools.tool_execute_query import run_query
+
+
+async def execute_batch(
+        items: list[dict],
+        max_parallelism: int | None = None,
+        max_rows: int | None = None,
+        result_format: str = "rows",
+        timeout_seconds: float | None = None ) -> str:
+    """Validate a list of independent SELECTs, then run them concurrently across pooled connections."""
+
+    config  = get_batch_config()
+    permits = []
+
+    try:
+        QueryResult.validate_format(result_format)
+
+        if not isinstance(items, list) or not items:
+            raise ValueError("items must be a non-empty list of {connection_name, sql, database} objects.")
+
+        if len(items) > config.max_items:
+            raise ValueError(f"Batch has {len(items)} items; the limit is {config.max_items}.")
+
+        errors = [_validation_error(item) for item in items]
+
+        if any(errors):
+
+            return json.dumps({
+                "success":    False,
+                "message":    "Batch rejected; nothing was executed. Fix the items listed in errors.",
+                "errors":     [{"index": i, "message": e} for i, e in enumerate(errors) if e],
+                "item_count": len(items),
+            }, indent=2)
+
+        parallelism = min(max_parallelism or config.max_parallelism, config.max_parallelism)
+        semaphore   = asyncio.Semaphore(parallelism)
+        start       = time.perf_counter()
+
+        # Items run on their own connection's executor, so cross-connection batches fan out to
+        # every server at once while each connection's scheduler still bounds its concurrency.
+        # The batch itself only awaits, so waiting for admission or results holds no worker thread.
+        results = await asyncio.gather(*(
+            _run_item(semaphore, permits, index, item, max_rows, result_format, timeout_seconds)
+            for index, item in enumerate(items)
+        ))
+
+        elapsed = (time.perf_counter() - start) * 1000
+        failed  = sum(1 for r in results if not r.success)
+
+        for index, permit in permits:
+            permit.annotate(results[index])
+
+        body    = {
+            "success":           failed == 0,
+            "item_count":        len(items),
+            "failed_count":      failed,
+            "max_parallelism":   parallelism,
+            "execution_time_ms": round(elapsed, 2),
+            "results":           [{"index": i, **r.to_dict(result_format)} for i, r in enumerate(results)],
+        }
+
+        if result_format == "rows":
+            payload = json.dumps(body, indent=2, default=str)
+        else:
+            payload = json.dumps(body, separators=(",", ":"), default=str)
+
+        # One payload serves every item, so its bytes are charged in proportion to each item's rows.
+        total_rows = sum(r.row_count for r in results)
+
+        for index, permit in permits:
+            rows = results[index].row_count
+            permit.charge(rows, len(payload) * rows // total_rows if total_rows else len(payload) // len(items))
+
+        return payload
+
+    except Exception as e:
+
+        return json.dumps({
+            "success": False,
+            "message": f"{type(e).__name__}: {e}",
+        }, indent=2)
+
+    finally:
+        for _, permit in permits:
+            permit.release()
+
+
+def _validation_error(item) -> str | None:
+    """Check one item without running it. Returns an error message or None."""
+
+    validator = get_query_validator()
+
+    try:
+        if not isinstance(item, dict) or not item.get("connection_name") or not item.get("sql"):
+            raise ValueError("Each item needs connection_name and sql.")
+
+        validator.validate_no_multi_statement(item["sql"])
+        validator.validate_query(item["sql"])
+        validator.validate_params(item.get("params"))
+        get_connection_manager().get_adapter(item["connection_name"])
+
+        if item.get("database"):
+            get_allowlist().validate_database(item["connection_name"], item["database"])
+
+    except Exception as e:
+
+        return f"{type(e).__name__}: {e}"
+
+    return None
+
+
+async def _run_item(
+        semaphore: asyncio.Semaphore,
+        permits: list[tuple[int, Permit]],
+        index: int,
+        item: dict,
+        max_rows: int | None,
+        result_format: str,
+        timeout_seconds: float | None ) -> QueryResult:
+    """Run one item once the batch has room for it; a failure becomes a failed QueryResult."""
+
+    manager = get_connection_manager()
+    name    = item["connection_name"]
+    permit  = None
+
+    async with semaphore:
+        try:
+            # admit() may sleep out a rate-limit delay, so it waits off the event loop. Items are
+            # charged as execute_query calls, so batching cannot get around that tool's limits.
+            permit = await asyncio.to_thread(
+                get_rate_limiter().admit, name, "execute_query", item.get("max_rows", max_rows) or None,
+            )
+            permits.append((index, permit))
+
+            result = await manager.run_async(
+                name,
+                run_query,
+                name,
+                item["sql"],
+                item.get("database"),
+                permit.rows,
+                result_format,
+                item.get("params"),
+                item.get("timeout_seconds", timeout_seconds),
+                item.get("request_id"),
+            )
+        except Exception as e:
+            result = QueryResult(
+                success        = False,
+                connection     = name,
+                database       = item.get("database") or "",
+                message        = f"{type(e).__name__}: {e}",
+                statement_type = "SELECT",
+                request_id     = item.get("request_id"),
+            )
+
+        # Keep only the rows the item returned reserved, so later items can start.
+        if permit is not None:
+            permit.settle(result.row_count if result.success else 0)
+
+    return result
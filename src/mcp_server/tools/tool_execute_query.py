@@ -1,55 +1,183 @@
 import time
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_cursor_registry
+from mcp_server.context import get_result_cache, get_rate_limiter
+from mcp_server._dataclasses.open_cursor import OpenCursor
 from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server._errors.cursor_error import SqlCursorError
+from mcp_server.connections.request_scheduler import RequestScheduler
+from mcp_server.connections.row_stream import RowStream
+from mcp_server.tools.tool_explain_query import preflight
 
 
 def execute_query(
         connection_name: str,
         sql: str,
-        database: str | None = None ) -> str:
-    """Execute a SELECT query and return results as structured JSON."""
+        database: str | None = None,
+        max_rows: int | None = None,
+        result_format: str = "rows",
+        params: list | None = None,
+        timeout_seconds: float | None = None,
+        request_id: str | None = None ) -> str:
+    """Execute a SELECT query and return results as structured JSON, paginated past max_rows."""
+
+    try:
+        QueryResult.validate_format(result_format)
+
+        # Under a max_concurrent_rows limit the permit may shrink the page; the rest stays behind next_cursor.
+        with get_rate_limiter().admit(connection_name, "execute_query", max_rows or None) as permit:
+            result = run_query(
+                connection_name, sql, database, permit.rows, result_format, params, timeout_seconds, request_id,
+            )
+            permit.annotate(result)
+            payload = result.to_json(result_format)
+            permit.charge(result.row_count, len(payload))
+
+        return payload
+
+    except Exception as e:
+        result = QueryResult(
+            success        = False,
+            connection     = connection_name,
+            database       = database or "",
+            message        = f"{type(e).__name__}: {e}",
+            statement_type = "SELECT",
+            request_id     = request_id,
+        )
+
+        return json.dumps(result.to_dict(), indent=2)
+
+
+def run_query(
+        connection_name: str,
+        sql: str,
+        database: str | None = None,
+        max_rows: int | None = None,
+        result_format: str = "rows",
+        params: list | None = None,
+        timeout_seconds: float | None = None,
+        request_id: str | None = None ) -> QueryResult:
+    """Validate and run one SELECT, returning a QueryResult. Raises on any failure."""
 
     manager   = get_connection_manager()
     allowlist = get_allowlist()
     validator = get_query_validator()
+    cache     = get_result_cache()
 
-    try:
-        validator.validate_no_multi_statement(sql)
-        stmt_type = validator.validate_query(sql)
+    validator.validate_no_multi_statement(sql)
+    stmt_type = validator.validate_query(sql)
+    params    = validator.validate_params(params)
 
-        adapter = manager.get_adapter(connection_name)
+    adapter = manager.get_adapter(connection_name)
 
-        if database:
-            allowlist.validate_database(connection_name, database)
-            adapter.ensure_connected()
-            adapter._conn.cursor().execute(f"USE [{database}]" if adapter.config.driver == "sql_server" else f"USE `{database}`").close()
+    if database:
+        allowlist.validate_database(connection_name, database)
 
-        start                       = time.perf_counter()
-        columns, rows, affected     = adapter.execute(sql)
-        elapsed                     = (time.perf_counter() - start) * 1000
+    limit     = adapter.config.row_limit(max_rows)
+    timeout   = adapter.config.query_timeout(timeout_seconds)
+    cacheable = stmt_type == "SELECT" and result_format != "arrow"     # cached rows lose driver types
+    key       = cache.key(adapter.config, database, sql, params)
+    hit       = cache.get(adapter.config, key) if cacheable else None
 
+    # A cached result is complete, so it only serves calls whose limit it fits under.
+    if hit is not None and (limit is None or len(hit[1]) <= limit):
+        columns, rows, age = hit
         result = QueryResult(
             success           = True,
             connection        = connection_name,
             database          = database or adapter.config.database,
             columns           = columns,
             rows              = rows,
-            row_count         = affected,
-            execution_time_ms = elapsed,
+            row_count         = len(rows),
+            message           = f"Served from result cache ({age:.1f}s old).",
             statement_type    = stmt_type,
+            cached            = True,
+            cache_age_seconds = age,
+            queue             = RequestScheduler.current(),
         )
 
-        return json.dumps(result.to_dict(), indent=2, default=str)
+        return result
 
-    except Exception as e:
-        result = QueryResult(
-            success        = False,
-            connection     = connection_name,
-            database       = database or "",
-            message        = f"{type(e).__name__}: {e}",
-            statement_type = "SELECT",
+    checked    = None
+    forced     = False
+    generation = cache.generation(key)
+
+    with manager.tracker.track(request_id, connection_name, sql, timeout) as query:
+        if adapter.config.preflight.enabled:
+            requested      = limit
+            limit, checked = preflight(adapter, sql, params, database, limit, timeout, query)
+            forced         = limit != requested
+
+        start  = time.perf_counter()
+        stream = adapter.run_read(
+            adapter.open_stream, sql, params, database=database, timeout=timeout, query=query,
         )
 
-        return json.dumps(result.to_dict(), indent=2)
+        try:
+            rows, table = read_page(stream, limit, result_format)
+            has_more    = limit is not None and stream.has_more()
+        except Exception:
+            stream.close()
+            raise
+
+    elapsed     = (time.perf_counter() - start) * 1000
+    row_count   = table.num_rows if table is not None else len(rows)
+    next_cursor = None
+    message     = ""
+
+    if has_more:
+        # A parked cursor holds a pooled connection, so one is always left for other calls.
+        try:
+            next_cursor = get_cursor_registry().register(OpenCursor(
+                connection     = connection_name,
+                database       = database or adapter.config.database,
+                statement_type = stmt_type,
+                page_size      = limit,
+                result_format  = result_format,
+                stream         = stream,
+            ), max_per_connection=adapter.config.pool.max_size - 1)
+            message = f"Returned the first {row_count} row(s). Pass next_cursor to fetch_cursor for more."
+        except SqlCursorError as e:
+            stream.close()
+            message = (f"Returned the first {row_count} row(s); more remain but no cursor could be kept open. "
+                       f"{e.detail} Use export_query for the full result.")
+
+        if checked is not None and forced:
+            message = (f"Pre-flight estimated {checked['estimated_rows']:,.0f} rows, so results are paged "
+                       f"{limit} at a time. {message} Use export_query for the full result.")
+    else:
+        stream.close()
+
+        if cacheable:
+            cache.put(adapter.config, key, generation, stream.columns, rows)
+
+    result = QueryResult(
+        success           = True,
+        connection        = connection_name,
+        database          = database or adapter.config.database,
+        columns           = stream.columns,
+        rows              = rows,
+        row_count         = row_count,
+        execution_time_ms = elapsed,
+        message           = message,
+        statement_type    = stmt_type,
+        truncated         = has_more,
+        next_cursor       = next_cursor,
+        request_id        = query.request_id,
+        queue             = RequestScheduler.current(),
+        arrow             = table,
+        preflight         = checked,
+    )
+
+    return result
+
+
+def read_page(stream: RowStream, limit: int | None, result_format: str) -> tuple[list, object | None]:
+    """Read up to `limit` rows as (rows, None), or as ([], pyarrow.Table) for the arrow format."""
+
+    if result_format == "arrow":
+
+        return [], stream.read_arrow(limit)
+
+    return stream.read(limit, as_lists=result_format != "rows"), None
@@ -1,14 +1,20 @@
 import time
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_metadata_cache
+from mcp_server.context import get_schema_snapshots, get_result_cache, get_rate_limiter
 from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server.connections.request_scheduler import RequestScheduler
 
 
 def execute_statement(
         connection_name: str,
         sql: str,
-        database: str | None = None ) -> str:
+        database: str | None = None,
+        result_format: str = "rows",
+        params: list | None = None,
+        timeout_seconds: float | None = None,
+        request_id: str | None = None ) -> str:
     """Execute a write statement (INSERT/UPDATE/CREATE/ALTER). DELETE and DROP are blocked."""
 
     manager   = get_connection_manager()
@@ -16,36 +22,54 @@ def execute_statement(
     validator = get_query_validator()
 
     try:
+        QueryResult.validate_format(result_format)
         validator.validate_no_multi_statement(sql)
         stmt_type = validator.validate_statement(sql)
+        params    = validator.validate_params(params)
 
         adapter = manager.get_adapter(connection_name)
 
         if database:
             allowlist.validate_database(connection_name, database)
-            adapter.ensure_connected()
-            use_sql = f"USE [{database}]" if adapter.config.driver == "sql_server" else f"USE `{database}`"
-            cursor = adapter._conn.cursor()
-            cursor.execute(use_sql)
-            cursor.close()
 
-        start                       = time.perf_counter()
-        columns, rows, affected     = adapter.execute(sql)
-        elapsed                     = (time.perf_counter() - start) * 1000
+        with get_rate_limiter().admit(connection_name, "execute_statement") as permit:
+            timeout = adapter.config.query_timeout(timeout_seconds)
 
-        result = QueryResult(
-            success           = True,
-            connection        = connection_name,
-            database          = database or adapter.config.database,
-            columns           = columns,
-            rows              = rows,
-            row_count         = affected,
-            execution_time_ms = elapsed,
-            message           = f"{stmt_type} executed successfully. {affected} row(s) affected.",
-            statement_type    = stmt_type,
-        )
+            with manager.tracker.track(request_id, connection_name, sql, timeout) as query:
+                start                   = time.perf_counter()
+                columns, rows, affected = adapter.execute(sql, params, database=database, timeout=timeout, query=query)
+                elapsed                 = (time.perf_counter() - start) * 1000
+
+            if stmt_type not in validator.ALLOWED_FOR_QUERY:
+                get_result_cache().invalidate(connection_name, database or adapter.config.database)
+
+            if stmt_type in validator.DDL_TYPES:
+                get_metadata_cache().invalidate_for_ddl(
+                    connection_name,
+                    database or adapter.config.database,
+                    validator.extract_ddl_target(sql),
+                )
+                get_schema_snapshots().forget(connection_name)
+
+            result = QueryResult(
+                success           = True,
+                connection        = connection_name,
+                database          = database or adapter.config.database,
+                columns           = columns,
+                rows              = rows,
+                row_count         = affected,
+                execution_time_ms = elapsed,
+                message           = f"{stmt_type} executed successfully. {affected} row(s) affected.",
+                statement_type    = stmt_type,
+                request_id        = query.request_id,
+                queue             = RequestScheduler.current(),
+            )
+
+            permit.annotate(result)
+            payload = result.to_json(result_format)
+            permit.charge(0, len(payload))
 
-        return json.dumps(result.to_dict(), indent=2, default=str)
+            return payload
 
     except Exception as e:
         result = QueryResult(
@@ -54,6 +78,7 @@ def execute_statement(
             database       = database or "",
             message        = f"{type(e).__name__}: {e}",
             statement_type = "STATEMENT",
+            request_id     = request_id,
         )
 
         return json.dumps(result.to_dict(), indent=2)
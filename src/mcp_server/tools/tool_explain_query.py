@@ -0,0 +1,131 @@
+import json
+
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator
+from mcp_server._dataclasses.plan_estimate import PlanEstimate
+from mcp_server._dataclasses.running_query import RunningQuery
+from mcp_server._errors.preflight_error import SqlPreflightError
+from mcp_server._errors.query_cancelled_error import SqlQueryCancelledError
+from mcp_server.connections.base_adapter import BaseAdapter
+
+
+def explain_query(
+        connection_name: str,
+        sql: str,
+        database: str | None = None,
+        params: list | None = None ) -> str:
+    """Return the estimated plan summary for a SELECT without running it, and what pre-flight would do with it."""
+
+    manager   = get_connection_manager()
+    allowlist = get_allowlist()
+    validator = get_query_validator()
+
+    try:
+        validator.validate_no_multi_statement(sql)
+        validator.validate_query(sql)
+        params  = validator.validate_params(params)
+        adapter = manager.get_adapter(connection_name)
+
+        if database:
+            allowlist.validate_database(connection_name, database)
+
+        if not adapter.SUPPORTS_EXPLAIN:
+            raise ValueError(f"Driver '{adapter.config.driver}' cannot estimate query plans.")
+
+        estimate = adapter.run_read(adapter.explain, sql, params, database)
+        config   = adapter.config.preflight
+
+        return json.dumps({
+            "success":    True,
+            "connection": connection_name,
+            "database":   database or adapter.config.database,
+            **estimate.to_dict(),
+            "preflight":  {
+                "enabled":            config.enabled,
+                "max_estimated_rows": config.max_estimated_rows or None,
+                "max_estimated_cost": config.max_estimated_cost or None,
+                "verdict":            _verdict(adapter, estimate),
+            },
+        }, indent=2)
+
+    except Exception as e:
+
+        return json.dumps({
+            "success":    False,
+            "connection": connection_name,
+            "database":   database,
+            "message":    f"{type(e).__name__}: {e}",
+        }, indent=2)
+
+
+def preflight(
+        adapter: BaseAdapter,
+        sql: str,
+        params: list | None,
+        database: str | None,
+        limit: int | None,
+        timeout: float | None = None,
+        query: RunningQuery | None = None ) -> tuple[int | None, dict | None]:
+    """Check a SELECT's estimated plan against the connection's thresholds before it runs.
+
+    Returns (limit, report): the page size to use, possibly forced down, and a summary for the
+    result, or no report where the driver cannot read plans. If reading the plan fails, the query
+    runs unchecked with an "unavailable" verdict. Raises SqlPreflightError when the query is refused.
+    Pass the call's tracked query so its timeout and cancel_query cover the EXPLAIN.
+    """
+
+    config = adapter.config.preflight
+
+    if not adapter.SUPPORTS_EXPLAIN:
+
+        return limit, None
+
+    # A login without SHOWPLAN permission, or a statement EXPLAIN cannot plan, must not make
+    # every query fail once pre-flight is on. Timeouts and cancels still stop the call.
+    try:
+        estimate = adapter.run_read(adapter.explain, sql, params, database, timeout=timeout, query=query)
+    except SqlQueryCancelledError:
+        raise
+    except Exception as e:
+        if query is not None and query.cancelled_reason is not None:
+            raise
+
+        return limit, {"verdict": "unavailable", "message": f"{type(e).__name__}: {e}"}
+
+    report  = {**estimate.to_dict(), "verdict": _verdict(adapter, estimate)}
+    scanned = f" Full scans: {', '.join(estimate.full_scans)}." if estimate.full_scans else ""
+
+    # Paging does not make an expensive plan cheaper, so cost over the limit always refuses.
+    if config.cost_exceeded(estimate):
+        raise SqlPreflightError(
+            adapter.config.name,
+            f"estimated cost {estimate.estimated_cost:g} exceeds {config.max_estimated_cost:g}.{scanned} "
+            f"Narrow the query with selective filters on indexed columns, or call explain_query to inspect the plan.",
+        )
+
+    if config.rows_exceeded(estimate):
+        if config.action == "refuse":
+            raise SqlPreflightError(
+                adapter.config.name,
+                f"estimated {estimate.estimated_rows:,.0f} rows exceeds {config.max_estimated_rows:,.0f}.{scanned} "
+                f"Add filters, or use export_query for large extracts.",
+            )
+
+        limit = min(limit or config.page_rows, config.page_rows)
+
+    return limit, report
+
+
+def _verdict(adapter: BaseAdapter, estimate: PlanEstimate) -> str:
+    """What pre-flight does with this estimate: run, paginate or refuse."""
+
+    config = adapter.config.preflight
+
+    if config.cost_exceeded(estimate):
+
+        return "refuse"
+
+    if config.rows_exceeded(estimate):
+
+        return config.action
+
+    return "run"
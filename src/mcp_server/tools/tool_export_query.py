@@ -0,0 +1,158 @@
+import json
+import time
+from pathlib import Path
+
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_export_directory
+from mcp_server.context import get_rate_limiter
+from mcp_server.export.arrow_export_writer import ArrowExportWriter
+from mcp_server.export.csv_export_writer import CsvExportWriter
+from mcp_server.export.export_writer import ExportWriter
+from mcp_server.export.jsonl_export_writer import JsonlExportWriter
+from mcp_server.export.parquet_export_writer import ParquetExportWriter
+
+WRITERS: dict[str, type[ExportWriter]] = {
+    "csv":     CsvExportWriter,
+    "jsonl":   JsonlExportWriter,
+    "parquet": ParquetExportWriter,
+    "arrow":   ArrowExportWriter,
+}
+
+
+def export_query(
+        connection_name: str,
+        sql: str,
+        file_path: str,
+        file_format: str | None = None,
+        database: str | None = None,
+        params: list | None = None,
+        overwrite: bool = False,
+        timeout_seconds: float | None = None,
+        request_id: str | None = None ) -> str:
+    """Stream a SELECT's full result set to a file in the export directory; return only a summary."""
+
+    manager   = get_connection_manager()
+    allowlist = get_allowlist()
+    validator = get_query_validator()
+
+    try:
+        validator.validate_no_multi_statement(sql)
+        validator.validate_query(sql)
+        params = validator.validate_params(params)
+
+        adapter = manager.get_adapter(connection_name)
+
+        if database:
+            allowlist.validate_database(connection_name, database)
+
+        # Exports reserve no in-flight rows: they go to disk, not back to the client. The rows
+        # read still count toward the window budget, and the summary toward the byte budget.
+        with get_rate_limiter().admit(connection_name, "export_query") as permit:
+            path, writer_class = _resolve_export_path(file_path, file_format, overwrite)
+            partial            = path.with_name(path.name + ".part")
+            timeout            = adapter.config.query_timeout(timeout_seconds)
+            row_count          = 0
+            file_types         = None
+
+            with manager.tracker.track(request_id, connection_name, sql, timeout) as query:
+                start  = time.perf_counter()
+                stream = adapter.run_read(
+                    adapter.open_stream, sql, params, database=database, timeout=timeout, query=query,
+                )
+
+                # Rows go from each fetchmany batch straight to disk, so memory stays at one batch.
+                try:
+                    with stream:
+                        native      = writer_class.NATIVE_VALUES
+                        arrow_types = adapter.arrow_types(stream.description) if native else None
+
+                        with writer_class(partial, stream.columns, arrow_types) as writer:
+                            while True:
+                                rows = stream.fetch_raw() if native else stream.fetch(as_lists=True)
+
+                                if not rows:
+
+                                    break
+
+                                writer.write(rows)
+                                row_count += len(rows)
+
+                        file_types = writer.file_types()
+                except BaseException:
+                    partial.unlink(missing_ok=True)
+                    raise
+
+            partial.replace(path)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            payload = json.dumps({
+                "success":           True,
+                "connection":        connection_name,
+                "database":          database or adapter.config.database,
+                "path":              str(path),
+                "format":            next(name for name, cls in WRITERS.items() if cls is writer_class),
+                "row_count":         row_count,
+                "bytes":             path.stat().st_size,
+                "columns":           [
+                    {"name": c.name, "type": c.type, "nullable": c.nullable}
+                    | ({"file_type": file_types[i]} if file_types else {})
+                    for i, c in enumerate(stream.columns)
+                ],
+                "execution_time_ms": round(elapsed, 2),
+                "request_id":        query.request_id,
+            }, indent=2)
+
+            permit.charge(row_count, len(payload))
+
+            return payload
+
+    except Exception as e:
+
+        return json.dumps({
+            "success":    False,
+            "connection": connection_name,
+            "database":   database or "",
+            "message":    f"{type(e).__name__}: {e}",
+            "request_id": request_id,
+        }, indent=2)
+
+
+def _resolve_export_path(file_path: str, file_format: str | None, overwrite: bool) -> tuple[Path, type[ExportWriter]]:
+    """Only paths inside the configured export directory may be written."""
+
+    export_dir = get_export_directory()
+
+    if export_dir is None:
+        raise PermissionError("Exports are disabled. Set export.directory in config.json.")
+
+    path = Path(file_path)
+    path = (path if path.is_absolute() else export_dir / path).resolve()
+
+    if not path.is_relative_to(export_dir.resolve()):
+        raise PermissionError(f"{file_path} is outside the export directory {export_dir}.")
+
+    if file_format is None:
+        writer_class = next((cls for cls in WRITERS.values() if path.suffix.lower() in cls.SUFFIXES), None)
+
+        if writer_class is None:
+            raise ValueError(f"Cannot tell the format from '{path.suffix}'. Pass file_format: {list(WRITERS)}.")
+    else:
+        writer_class = WRITERS.get(file_format.lower())
+
+        if writer_class is None:
+            raise ValueError(f"Unknown file_format '{file_format}'. Use one of {list(WRITERS)}.")
+
+        if not path.suffix:
+            path = path.with_suffix(writer_class.SUFFIXES[0])
+        elif path.suffix.lower() not in writer_class.SUFFIXES:
+            raise ValueError(
+                f"'{path.suffix}' does not match file_format '{file_format}'. "
+                f"Use one of {list(writer_class.SUFFIXES)} or drop the suffix.",
+            )
+
+    if path.exists() and not overwrite:
+        raise FileExistsError(f"{path} already exists. Pass overwrite=true to replace it.")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return path, writer_class
+
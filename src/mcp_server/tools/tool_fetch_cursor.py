@@ -0,0 +1,89 @@
+import time
+import json
+
+from mcp_server.context import get_connection_manager, get_cursor_registry, get_rate_limiter
+from mcp_server._dataclasses.query_result import QueryResult
+from mcp_server.tools.tool_execute_query import read_page
+
+
+def fetch_cursor(
+        cursor: str,
+        max_rows: int | None = None,
+        result_format: str | None = None ) -> str:
+    """Fetch the next page of a paginated execute_query result.
+
+    Pages are read from a statement that has already run, outside the query tracker: the original
+    timeout_seconds does not apply to them and cancel_query cannot stop them. Use close_cursor instead.
+    """
+
+    manager  = get_connection_manager()
+    registry = get_cursor_registry()
+    entry    = None
+    permit   = None
+
+    try:
+        entry   = registry.checkout(cursor)
+        adapter = manager.get_adapter(entry.connection)
+        permit  = get_rate_limiter().admit(entry.connection, "fetch_cursor", max_rows or entry.page_size)
+        limit   = adapter.config.row_limit(permit.rows)
+        fmt     = result_format or entry.result_format
+
+        QueryResult.validate_format(fmt)
+
+        start = time.perf_counter()
+
+        try:
+            rows, table = read_page(entry.stream, limit, fmt)
+            has_more    = entry.stream.has_more()
+        except Exception:
+            registry.close(cursor)
+            raise
+
+        elapsed   = (time.perf_counter() - start) * 1000
+        row_count = table.num_rows if table is not None else len(rows)
+
+        if has_more:
+            registry.checkin(cursor)
+            message = f"Returned {row_count} more row(s). Pass next_cursor to fetch_cursor for more."
+        else:
+            registry.close(cursor)
+            message = f"Returned the final {row_count} row(s). Cursor closed."
+
+        result = QueryResult(
+            success           = True,
+            connection        = entry.connection,
+            database          = entry.database,
+            columns           = entry.stream.columns,
+            rows              = rows,
+            row_count         = row_count,
+            execution_time_ms = elapsed,
+            message           = message,
+            statement_type    = entry.statement_type,
+            truncated         = has_more,
+            next_cursor       = cursor if has_more else None,
+            arrow             = table,
+        )
+
+        permit.annotate(result)
+        payload = result.to_json(fmt)
+        permit.charge(row_count, len(payload))
+
+        return payload
+
+    except Exception as e:
+        if entry is not None:
+            registry.checkin(cursor)
+
+        result = QueryResult(
+            success        = False,
+            connection     = entry.connection if entry else "",
+            database       = entry.database if entry else "",
+            message        = f"{type(e).__name__}: {e}",
+            statement_type = "SELECT",
+        )
+
+        return json.dumps(result.to_dict(), indent=2)
+
+    finally:
+        if permit is not None:
+            permit.release()
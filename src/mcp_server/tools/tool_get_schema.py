@@ -1,16 +1,18 @@
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist
+from mcp_server.context import get_connection_manager, get_allowlist, get_metadata_cache, get_schema_snapshots
 
 
 def get_schema(
         connection_name: str,
         database: str,
         schema: str | None = None ) -> str:
-    """Return full schema introspection: all tables with their columns."""
+    """Return full schema introspection: all tables with their columns, keys and indexes."""
 
     manager   = get_connection_manager()
     allowlist = get_allowlist()
+    cache     = get_metadata_cache()
+    snapshots = get_schema_snapshots()
 
     try:
         allowlist.validate_database(connection_name, database)
@@ -18,23 +20,27 @@ def get_schema(
         if schema:
             allowlist.validate_schema(connection_name, schema)
 
-        adapter = manager.get_adapter(connection_name)
-        adapter.ensure_connected()
-        tables  = adapter.get_tables(database, schema)
+        adapter     = manager.get_adapter(connection_name)
+        loaded, hit = cache.get_or_load(
+            (connection_name, "schema", database, schema, None),
+            lambda: adapter.run_read(snapshots.get_schema, adapter, database, schema),
+        )
+        tables, source = loaded
 
         schema_map = {}
         for tbl in tables:
             table_name = tbl["table"]
             tbl_schema = tbl.get("schema", schema)
-            columns    = adapter.describe_table(database, table_name, tbl_schema)
             key        = f"{tbl_schema}.{table_name}" if tbl_schema else table_name
 
             schema_map[key] = {
-                "schema":     tbl_schema,
-                "table":      table_name,
-                "type":       tbl.get("type", ""),
-                "columns":    columns,
-                "col_count":  len(columns),
+                "schema":      tbl_schema,
+                "table":       table_name,
+                "type":        tbl.get("type", ""),
+                "columns":     tbl["columns"],
+                "col_count":   len(tbl["columns"]),
+                "primary_key": tbl["primary_key"],
+                "indexes":     tbl["indexes"],
             }
 
         return json.dumps({
@@ -44,7 +50,9 @@ def get_schema(
             "schema":      schema,
             "tables":      schema_map,
             "table_count": len(schema_map),
-        }, indent=2)
+            "cached":      hit,
+            "source":      source,
+        }, indent=2, default=str)
 
     except Exception as e:
 
@@ -1,6 +1,6 @@
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist
+from mcp_server.context import get_connection_manager, get_allowlist, get_metadata_cache
 
 
 def list_databases(connection_name: str) -> str:
@@ -8,11 +8,14 @@ def list_databases(connection_name: str) -> str:
 
     manager   = get_connection_manager()
     allowlist = get_allowlist()
+    cache     = get_metadata_cache()
 
     try:
         adapter       = manager.get_adapter(connection_name)
-        adapter.ensure_connected()
-        all_dbs       = adapter.get_databases()
+        all_dbs, hit  = cache.get_or_load(
+            (connection_name, "databases", None, None, None),
+            lambda: adapter.run_read(adapter.get_databases),
+        )
         allowed_dbs   = allowlist.get_allowed_databases(connection_name)
         filtered      = [db for db in all_dbs if db in allowed_dbs] if allowed_dbs else all_dbs
 
@@ -21,6 +24,7 @@ def list_databases(connection_name: str) -> str:
             "connection": connection_name,
             "databases":  filtered,
             "count":      len(filtered),
+            "cached":     hit,
         }, indent=2)
 
     except Exception as e:
@@ -1,6 +1,6 @@
 import json
 
-from mcp_server.context import get_connection_manager, get_allowlist
+from mcp_server.context import get_connection_manager, get_allowlist, get_metadata_cache
 
 
 def list_tables(
@@ -11,6 +11,7 @@ def list_tables(
 
     manager   = get_connection_manager()
     allowlist = get_allowlist()
+    cache     = get_metadata_cache()
 
     try:
         allowlist.validate_database(connection_name, database)
@@ -18,9 +19,11 @@ def list_tables(
         if schema:
             allowlist.validate_schema(connection_name, schema)
 
-        adapter = manager.get_adapter(connection_name)
-        adapter.ensure_connected()
-        tables  = adapter.get_tables(database, schema)
+        adapter     = manager.get_adapter(connection_name)
+        tables, hit = cache.get_or_load(
+            (connection_name, "tables", database, schema, None),
+            lambda: adapter.run_read(adapter.get_tables, database, schema),
+        )
 
         return json.dumps({
             "success":    True,
@@ -29,6 +32,7 @@ def list_tables(
             "schema":     schema,
             "tables":     tables,
             "count":      len(tables),
+            "cached":     hit,
         }, indent=2)
 
     except Exception as e:
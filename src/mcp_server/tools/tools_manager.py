@@ -8,11 +8,33 @@ from mcp_server.tools.tool_describe_table import describe_table
 from mcp_server.tools.tool_get_schema import get_schema
 from mcp_server.tools.tool_delete_statement import delete_statement
 from mcp_server.tools.tool_drop_statement import drop_statement
+from mcp_server.tools.tool_bulk_insert import bulk_insert
+from mcp_server.tools.tool_execute_batch import execute_batch
+from mcp_server.tools.tool_cancel_query import cancel_query
+from mcp_server.tools.tool_connection_status import connection_status
+from mcp_server.tools.tool_export_query import export_query
+from mcp_server.tools.tool_explain_query import explain_query
+from mcp_server.tools.tool_fetch_cursor import fetch_cursor
+from mcp_server.tools.tool_close_cursor import close_cursor
+from mcp_server.tools.async_tool import make_async_tool
 
 
 class ToolsManager:
     """Registers all SQL executor tools with the FastMCP server."""
 
+    # Cheap catalog calls are admitted ahead of queued execute work on the same connection.
+    METADATA_TOOLS = {
+        "list_databases", "list_tables", "describe_table", "get_schema", "explain_query", "connection_status",
+    }
+
+    # Run on the manager's control executor, never behind queued or running work.
+    CONTROL_TOOLS = {"cancel_query", "close_cursor"}
+
+    # Admit through the rate limiter; their delays are served before they take a scheduler slot.
+    RATE_LIMITED_TOOLS = {
+        "execute_query", "execute_statement", "delete_statement", "drop_statement", "bulk_insert", "export_query",
+    }
+
     def __init__(self, server: FastMCP = None):
         self.server = server
 
@@ -25,35 +47,76 @@ class ToolsManager:
             "get_schema":        get_schema,
             "delete_statement":  delete_statement,
             "drop_statement":    drop_statement,
+            "fetch_cursor":      fetch_cursor,
+            "close_cursor":      close_cursor,
+            "bulk_insert":       bulk_insert,
+            "execute_batch":     execute_batch,
+            "cancel_query":      cancel_query,
+            "connection_status": connection_status,
+            "export_query":      export_query,
+            "explain_query":     explain_query,
+        }
+
+        self.async_tools = {
+            name: make_async_tool(
+                fn,
+                lane         = "metadata" if name in self.METADATA_TOOLS else "query",
+                control      = name in self.CONTROL_TOOLS,
+                rate_limited = name in self.RATE_LIMITED_TOOLS,
+            )
+            for name, fn in self.tools.items()
         }
 
     def populate_tools(self):
-        """Register all tools on the FastMCP server."""
+        """Register the async variants of all tools on the FastMCP server."""
 
         if self.server is None:
 
             return
 
         self.server.add_tool(
-            self.tools["execute_query"],
+            self.async_tools["execute_query"],
             "execute_query",
             "Execute Query",
             "Execute a read-only SELECT query against a named connection. "
             "Returns structured JSON with column metadata, rows, row count, and timing. "
-            "Params: connection_name (str), sql (str), database (str, optional).",
+            "At most max_rows rows are returned; if more remain, the result carries a next_cursor "
+            "token for fetch_cursor. result_format selects the payload shape: 'rows' (objects, default), "
+            "'compact' (value arrays, column names once), 'columnar' (one array per column) or 'arrow' "
+            "(base64 Arrow IPC stream in data, with native column types; best for large numeric results). "
+            "If the connection enables result_cache, repeated SELECTs may be served from cache "
+            "(cached=true, cache_age_seconds). "
+            "Pass literal values through params and use ? placeholders in sql so the server can reuse "
+            "the prepared plan. "
+            "timeout_seconds aborts the query once exceeded (capped by the connection's query_timeout_seconds); "
+            "pass your own request_id to be able to stop it early with cancel_query. "
+            "If the connection enables preflight, the estimated plan is checked first: queries over its "
+            "row or cost limits are refused (SqlPreflightError) or paged, and the estimate is returned in preflight. "
+            "If the plan cannot be read, the query runs unchecked and preflight.verdict is 'unavailable'. "
+            "Calls beyond the connection's max_in_flight wait in a bounded queue behind metadata calls; "
+            "queue reports the wait_ms and queue_depth, and a full queue or wait timeout returns SqlSchedulerError. "
+            "Connections with rate_limits may delay a call (noted in message) or reject it with SqlRateLimitError, "
+            "whose message says which limit was hit and when to retry. "
+            "Params: connection_name (str), sql (str), database (str, optional), max_rows (int, optional), "
+            "result_format (str, optional), params (list, optional), timeout_seconds (float, optional), "
+            "request_id (str, optional).",
         )
 
         self.server.add_tool(
-            self.tools["execute_statement"],
+            self.async_tools["execute_statement"],
             "execute_statement",
             "Execute Statement",
             "Execute a write statement (INSERT, UPDATE, CREATE, ALTER, MERGE). "
             "DELETE and DROP are explicitly blocked — use the dedicated tools. "
-            "Params: connection_name (str), sql (str), database (str, optional).",
+            "result_format accepts 'rows', 'compact', 'columnar' or 'arrow' as in execute_query. "
+            "params binds values to ? placeholders in sql. "
+            "timeout_seconds and request_id work as in execute_query. "
+            "Params: connection_name (str), sql (str), database (str, optional), result_format (str, optional), "
+            "params (list, optional), timeout_seconds (float, optional), request_id (str, optional).",
         )
 
         self.server.add_tool(
-            self.tools["list_databases"],
+            self.async_tools["list_databases"],
             "list_databases",
             "List Databases",
             "List all databases on a connection, filtered to the configured allowlist. "
@@ -61,7 +124,7 @@ class ToolsManager:
         )
 
         self.server.add_tool(
-            self.tools["list_tables"],
+            self.async_tools["list_tables"],
             "list_tables",
             "List Tables",
             "List tables in a database, optionally filtered by schema. "
@@ -70,7 +133,7 @@ class ToolsManager:
         )
 
         self.server.add_tool(
-            self.tools["describe_table"],
+            self.async_tools["describe_table"],
             "describe_table",
             "Describe Table",
             "Return column-level metadata for a table: name, type, nullable, max_length, default, position. "
@@ -78,28 +141,126 @@ class ToolsManager:
         )
 
         self.server.add_tool(
-            self.tools["get_schema"],
+            self.async_tools["get_schema"],
             "get_schema",
             "Get Schema",
-            "Full schema introspection: returns all tables and their columns for a database/schema. "
+            "Full schema introspection: returns all tables with their columns, primary key and indexes "
+            "for a database/schema, fetched in bulk. "
             "Can be large for big databases — prefer describe_table for targeted lookups. "
             "Params: connection_name (str), database (str), schema (str, optional).",
         )
 
         self.server.add_tool(
-            self.tools["delete_statement"],
+            self.async_tools["delete_statement"],
             "delete_statement",
             "Delete Statement",
             "Execute a DELETE statement. GATED: requires explicit permission. "
             "Enforces WHERE clause — bare DELETE is rejected. "
-            "Params: connection_name (str), sql (str), database (str, optional).",
+            "params binds values to ? placeholders in sql; timeout_seconds and request_id work as in execute_query. "
+            "Params: connection_name (str), sql (str), database (str, optional), params (list, optional), "
+            "timeout_seconds (float, optional), request_id (str, optional).",
         )
 
         self.server.add_tool(
-            self.tools["drop_statement"],
+            self.async_tools["drop_statement"],
             "drop_statement",
             "Drop Statement",
             "Execute a DROP statement. GATED: requires explicit permission. "
             "Use with extreme caution — this is irreversible. "
-            "Params: connection_name (str), sql (str), database (str, optional).",
+            "Params: connection_name (str), sql (str), database (str, optional), "
+            "timeout_seconds (float, optional), request_id (str, optional).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["fetch_cursor"],
+            "fetch_cursor",
+            "Fetch Cursor",
+            "Fetch the next page of a paginated execute_query result using its next_cursor token. "
+            "Cursors expire after a period of inactivity. "
+            "Page reads are not covered by the original timeout_seconds and cannot be stopped with cancel_query. "
+            "Params: cursor (str), max_rows (int, optional — defaults to the original page size), "
+            "result_format (str, optional — defaults to the original format).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["close_cursor"],
+            "close_cursor",
+            "Close Cursor",
+            "Close a paginated result early and release its server-side cursor. "
+            "Params: cursor (str).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["bulk_insert"],
+            "bulk_insert",
+            "Bulk Insert",
+            "Load many rows into one table, committing every batch_size rows. Rows come either inline "
+            "(columns plus an array of value arrays) or from a .csv (header row names the columns, empty "
+            "fields are NULL) or .jsonl file inside the configured import directory. "
+            "Uses fast_executemany on SQL Server and multi-row INSERTs on MySQL. "
+            "Params: connection_name (str), table (str), columns (list, optional for files), "
+            "rows (list, optional), file_path (str, optional), database (str, optional), "
+            "schema (str, optional), batch_size (int, optional).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["execute_batch"],
+            "execute_batch",
+            "Execute Batch",
+            "Run many independent read-only SELECTs in one call. Every item is validated first; if any "
+            "is invalid nothing runs. Items then execute concurrently (up to max_parallelism, capped by "
+            "config) across pooled connections, fanning out across servers, and results come back in "
+            "item order with per-item timing. "
+            "Items count against execute_query's per-tool rate limits. "
+            "Params: items (list of {connection_name, sql, database?, params?, max_rows?, timeout_seconds?, "
+            "request_id?}), max_parallelism (int, optional), max_rows (int, optional default for items), "
+            "result_format (str, optional), timeout_seconds (float, optional default for items).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["cancel_query"],
+            "cancel_query",
+            "Cancel Query",
+            "Abort an in-flight statement by the request_id passed to execute_query, execute_statement, "
+            "delete_statement, drop_statement or an execute_batch item. The cancelled call returns "
+            "SqlQueryCancelledError and its transaction is rolled back. Also lists statements still running. "
+            "Pages read later through fetch_cursor are not tracked; use close_cursor to release them. "
+            "Params: request_id (str).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["connection_status"],
+            "connection_status",
+            "Connection Status",
+            "Report the health of configured connections: a live ping (unless ping=false), the last error, "
+            "consecutive failures, reconnect count, pool occupancy, scheduler queue depths and wait times, "
+            "and statements still running. "
+            "Dead pooled connections are replaced automatically; use this to check a server after a "
+            "restart or failover. "
+            "Params: connection_name (str, optional; default all), ping (bool, optional).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["export_query"],
+            "export_query",
+            "Export Query",
+            "Run a read-only SELECT and stream its full result set to a file in the configured export "
+            "directory instead of returning rows. Use this for results beyond a few thousand rows. "
+            "Returns only the path, row count, byte size and column schema. file_format is 'csv', 'jsonl', "
+            "'parquet' or 'arrow' (Arrow IPC); parquet and arrow need pyarrow and keep native column types. "
+            "It defaults from the file extension, and an extension that contradicts it is rejected. "
+            "Params: connection_name (str), sql (str), file_path (str, relative to the export directory), "
+            "file_format (str, optional), database (str, optional), params (list, optional), "
+            "overwrite (bool, optional), timeout_seconds (float, optional), request_id (str, optional).",
+        )
+
+        self.server.add_tool(
+            self.async_tools["explain_query"],
+            "explain_query",
+            "Explain Query",
+            "Estimate a read-only SELECT without running it, from the server's plan (SHOWPLAN_XML on SQL Server, "
+            "EXPLAIN FORMAT=JSON on MySQL). Returns estimated rows and cost, the plan operators, any full scans, "
+            "and the verdict the connection's pre-flight limits would give: 'run', 'paginate' or 'refuse'. "
+            "Call it before a query that might touch large tables. "
+            "Params: connection_name (str), sql (str), database (str, optional), params (list, optional).",
         )
@@ -0,0 +1,83 @@
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from mcp_server.context import get_connection_manager, get_allowlist, get_query_validator, get_warmup_config
+from mcp_server.tools.tool_list_databases import list_databases
+from mcp_server.tools.tool_list_tables import list_tables
+
+
+def warm_up() -> None:
+    """Open configured pools (and optionally prefetch metadata) before the server accepts requests."""
+
+    # stdout carries the MCP protocol, so progress goes to stderr. A failed warm-up
+    # never stops the server; the first tool call will just pay the cost instead.
+    try:
+        config = get_warmup_config()
+    except Exception as e:
+        _log(f"skipped: {type(e).__name__}: {e}")
+
+        return
+
+    if not config.enabled:
+
+        return
+
+    start   = time.perf_counter()
+    manager = get_connection_manager()
+    names   = config.connections or [c["name"] for c in manager.list_connections()]
+
+    get_allowlist()
+    get_query_validator()
+
+    if not names:
+
+        return
+
+    executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="warmup")
+    futures  = {executor.submit(_warm_connection, name, config.prefetch_metadata): name for name in names}
+    done, pending = wait(futures, timeout=config.timeout_seconds or None)
+    executor.shutdown(wait=False)
+
+    for future in done:
+        _log(future.result())
+
+    for future in pending:
+        _log(f"{futures[future]}: still warming after {config.timeout_seconds:g}s, continuing in the background")
+
+    _log(f"finished in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+def _warm_connection(name: str, prefetch_metadata: bool) -> str:
+    """Fill one pool and prefetch its catalog. Returns a one-line report."""
+
+    try:
+        adapter = get_connection_manager().get_adapter(name)
+        start   = time.perf_counter()
+        adapter.connect(parallel=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        report  = f"{name}: {adapter.pool_stats()['size']} connection(s) in {elapsed:.1f} ms"
+
+    except Exception as e:
+
+        return f"{name}: failed: {type(e).__name__}: {e}"
+
+    if prefetch_metadata:
+        start   = time.perf_counter()
+        loaded  = [json.loads(list_databases(name))]
+
+        if adapter.config.database:
+            loaded.append(json.loads(list_tables(name, adapter.config.database)))
+
+        failed  = [r["message"] for r in loaded if not r["success"]]
+        report += f", metadata in {(time.perf_counter() - start) * 1000:.1f} ms"
+
+        if failed:
+            report += f" ({'; '.join(failed)})"
+
+    return report
+
+
+def _log(message: str) -> None:
+    print(f"[warmup] {message}", file=sys.stderr, flush=True)
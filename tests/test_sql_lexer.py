@@ -0,0 +1,55 @@
+"""The lexer fast path must never classify a statement more leniently than sqlparse."""
+
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from bench_statement_detection import CORPUS, _sqlparse_path   # noqa: E402
+from mcp_server._errors.query_validation_error import QueryValidationError   # noqa: E402
+from mcp_server.security import sql_lexer   # noqa: E402
+from mcp_server.security.query_validator import QueryValidator   # noqa: E402
+
+# Joined pairwise below, so separators and statements meet in every order.
+FRAGMENTS = [
+    "SELECT 1", "DROP TABLE x", "\nGO\n", "\ngo 2\n", ";", " -- note\n", "/* c */",
+    " BEGIN ", " DECLARE @n INT ", "SELECT 'é'", "SELECT é", "selecté 1", "[GO]", "[a]];GO]", "[]",
+]
+
+CASES = CORPUS + ["".join(pair) for pair in itertools.product(FRAGMENTS, repeat=2)]
+
+
+@pytest.mark.parametrize("sql", CASES)
+def test_fast_path_agrees_with_sqlparse(sql):
+    fast = sql_lexer.classify(sql)
+
+    if fast is None:
+
+        return
+
+    expected = _sqlparse_path(QueryValidator(), sql)
+
+    if expected[1] != "ERROR":
+        assert fast == expected
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT 1\nGO\nDROP TABLE x",
+    "SELECT 1\nGO 2\nDELETE FROM t",
+    "SELECT 1 GO DROP TABLE x",
+])
+def test_go_batches_are_rejected(sql):
+    assert sql_lexer.classify(sql) is None
+
+    with pytest.raises(QueryValidationError):
+        QueryValidator().validate_no_multi_statement(sql)
+
+
+@pytest.mark.parametrize("sql", ["selecté 1", "SELECT naïve FROM t"])
+def test_non_ascii_identifiers_defer_to_sqlparse(sql):
+    assert sql_lexer.classify(sql) is None